@@ -2,6 +2,7 @@
 ASGI config for backend_join project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+HTTP requests are served by Django; WebSocket connections to /ws/events/ receive change events.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
@@ -10,7 +11,8 @@ https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
 import os
 
 from django.core.asgi import get_asgi_application
+from backend_join.realtime import with_websocket_events
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend_join.settings')
 
-application = get_asgi_application()
+application = with_websocket_events(get_asgi_application())
@@ -0,0 +1,42 @@
+"""
+Conditional GET support (ETag / Last-Modified) shared by the list and detail endpoints.
+"""
+
+import hashlib
+from functools import wraps
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+def conditional_get(version_method):
+    """
+    Decorate a viewset method so GET requests are answered with 304 Not Modified before serializing.
+
+    version_method names a view method returning (version, last_modified) for the request,
+    or None to skip the check (e.g. for a missing object, so the view can return its 404).
+    The ETag hashes the version together with the full path and the negotiated format.
+    """
+
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, request, *args, **kwargs):
+            state = getattr(self, version_method)(request, *args, **kwargs)
+            if state is None:
+                return method(self, request, *args, **kwargs)
+            version, last_modified = state
+            renderer = getattr(request, "accepted_renderer", None)
+            source = f"{version}|{request.get_full_path()}|{getattr(renderer, 'format', '')}"
+            etag = f'"{hashlib.sha256(source.encode()).hexdigest()[:32]}"'
+            timestamp = int(last_modified.timestamp()) if last_modified else None
+            response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+            if response is None:
+                response = method(self, request, *args, **kwargs)
+            if response.status_code in (200, 304):
+                response["ETag"] = etag
+                if timestamp is not None:
+                    response["Last-Modified"] = http_date(timestamp)
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,193 @@
+"""
+Change events for real-time clients: a pluggable broker and per-transaction publishing.
+
+Model writes queue small events such as {"type": "task", "action": "changed", "id": "..."}. The queued
+events of a transaction are published as one batch when it commits, so rolled back writes are never seen,
+and a failing broker is logged instead of failing the already committed request.
+Events of guest sandboxes carry a "sandbox" key and are only forwarded to clients of that sandbox.
+The broker class is set by the EVENT_BROKER setting. The default InMemoryBroker only reaches clients
+connected to the same process; deployments with several workers plug in a broker backed by a shared
+pub/sub service implementing the EventBroker interface.
+"""
+
+import asyncio
+import threading
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+DEFAULT_EVENT_BROKER = "backend_join.events.InMemoryBroker"
+SUBSCRIBER_QUEUE_SIZE = 100
+MAX_EVENT_BATCH = 500
+RESYNC_EVENTS = [{"type": "resync"}]
+
+_pending = threading.local()
+_broker = None
+_broker_lock = threading.Lock()
+
+
+class EventBroker:
+    """
+    Interface of event brokers: publish() is called from any thread, subscribe() from a running event loop.
+    """
+
+    def publish(self, events):
+        """
+        Deliver a batch of events to all subscribers.
+        """
+        raise NotImplementedError
+
+    def subscribe(self):
+        """
+        Return a new Subscription for the running event loop.
+        """
+        raise NotImplementedError
+
+
+class Subscription:
+    """
+    Bounded queue of event batches for one client. A client that falls behind gets a single resync batch
+    instead of the dropped events, telling it to reload.
+    """
+
+    def __init__(self, broker, loop=None):
+        self.broker = broker
+        self.loop = loop or asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self.overflowed = False
+
+    def deliver(self, events):
+        """
+        Queue a batch of events; runs on the subscription's event loop.
+        """
+        try:
+            self.queue.put_nowait(events)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    async def get(self):
+        """
+        Wait for and return the next batch of events.
+        """
+        if self.overflowed:
+            self.overflowed = False
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            return RESYNC_EVENTS
+        return await self.queue.get()
+
+    def close(self):
+        """
+        Stop receiving events.
+        """
+        self.broker.unsubscribe(self)
+
+
+class InMemoryBroker(EventBroker):
+    """
+    Broker delivering events to the subscribers of the current process.
+    """
+
+    def __init__(self):
+        self.subscriptions = set()
+        self.lock = threading.Lock()
+
+    def publish(self, events):
+        with self.lock:
+            subscriptions = list(self.subscriptions)
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, events)
+            except RuntimeError:
+                self.unsubscribe(subscription)
+
+    def subscribe(self):
+        subscription = Subscription(self)
+        with self.lock:
+            self.subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """
+        Remove a subscription; unknown subscriptions are ignored.
+        """
+        with self.lock:
+            self.subscriptions.discard(subscription)
+
+
+def get_broker():
+    """
+    Return the process-wide broker configured by the EVENT_BROKER setting.
+    """
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = import_string(getattr(settings, "EVENT_BROKER", DEFAULT_EVENT_BROKER))()
+    return _broker
+
+
+class _EventBatch:
+    """
+    Events queued in one transaction, published by the on_commit callback registered for the batch.
+    """
+
+    def __init__(self):
+        self.events = {}
+        self.published = False
+
+    def publish(self):
+        """
+        Publish the batch; batches of bulk writes larger than MAX_EVENT_BATCH become one resync event per scope.
+        """
+        self.published = True
+        if not self.events:
+            return
+        if len(self.events) <= MAX_EVENT_BATCH:
+            get_broker().publish(list(self.events.values()))
+        elif any("sandbox" not in event for event in self.events.values()):
+            get_broker().publish(RESYNC_EVENTS)
+        else:
+            sandboxes = dict.fromkeys(event["sandbox"] for event in self.events.values())
+            get_broker().publish([{"type": "resync", "sandbox": sandbox} for sandbox in sandboxes])
+
+
+def _is_pending(batch):
+    """
+    Return True if the batch will still be published by the current transaction, i.e. it was not published
+    yet and its callback was not discarded by a rollback.
+    """
+    if batch is None or batch.published:
+        return False
+    return any(func == batch.publish for _, func, _ in transaction.get_connection().run_on_commit)
+
+
+def event_scope(sandbox_id):
+    """
+    Return the extra event data scoping an event to a guest sandbox, or nothing for shared objects.
+    """
+    return {"sandbox": str(sandbox_id)} if sandbox_id else {}
+
+
+def queue_events(events):
+    """
+    Queue change events to be published as one batch when the current transaction commits
+    (immediately in autocommit mode). Later events for the same object replace earlier ones.
+    """
+    batch = getattr(_pending, "batch", None)
+    pending = _is_pending(batch)
+    if not pending:
+        batch = _pending.batch = _EventBatch()
+    for event in events:
+        key = (event["type"], event["id"])
+        batch.events.pop(key, None)
+        batch.events[key] = event
+    if not pending:
+        transaction.on_commit(batch.publish, robust=True)
+
+
+def queue_event(event_type, action, object_id, **data):
+    """
+    Queue a single change event, see queue_events().
+    """
+    queue_events([{"type": event_type, "action": action, "id": str(object_id), **data}])
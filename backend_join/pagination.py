@@ -0,0 +1,156 @@
+"""
+Opt-in keyset (cursor) pagination shared by the list endpoints.
+"""
+
+import base64
+import binascii
+import json
+import operator
+from functools import reduce
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset pagination over a fixed ordering whose last field is unique.
+
+    Pagination only applies if the request carries a cursor or page_size query parameter,
+    so clients that expect a plain list keep receiving one. Pages are selected by comparing
+    against the ordering values of the last row seen instead of an offset, so rows inserted
+    or deleted concurrently never cause duplicates or gaps between pages.
+    """
+
+    ordering = ("pk",)
+    page_size = 50
+    max_page_size = 500
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Return one page of rows after (or before) the cursor position, or None if pagination was not requested.
+        """
+        params = request.query_params
+        if self.cursor_query_param not in params and self.page_size_query_param not in params:
+            return None
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        position, reverse = self.decode_cursor(request, queryset.model)
+
+        ordering = self._reversed_ordering() if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self._after_position_filter(ordering, position))
+
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+        self.page = rows
+        return rows
+
+    def get_paginated_response(self, data):
+        """
+        Wrap the page in an envelope with next/previous cursor links.
+        """
+        return Response({"next": self.get_next_link(), "previous": self.get_previous_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        """
+        Return the requested page size, clamped to max_page_size, or the default page size.
+        """
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(size, self.max_page_size) if size > 0 else self.page_size
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self._position(self.page[-1]), reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self._position(self.page[0]), reverse=True)
+
+    def decode_cursor(self, request, model):
+        """
+        Decode the cursor query parameter into (position, reverse); position is None on the first page.
+        The position values are converted with the model's ordering fields, so a tampered cursor is a 404.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            position, reverse = cursor["p"], bool(cursor.get("r", False))
+        except (TypeError, ValueError, KeyError, UnicodeEncodeError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        try:
+            position = [
+                self._ordering_field(model, name).to_python(value) for name, value in zip(self.ordering, position)
+            ]
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def encode_cursor(self, position, reverse):
+        """
+        Build the absolute URL for a page starting after the given position.
+        """
+        payload = json.dumps({"p": position, "r": reverse} if reverse else {"p": position}, separators=(",", ":"))
+        encoded = base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+        url = replace_query_param(self.request.build_absolute_uri(), self.page_size_query_param, self.page_size)
+        return replace_query_param(url, self.cursor_query_param, encoded)
+
+    def _position(self, row):
+        """
+        Return the ordering values of a row as JSON-serializable strings.
+        """
+        return [str(getattr(row, field.lstrip("-"))) for field in self.ordering]
+
+    def _ordering_field(self, model, name):
+        """
+        Return the model field of an ordering entry such as "-date" or "pk".
+        """
+        name = name.lstrip("-")
+        return model._meta.pk if name == "pk" else model._meta.get_field(name)
+
+    def _reversed_ordering(self):
+        return tuple(field[1:] if field.startswith("-") else f"-{field}" for field in self.ordering)
+
+    def _after_position_filter(self, ordering, position):
+        """
+        Build the keyset condition selecting rows strictly after position in the given ordering.
+        """
+        conditions = []
+        for index, field in enumerate(ordering):
+            lookup = "lt" if field.startswith("-") else "gt"
+            equal_prefix = {ordering[i].lstrip("-"): position[i] for i in range(index)}
+            conditions.append(Q(**equal_prefix, **{f"{field.lstrip('-')}__{lookup}": position[index]}))
+        return reduce(operator.or_, conditions)
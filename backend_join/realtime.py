@@ -0,0 +1,105 @@
+"""
+ASGI WebSocket endpoint pushing change events to connected clients.
+
+Clients connect to ws(s)://<host>/ws/events/?token=<auth token> and receive one JSON message per
+committed transaction: {"events": [{"type": "task", "action": "changed", "id": "..."}, ...]}.
+A {"type": "resync"} event means events were dropped and the client should reload its data.
+Guests only receive the events of their own sandbox; everyone else receives the events of shared objects.
+"""
+
+import asyncio
+import json
+from urllib.parse import parse_qs
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+from backend_join.events import get_broker
+
+EVENTS_PATH = "/ws/events/"
+CLOSE_UNAUTHORIZED = 4401
+CLOSE_NOT_FOUND = 4404
+
+
+@sync_to_async
+def authenticate_token(key):
+    """
+    Return the active user owning the token key (with its guest sandbox loaded), or None.
+    """
+    from rest_framework.authtoken.models import Token
+
+    close_old_connections()
+    try:
+        token = Token.objects.select_related("user", "user__guest_sandbox").get(key=key)
+    except Token.DoesNotExist:
+        return None
+    finally:
+        close_old_connections()
+    return token.user if token.user.is_active else None
+
+
+async def websocket_events(scope, receive, send):
+    """
+    Accept an authenticated WebSocket connection and forward event batches until the client disconnects.
+    """
+    message = await receive()
+    if message["type"] != "websocket.connect":
+        return
+    if scope["path"] != EVENTS_PATH:
+        await send({"type": "websocket.close", "code": CLOSE_NOT_FOUND})
+        return
+    from user_auth_app.sandbox import get_user_sandbox_id
+
+    key = parse_qs(scope.get("query_string", b"").decode()).get("token", [""])[0]
+    user = await authenticate_token(key) if key else None
+    if user is None:
+        await send({"type": "websocket.close", "code": CLOSE_UNAUTHORIZED})
+        return
+    sandbox_id = get_user_sandbox_id(user)
+
+    subscription = get_broker().subscribe()
+    await send({"type": "websocket.accept"})
+    try:
+        disconnected = asyncio.ensure_future(_wait_for_disconnect(receive))
+        while True:
+            next_batch = asyncio.ensure_future(subscription.get())
+            done, _ = await asyncio.wait({disconnected, next_batch}, return_when=asyncio.FIRST_COMPLETED)
+            if disconnected in done:
+                next_batch.cancel()
+                return
+            events = events_for_sandbox(next_batch.result(), sandbox_id)
+            if events:
+                await send({"type": "websocket.send", "text": json.dumps({"events": events})})
+    finally:
+        subscription.close()
+
+
+def events_for_sandbox(events, sandbox_id):
+    """
+    Return the events visible to clients of the sandbox (None for shared objects); unscoped resyncs reach everyone.
+    """
+    scope = str(sandbox_id) if sandbox_id else None
+    return [
+        event
+        for event in events
+        if event.get("sandbox") == scope or (event["type"] == "resync" and "sandbox" not in event)
+    ]
+
+
+async def _wait_for_disconnect(receive):
+    """
+    Consume client messages (which are ignored) until the connection closes.
+    """
+    while (await receive())["type"] != "websocket.disconnect":
+        pass
+
+
+def with_websocket_events(http_application):
+    """
+    Wrap the Django ASGI application so WebSocket connections are served by websocket_events.
+    """
+
+    async def application(scope, receive, send):
+        if scope["type"] == "websocket":
+            return await websocket_events(scope, receive, send)
+        return await http_application(scope, receive, send)
+
+    return application
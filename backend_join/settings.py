@@ -158,9 +158,33 @@ MEDIA_ROOT = os.path.join(BASE_DIR, "mediafiles")
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Broker for real-time change events (see backend_join/events.py); the in-memory default serves a single process.
+EVENT_BROKER = env("EVENT_BROKER", default="backend_join.events.InMemoryBroker")
+
+# Delta sync cursors stop before a missing TaskChange seq newer than this many seconds, as its transaction may
+# still commit (see tasks_app/utils.py); keep it above the longest transaction that writes tasks.
+TASK_CHANGE_COMMIT_LAG = env.int("TASK_CHANGE_COMMIT_LAG", default=10)
+
+# In-process token authentication cache (see user_auth_app/api/authentication.py); a TTL of 0 disables it.
+TOKEN_AUTH_CACHE_TTL = env.int("TOKEN_AUTH_CACHE_TTL", default=60)
+TOKEN_AUTH_CACHE_SIZE = env.int("TOKEN_AUTH_CACHE_SIZE", default=10000)
+# Lifetime in seconds of the signed "Bearer" access tokens handed out with the DB token; 0 disables them.
+ACCESS_TOKEN_TTL = env.int("ACCESS_TOKEN_TTL", default=300)
+# Guest logins get a private copy of the demo board for this many seconds (see user_auth_app/sandbox.py);
+# 0 serves all guests the shared guest account instead. Expired sandboxes are swept in the background at most
+# once per GUEST_SANDBOX_SWEEP_INTERVAL seconds (0 disables it; use the sweep_guest_sandboxes command instead).
+GUEST_SANDBOX_TTL = env.int("GUEST_SANDBOX_TTL", default=4 * 60 * 60)
+GUEST_SANDBOX_SWEEP_INTERVAL = env.int("GUEST_SANDBOX_SWEEP_INTERVAL", default=5 * 60)
+# With GUEST_SANDBOX_TTL=0, each process caches the shared guest identity for this many seconds (see
+# user_auth_app/guest.py), so changes by other processes are picked up; 0 disables the cache.
+GUEST_IDENTITY_CACHE_TTL = env.int("GUEST_IDENTITY_CACHE_TTL", default=60)
+# Guest sandbox logins allowed per client IP, e.g. "20/hour" (see user_auth_app/api/throttling.py); empty disables it.
+GUEST_LOGIN_RATE = env("GUEST_LOGIN_RATE", default="20/hour") or None
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.TokenAuthentication",
+        "user_auth_app.api.authentication.CachedTokenAuthentication",
+        "user_auth_app.api.authentication.SignedAccessTokenAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
@@ -0,0 +1,3 @@
+"""
+Standalone performance benchmarks, run against a throw-away test database.
+"""
@@ -0,0 +1,68 @@
+"""
+Benchmark the full task list against the compact board projection: response time and payload size.
+
+Usage:
+    python -m benchmarks.bench_board [task_count]
+"""
+
+import sys
+
+from benchmarks.common import setup_django, report
+
+
+def seed_board(count):
+    """
+    Create contacts and tasks with three assignees and four subtasks each, using bulk inserts.
+    """
+    import datetime
+    from contacts_app.models import Contact
+    from tasks_app.models import Task, Subtask
+
+    contacts = [Contact.objects.create(name=f"Contact {i}", email=f"contact{i}@example.com") for i in range(20)]
+    tasks = Task.objects.bulk_create(
+        Task(
+            title=f"Task {i}",
+            description="Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 4,
+            category="User Story",
+            date=datetime.date.today(),
+            prio="medium",
+            status="toDo",
+        )
+        for i in range(count)
+    )
+    Subtask.objects.bulk_create(
+        Subtask(task=task, text=f"Subtask {j} of {task.title}", status="checked" if j % 2 else "unchecked")
+        for task in tasks
+        for j in range(4)
+    )
+    through = Task.assigned_to.through
+    through.objects.bulk_create(
+        through(task_id=task.id, contact_id=contacts[(i + j) % len(contacts)].id)
+        for i, task in enumerate(tasks)
+        for j in range(3)
+    )
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    setup_django()
+
+    from django.contrib.auth.models import User
+    from rest_framework.test import APIClient
+
+    seed_board(count)
+    user = User.objects.create_user(username="bench", email="bench@example.com", password="Bench@1234")
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    print(f"Board benchmark with {count} tasks")
+    for label, url in [
+        ("full list GET /api/tasks/", "/api/tasks/"),
+        ("board GET /api/tasks/board/", "/api/tasks/board/"),
+    ]:
+        size = len(client.get(url).content)
+        report(f"{label} ({size / 1024:.0f} KiB)", lambda: client.get(url), repeat=5)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark importing tasks one request per task versus a single request to the bulk endpoint.
+
+Usage:
+    python -m benchmarks.bench_bulk_tasks [task_count]
+"""
+
+import sys
+import time
+
+from benchmarks.common import setup_django
+
+
+def build_payload(count, contact_ids):
+    """
+    Return task payloads with two subtasks and two assigned contacts each.
+    """
+    return [
+        {
+            "title": f"Imported task {i}",
+            "description": "Imported by benchmark",
+            "category": "Technical Task",
+            "date": "2025-04-02",
+            "prio": ["low", "medium", "urgent"][i % 3],
+            "status": "toDo",
+            "assigned_to": [{"id": str(contact_id)} for contact_id in contact_ids[i % 4 : i % 4 + 2]],
+            "subtasks": [{"text": f"Step {j}", "status": "unchecked"} for j in range(2)],
+        }
+        for i in range(count)
+    ]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    setup_django()
+
+    from django.contrib.auth.models import User
+    from rest_framework.test import APIClient
+    from contacts_app.models import Contact
+    from tasks_app.models import Task
+
+    user = User.objects.create_user(username="bench", email="bench@example.com", password="Bench@1234")
+    client = APIClient()
+    client.force_authenticate(user=user)
+    contact_ids = [Contact.objects.create(name=f"Contact {i}", email=f"c{i}@example.com").id for i in range(6)]
+    payload = build_payload(count, contact_ids)
+
+    start = time.perf_counter()
+    for item in payload:
+        client.post("/api/tasks/", item, format="json")
+    single = time.perf_counter() - start
+    Task.objects.all().delete()
+
+    start = time.perf_counter()
+    client.post("/api/tasks/bulk/", payload, format="json")
+    bulk = time.perf_counter() - start
+
+    print(f"Importing {count} tasks")
+    print(f"{'one POST per task':<40} {single:8.2f} s   {count / single:9.0f} tasks/s")
+    print(f"{'single bulk POST':<40} {bulk:8.2f} s   {count / bulk:9.0f} tasks/s")
+
+
+if __name__ == "__main__":
+    main()
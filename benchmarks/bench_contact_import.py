@@ -0,0 +1,41 @@
+"""
+Benchmark contact import: Contact.objects.create per row against the chunked bulk importer.
+
+Usage:
+    python -m benchmarks.bench_contact_import [contact_count]
+"""
+
+import sys
+
+from benchmarks.common import setup_django, report
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    setup_django()
+
+    from contacts_app.models import Contact
+    from contacts_app.importer import import_contacts
+
+    runs = iter(range(1000))
+
+    def rows():
+        run = next(runs)
+        return [
+            (i, {"name": f"Contact {run} {i}", "email": f"contact{run}-{i}@example.com"}, None) for i in range(count)
+        ]
+
+    def per_row():
+        for _, row, _ in rows():
+            Contact.objects.create(**row)
+
+    def bulk():
+        import_contacts(rows())
+
+    print(f"Contact import benchmark with {count} rows")
+    report("Contact.objects.create per row", per_row, repeat=3)
+    report("import_contacts (chunked bulk_create)", bulk, repeat=3)
+
+
+if __name__ == "__main__":
+    main()
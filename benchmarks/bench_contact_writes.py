@@ -0,0 +1,42 @@
+"""
+Benchmark contact writes: queries and time to create and rename contacts one by one, as an import would.
+
+Usage:
+    python -m benchmarks.bench_contact_writes [contact_count]
+"""
+
+import sys
+
+from benchmarks.common import setup_django, count_queries, timeit
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    setup_django()
+
+    from contacts_app.models import Contact
+
+    runs = iter(range(1000))
+
+    def create_contacts():
+        run = next(runs)
+        for i in range(count):
+            Contact.objects.create(name=f"Contact {run} {i}", email=f"contact{run}-{i}@example.com")
+
+    def rename_contacts():
+        run = next(runs)
+        for contact in list(Contact.objects.all()[:count]):
+            contact.name = f"Renamed {run} {contact.pk.hex[:6]}"
+            contact.save()
+
+    print(f"Contact write benchmark with {count} contacts")
+    for label, func in [("create", create_contacts), ("rename", rename_contacts)]:
+        queries = count_queries(func)
+        best, mean = timeit(func, repeat=3)
+        print(
+            f"{label:<10} best {best:9.2f} ms   mean {mean:9.2f} ms   queries {queries} ({queries / count:.2f} per contact)"
+        )
+
+
+if __name__ == "__main__":
+    main()
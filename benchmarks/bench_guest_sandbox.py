@@ -0,0 +1,52 @@
+"""
+Benchmark guest sandboxes: queries and time per guest login (user, token, and cloned demo board),
+and the time to sweep the expired sandboxes again.
+
+Usage:
+    python -m benchmarks.bench_guest_sandbox [sandbox_count]
+"""
+
+import datetime
+import sys
+import time
+
+from benchmarks.common import setup_django, count_queries, report
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    setup_django()
+
+    from django.conf import settings
+    from django.utils import timezone
+    from rest_framework.test import APIRequestFactory
+    from tasks_app.models import Task
+    from user_auth_app.api.views import GuestUserView
+    from user_auth_app.sandbox import sweep_expired_sandboxes
+
+    settings.GUEST_SANDBOX_SWEEP_INTERVAL = 0
+    factory = APIRequestFactory()
+    view = GuestUserView.as_view()
+    swept = []
+
+    def login():
+        return view(factory.post("/auth/guest/", {}, format="json"))
+
+    print(f"Guest sandbox benchmark with {count} guest logins")
+    report("guest login (sandbox clone)", login, repeat=20)
+    started = time.perf_counter()
+    for _ in range(count):
+        login()
+    elapsed = time.perf_counter() - started
+    print(f"{'guest logins':<40} {count / elapsed:9.0f} logins/s   tasks {Task.objects.count()}")
+
+    later = timezone.now() + datetime.timedelta(seconds=settings.GUEST_SANDBOX_TTL + 1)
+    started = time.perf_counter()
+    queries = count_queries(lambda: swept.append(sweep_expired_sandboxes(now=later)))
+    elapsed = time.perf_counter() - started
+    print(f"{'sweep expired sandboxes':<40} {swept[0]} sandboxes in {elapsed * 1000:9.2f} ms   queries {queries}")
+    print(f"{'tasks left':<40} {Task.objects.count()}")
+
+
+if __name__ == "__main__":
+    main()
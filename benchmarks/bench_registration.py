@@ -0,0 +1,79 @@
+"""
+Benchmark user registration in registrations/sec: the previous flow (email lookup, Token get_or_create,
+contact re-read) vs. UserRegistrationView. Passwords use the MD5 hasher so the numbers
+show the database work instead of PBKDF2.
+
+Usage:
+    python -m benchmarks.bench_registration [registration_count]
+"""
+
+import itertools
+import sys
+import time
+
+from benchmarks.common import setup_django, count_queries
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    setup_django()
+
+    from django.conf import settings
+    from rest_framework import status
+    from rest_framework.authtoken.models import Token
+    from rest_framework.generics import CreateAPIView
+    from rest_framework.response import Response
+    from rest_framework.test import APIRequestFactory
+    from user_auth_app.api.views import UserRegistrationView
+
+    class LegacyRegistrationView(UserRegistrationView):
+        """
+        The previous registration flow: email lookup during validation, Token get_or_create, contact re-read.
+        """
+
+        def get_serializer_context(self):
+            return CreateAPIView.get_serializer_context(self)
+
+        def post(self, request, *args, **kwargs):
+            serializer = self.get_serializer(data=request.data)
+            if not serializer.is_valid():
+                return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+            user = serializer.save()
+            token, created = Token.objects.get_or_create(user=user)
+            return Response(self._build_user_response(user, token), status=status.HTTP_201_CREATED)
+
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+    factory = APIRequestFactory()
+    numbers = itertools.count()
+
+    def registration(view_class):
+        view = view_class.as_view()
+
+        def register():
+            data = {
+                "email": f"user{next(numbers)}@example.com",
+                "name": "Bench User",
+                "password": "Bench@1234",
+                "repeated_password": "Bench@1234",
+            }
+            response = view(factory.post("/auth/register/", data, format="json"))
+            assert response.status_code == 201, response.data
+
+        return register
+
+    print(f"Registration benchmark with {count} registrations per case")
+    for label, view_class in [
+        ("previous flow", LegacyRegistrationView),
+        ("UserRegistrationView", UserRegistrationView),
+    ]:
+        func = registration(view_class)
+        queries = count_queries(func)
+        started = time.perf_counter()
+        for _ in range(count):
+            func()
+        elapsed = time.perf_counter() - started
+        print(f"{label:<24} {count / elapsed:9.0f} registrations/s   queries per registration {queries}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark task search: p50/p95 latency of search_task_ids on the full-text index (FTS5 on SQLite, FULLTEXT on
+MySQL) for rare, common, multi-word, prefix, and subtask-only queries, compared with the substring search
+used within sandboxes and on other databases.
+
+Usage:
+    python -m benchmarks.bench_search [task_count]
+"""
+
+import random
+import statistics
+import string
+import sys
+import time
+
+from benchmarks.common import setup_django
+
+VOCABULARY_SIZE = 5000
+SUBTASKS_PER_TASK = 2
+QUERIES_PER_CASE = 200
+
+
+def make_vocabulary(size):
+    """
+    Return size distinct pseudo-words of 4-9 letters.
+    """
+    words = set()
+    while len(words) < size:
+        words.add("".join(random.choices(string.ascii_lowercase, k=random.randint(4, 9))))
+    return sorted(words)
+
+
+def seed_search_tasks(count, vocabulary, batch_size=5000):
+    """
+    Bulk insert tasks with random titles and descriptions and SUBTASKS_PER_TASK subtasks each.
+    Every batch is one transaction, so each task is indexed once when it commits. The first word of the
+    vocabulary is put into every tenth title to have a query with many matches.
+    """
+    from django.db import transaction
+    from tasks_app.models import Task, Subtask
+
+    common = vocabulary[0]
+    for start in range(0, count, batch_size):
+        tasks = []
+        for i in range(start, min(start + batch_size, count)):
+            title = " ".join(random.choices(vocabulary, k=3)) + (f" {common}" if i % 10 == 0 else "")
+            tasks.append(
+                Task(
+                    title=title,
+                    description=" ".join(random.choices(vocabulary, k=12)),
+                    category="User Story",
+                    date="2030-01-01",
+                )
+            )
+        subtasks = [
+            Subtask(task=task, text=" ".join(random.choices(vocabulary, k=4)))
+            for task in tasks
+            for _ in range(SUBTASKS_PER_TASK)
+        ]
+        with transaction.atomic():
+            Task.objects.bulk_create(tasks)
+            Subtask.objects.bulk_create(subtasks)
+
+
+def percentiles(func, queries):
+    """
+    Run func for each query and return (p50, p95) latency in milliseconds.
+    """
+    timings = []
+    for query in queries:
+        started = time.perf_counter()
+        func(query)
+        timings.append((time.perf_counter() - started) * 1000)
+    cuts = statistics.quantiles(timings, n=20)
+    return statistics.median(timings), cuts[18]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    random.seed(0)
+    setup_django()
+
+    from django.db import connection
+    from tasks_app.models import Subtask, Task
+    from tasks_app.search import search_backend, search_task_ids
+
+    vocabulary = make_vocabulary(VOCABULARY_SIZE)
+    started = time.perf_counter()
+    seed_search_tasks(count, vocabulary)
+    seconds = time.perf_counter() - started
+    subtask_words = Subtask.objects.order_by("?").values_list("text", flat=True)[:QUERIES_PER_CASE]
+    print(f"Task search benchmark with {count} tasks on {connection.vendor}, seeded and indexed in {seconds:.1f} s")
+
+    def sample(k=1):
+        return [" ".join(random.sample(vocabulary[1:], k)) for _ in range(QUERIES_PER_CASE)]
+
+    cases = [
+        ("one word", sample()),
+        ("two words", sample(2)),
+        ("prefix", [word[:4] for word in sample()]),
+        ("common word (10% of tasks)", [vocabulary[0]] * QUERIES_PER_CASE),
+        ("subtask word", [text.split()[0] for text in subtask_words]),
+    ]
+    if search_backend():
+        for label, queries in cases:
+            p50, p95 = percentiles(search_task_ids, queries)
+            print(f"{'index: ' + label:<40} p50 {p50:9.2f} ms   p95 {p95:9.2f} ms")
+    tasks = Task.objects.all()
+    for label, queries in cases[:2]:
+        p50, p95 = percentiles(lambda query: search_task_ids(query, queryset=tasks), queries[:20])
+        print(f"{'substring: ' + label:<40} p50 {p50:9.2f} ms   p95 {p95:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
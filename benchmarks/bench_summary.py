@@ -0,0 +1,78 @@
+"""
+Micro-benchmark for the task summary: legacy per-status counts, single aggregate query, and materialized counters.
+
+Usage:
+    python -m benchmarks.bench_summary [task_count]
+"""
+
+import datetime
+import random
+import sys
+
+from benchmarks.common import setup_django, report
+
+
+def seed_tasks(count, batch_size=5000):
+    """
+    Bulk insert a fixture of tasks with random status, priority, and date.
+    """
+    from tasks_app.models import Task
+
+    today = datetime.date.today()
+    statuses = [choice for choice, _ in Task.STATUS_CHOICES]
+    prios = [choice for choice, _ in Task.PRIORITY_CHOICES]
+    categories = [choice for choice, _ in Task.CATEGORY_CHOICES]
+    tasks = (
+        Task(
+            title=f"Task {i}",
+            category=random.choice(categories),
+            date=today + datetime.timedelta(days=random.randint(-365, 365)),
+            prio=random.choice(prios),
+            status=random.choice(statuses),
+        )
+        for i in range(count)
+    )
+    batch = []
+    for task in tasks:
+        batch.append(task)
+        if len(batch) >= batch_size:
+            Task.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        Task.objects.bulk_create(batch)
+
+
+def legacy_summary(tasks):
+    """
+    Reproduce the previous SummaryView implementation with one query per statistic.
+    """
+    if not tasks.exists():
+        return {}
+    next_urgent_due = tasks.order_by("date").first().date
+    return {
+        "todos": tasks.filter(status="toDo").count(),
+        "in_progress": tasks.filter(status="inProgress").count(),
+        "await_feedback": tasks.filter(status="awaitFeedback").count(),
+        "done": tasks.filter(status="done").count(),
+        "total": tasks.count(),
+        "urgent": tasks.filter(prio="urgent").count(),
+        "next_urgent_due": next_urgent_due,
+    }
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    setup_django()
+
+    from tasks_app.models import Task
+    from tasks_app.utils import aggregate_task_summary, read_task_summary
+
+    seed_tasks(count)
+    print(f"Summary benchmark with {count} tasks")
+    report("legacy (exists + first + 6 counts)", lambda: legacy_summary(Task.objects.all()))
+    report("single aggregate query", lambda: aggregate_task_summary(Task.objects.all()))
+    report("materialized counters", read_task_summary)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark the hot task list and summary queries with and without the composite Task indexes.
+
+Runs against the configured database (SQLite by default, MySQL with DJANGO_ENV=production settings).
+
+Usage:
+    python -m benchmarks.bench_task_indexes [task_count]
+"""
+
+import sys
+
+from benchmarks.bench_summary import seed_tasks
+from benchmarks.common import setup_django, report
+
+
+def cases():
+    """
+    Return (label, queryset factory) pairs for the list, filter, and summary access patterns.
+    """
+    from django.db.models import Min
+    from tasks_app.models import Task
+    from tasks_app.utils import aggregate_task_summary
+
+    page = ("-date", "id")
+    return [
+        ("list first page", lambda: list(Task.objects.order_by(*page)[:50])),
+        ("list status=toDo page", lambda: list(Task.objects.filter(status="toDo").order_by(*page)[:50])),
+        (
+            "list prio=urgent status=toDo page",
+            lambda: list(Task.objects.filter(prio="urgent", status="toDo").order_by(*page)[:50]),
+        ),
+        (
+            "next urgent due",
+            lambda: Task.objects.filter(prio="urgent").exclude(status="done").aggregate(Min("date")),
+        ),
+        ("aggregate summary", lambda: aggregate_task_summary(Task.objects.all())),
+    ]
+
+
+def run(label):
+    """
+    Time every case and print the query plan of the list queries.
+    """
+    from tasks_app.models import Task
+
+    print(f"-- {label}")
+    for name, func in cases():
+        report(name, func, repeat=10)
+    plan = Task.objects.filter(status="toDo").order_by("-date", "id")[:50].explain()
+    print(f"   plan (status=toDo page): {' | '.join(plan.splitlines())}")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    setup_django()
+
+    from django.db import connection
+    from tasks_app.models import Task
+
+    seed_tasks(count)
+    print(f"Task index benchmark with {count} tasks on {connection.vendor}")
+    with connection.schema_editor() as editor:
+        for index in Task._meta.indexes:
+            editor.remove_index(Task, index)
+    run("without composite indexes")
+    with connection.schema_editor() as editor:
+        for index in Task._meta.indexes:
+            editor.add_index(Task, index)
+    run("with composite indexes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Benchmark a full task list reload against a delta sync after a few edits: response time and payload size.
+
+Usage:
+    python -m benchmarks.bench_task_sync [task_count]
+"""
+
+import sys
+
+from benchmarks.bench_board import seed_board
+from benchmarks.common import setup_django, report
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    setup_django()
+
+    from django.contrib.auth.models import User
+    from rest_framework.test import APIClient
+    from tasks_app.models import Subtask, Task
+
+    seed_board(count)
+    user = User.objects.create_user(username="bench", email="bench@example.com", password="Bench@1234")
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    cursor = client.get("/api/tasks/changes/").data["cursor"]
+    edited = list(Task.objects.order_by("?")[:3])
+    edited[0].title = "Edited"
+    edited[0].save()
+    Task.objects.filter(pk=edited[1].pk).update(status="done")
+    Subtask.objects.filter(task=edited[2]).first().delete()
+
+    print(f"Task sync benchmark with {count} tasks and 3 edits")
+    for label, url in [
+        ("full reload GET /api/tasks/", "/api/tasks/"),
+        ("delta GET /api/tasks/changes/", f"/api/tasks/changes/?since={cursor}"),
+    ]:
+        size = len(client.get(url).content)
+        report(f"{label} ({size / 1024:.1f} KiB)", lambda: client.get(url), repeat=5)
+
+
+if __name__ == "__main__":
+    main()
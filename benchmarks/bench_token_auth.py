@@ -0,0 +1,52 @@
+"""
+Benchmark token authentication in requests/sec: DRF TokenAuthentication, the cached token authentication,
+and stateless signed access tokens.
+
+Usage:
+    python -m benchmarks.bench_token_auth [request_count]
+"""
+
+import sys
+
+from benchmarks.common import setup_django, count_queries, timeit
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    setup_django()
+
+    from django.contrib.auth.models import User
+    from rest_framework.authentication import TokenAuthentication
+    from rest_framework.authtoken.models import Token
+    from rest_framework.test import APIRequestFactory
+    from user_auth_app.api.authentication import (
+        CachedTokenAuthentication,
+        SignedAccessTokenAuthentication,
+        create_access_token,
+    )
+    from user_auth_app.api.views import CheckAuthStatusView
+
+    user = User.objects.create_user(username="bench", email="bench@example.com", password="Bench@1234")
+    token = Token.objects.create(user=user)
+    access = create_access_token(user, None)
+    factory = APIRequestFactory()
+
+    print(f"Token auth benchmark with {count} requests to GET /auth/status/")
+    for label, authentication, header in [
+        ("TokenAuthentication", TokenAuthentication, f"Token {token.key}"),
+        ("CachedTokenAuthentication", CachedTokenAuthentication, f"Token {token.key}"),
+        ("SignedAccessTokenAuthentication", SignedAccessTokenAuthentication, f"Bearer {access}"),
+    ]:
+        view = CheckAuthStatusView.as_view(authentication_classes=[authentication])
+
+        def request():
+            return view(factory.get("/auth/status/", HTTP_AUTHORIZATION=header))
+
+        request()
+        queries = count_queries(request)
+        _, mean = timeit(lambda: [request() for _ in range(count)], repeat=3)
+        print(f"{label:<32} {count / mean * 1000:9.0f} requests/s   queries per request {queries}")
+
+
+if __name__ == "__main__":
+    main()
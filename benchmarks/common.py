@@ -0,0 +1,64 @@
+"""
+Shared helpers for benchmark scripts: Django bootstrap, test database setup, and timing.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def setup_django():
+    """
+    Configure Django and create a throw-away test database for the benchmark run.
+    """
+    if str(BASE_DIR) not in sys.path:
+        sys.path.insert(0, str(BASE_DIR))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend_join.settings")
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+    os.environ.setdefault("DJANGO_ENV", "")
+
+    import django
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    django.setup()
+    setup_test_environment()
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+
+
+def timeit(func, repeat=20):
+    """
+    Run func repeatedly and return (best, mean) wall-clock time in milliseconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings), sum(timings) / len(timings)
+
+
+def count_queries(func):
+    """
+    Run func once and return the number of SQL queries it executed.
+    The query log is cleared first, so earlier runs cannot push it past its size limit.
+    """
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    connection.queries_log.clear()
+    with CaptureQueriesContext(connection) as ctx:
+        func()
+    return len(ctx)
+
+
+def report(label, func, repeat=20):
+    """
+    Print best/mean timing and query count for a benchmark case.
+    """
+    queries = count_queries(func)
+    best, mean = timeit(func, repeat=repeat)
+    print(f"{label:<40} best {best:9.2f} ms   mean {mean:9.2f} ms   queries {queries}")
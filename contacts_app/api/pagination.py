@@ -0,0 +1,13 @@
+"""
+Pagination classes for contacts_app API endpoints.
+"""
+
+from backend_join.pagination import KeysetPagination
+
+
+class ContactCursorPagination(KeysetPagination):
+    """
+    Opt-in keyset pagination for contacts, ordered by name with the id as tie-breaker.
+    """
+
+    ordering = ("name", "id")
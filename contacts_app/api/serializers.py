@@ -4,11 +4,13 @@ Serializers for the Contact model, including validation and ID-based lookup.
 
 from rest_framework import serializers
 from contacts_app.models import Contact
+from contacts_app.utils import get_color_from_profile_pic
 
 
 class ContactSerializer(serializers.ModelSerializer):
     """
     Serializer for Contact model, including optional fields for number, initials, and profile picture.
+    Emails are unique per guest sandbox, so the check is scoped by context["sandbox_id"] (shared contacts without one).
     """
 
     number = serializers.CharField(required=False, allow_null=True)
@@ -18,6 +20,48 @@ class ContactSerializer(serializers.ModelSerializer):
     class Meta:
         model = Contact
         fields = ["id", "name", "email", "number", "first_letters", "profile_pic", "is_user"]
+        extra_kwargs = {"email": {"validators": []}}
+
+    def validate_email(self, value):
+        """
+        Ensure the email is unique among the contacts of the contact's sandbox, or among the shared contacts.
+        """
+        sandbox_id = self.instance.sandbox_id if self.instance is not None else self.context.get("sandbox_id")
+        contacts = Contact.objects.filter(email=value, sandbox_id=sandbox_id)
+        if self.instance is not None:
+            contacts = contacts.exclude(pk=self.instance.pk)
+        if contacts.exists():
+            raise serializers.ValidationError("contact with this email already exists.")
+        return value
+
+
+class ContactIDListSerializer(serializers.ListSerializer):
+    """
+    List serializer for contact references that validates all IDs with a single query.
+    """
+
+    def to_internal_value(self, data):
+        """
+        Validate the contact IDs in one query and attach the resolved Contact to each item as 'contact'.
+        Only contacts of the 'sandbox_id' in the serializer context (shared contacts without one) are found.
+        A 'resolved_contacts' mapping in the serializer context is used instead of querying, if present.
+        """
+        items = super().to_internal_value(data)
+        contacts = self.context.get("resolved_contacts")
+        if contacts is None:
+            ids = [item["id"] for item in items if "id" in item]
+            scoped = Contact.objects.filter(sandbox_id=self.context.get("sandbox_id"))
+            contacts = scoped.only(*self.child.Meta.fields).in_bulk(ids) if ids else {}
+        errors = []
+        for item in items:
+            contact = contacts.get(item.get("id"))
+            if contact is not None:
+                item["contact"] = contact
+            missing = "id" in item and contact is None
+            errors.append({"id": [f"Contact with id {item['id']} does not exist."]} if missing else {})
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return items
 
 
 class ContactIDSerializer(ContactSerializer):
@@ -31,11 +75,35 @@ class ContactIDSerializer(ContactSerializer):
         model = Contact
         read_only_fields = ["id", "name", "email", "number", "first_letters", "profile_pic"]
         fields = ["id", "name", "email", "number", "first_letters", "profile_pic"]
+        list_serializer_class = ContactIDListSerializer
 
     def validate_id(self, value):
         """
-        Validate that a contact with the given ID exists.
+        Validate that a contact with the given ID exists in the context's sandbox (or among the shared contacts);
+        in lists this is checked in one batch instead.
         """
-        if not Contact.objects.filter(id=value).exists():
+        if isinstance(self.parent, ContactIDListSerializer):
+            return value
+        if not Contact.objects.filter(id=value, sandbox_id=self.context.get("sandbox_id")).exists():
             raise serializers.ValidationError(f"Contact with id {value} does not exist.")
         return value
+
+
+class ContactRefSerializer(serializers.ModelSerializer):
+    """
+    Compact, read-only contact reference with ID, initials, and profile colour.
+    """
+
+    initials = serializers.CharField(source="first_letters", read_only=True)
+    color = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Contact
+        fields = ["id", "initials", "color"]
+        read_only_fields = ["id"]
+
+    def get_color(self, obj):
+        """
+        Return the fill colour of the contact's profile picture.
+        """
+        return get_color_from_profile_pic(obj.profile_pic)
@@ -2,23 +2,168 @@
 ViewSet for managing contacts via the REST API.
 """
 
+import codecs
+import hashlib
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Count, Max
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from contacts_app.models import Contact
+from contacts_app.importer import import_contacts, parse_contact_rows
+from contacts_app.utils import (
+    get_color_for_name,
+    get_color_from_profile_pic,
+    get_initials_from_name,
+    render_avatar_svg,
+)
 from contacts_app.api.serializers import ContactSerializer
 from .permissions import IsOwnerOrNonUserOrNotGuest
+from contacts_app.api.pagination import ContactCursorPagination
+from backend_join.conditional import conditional_get
+from backend_join.export import EXPORT_CHUNK_SIZE, EXPORT_FORMAT_PATTERN, iter_keyset_chunks, stream_export
+from user_auth_app.sandbox import get_request_sandbox_id
+
+CONTACT_EXPORT_FIELDS = ("id", "name", "email", "number", "first_letters", "is_user")
 
 
 class ContactViewSet(ModelViewSet):
     """
     API endpoint for listing, creating, retrieving, updating, and deleting contacts.
+    Guests only see and write the contacts of their own sandbox; everyone else works on the shared contacts.
     """
 
     serializer_class = ContactSerializer
+    pagination_class = ContactCursorPagination
     permission_classes = [IsAuthenticated, IsOwnerOrNonUserOrNotGuest]
+    avatar_default_size = 120
+    import_content_types = {
+        "text/csv": "csv",
+        "application/jsonl": "jsonl",
+        "application/x-ndjson": "jsonl",
+        "application/x-jsonlines": "jsonl",
+    }
 
     def get_queryset(self):
         """
-        Exclude guest and admin users from the contact queryset.
+        Return the non-user contacts of the request's sandbox, or the shared contacts without guest and admin users.
+        """
+        sandbox_id = get_request_sandbox_id(self.request)
+        if sandbox_id:
+            return Contact.objects.filter(sandbox_id=sandbox_id, user__isnull=True)
+        return Contact.objects.filter(sandbox__isnull=True).exclude(user__username__in=["guest", "admin"])
+
+    def get_serializer_context(self):
+        """
+        Add the request's sandbox, which scopes the email uniqueness check.
+        """
+        return {**super().get_serializer_context(), "sandbox_id": get_request_sandbox_id(self.request)}
+
+    def perform_create(self, serializer):
+        """
+        Create the contact in the request's sandbox.
+        """
+        serializer.save(sandbox_id=get_request_sandbox_id(self.request))
+
+    def get_list_version(self, request, *args, **kwargs):
+        """
+        Return the version of the contact list: contact count and latest contact change.
+        No Last-Modified, as deleting a contact does not move the latest change; the count in the ETag covers it.
+        """
+        contacts = (
+            self.filter_queryset(self.get_queryset()).order_by().aggregate(count=Count("pk"), updated=Max("updated_at"))
+        )
+        return f"{contacts['count']}|{contacts['updated']}", None
+
+    def get_object_version(self, request, *args, **kwargs):
+        """
+        Return the version of one contact from its updated_at, or None if it is not found.
+        """
+        try:
+            updated = (
+                self.get_queryset()
+                .filter(pk=kwargs.get(self.lookup_url_kwarg or self.lookup_field))
+                .values_list("updated_at", flat=True)
+                .first()
+            )
+        except (TypeError, ValueError, DjangoValidationError):
+            return None
+        return None if updated is None else (str(updated), updated)
+
+    @conditional_get("get_list_version")
+    def list(self, request, *args, **kwargs):
+        """
+        List contacts; answers If-None-Match with 304 if no contact has changed.
+        """
+        return super().list(request, *args, **kwargs)
+
+    @conditional_get("get_object_version")
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Retrieve a contact; answers If-None-Match / If-Modified-Since with 304 if it has not changed.
+        """
+        return super().retrieve(request, *args, **kwargs)
+
+    @action(detail=True, methods=["get"], url_path="avatar", permission_classes=[AllowAny])
+    def avatar(self, request, pk=None):
+        """
+        Serve the contact's avatar as SVG with a strong ETag. The URL is not versioned and the avatar changes with
+        the contact's name, so caches must revalidate (no-cache) and are answered with 304 Not Modified.
+        Accepts an optional ?size= (16-512 px).
+        """
+        contact = self.get_object()
+        size = self.get_avatar_size(request)
+        initials = contact.first_letters or get_initials_from_name(contact.name)
+        color = get_color_from_profile_pic(contact.profile_pic) or get_color_for_name(contact.name)
+        svg = render_avatar_svg(initials, color, size, size)
+        etag = f'"{hashlib.sha256(svg.encode()).hexdigest()[:32]}"'
+        response = get_conditional_response(request, etag=etag) or HttpResponse(svg, content_type="image/svg+xml")
+        response["ETag"] = etag
+        response["Cache-Control"] = "public, no-cache"
+        return response
+
+    def get_avatar_size(self, request):
+        """
+        Return the requested avatar size in pixels, clamped to a sane range.
+        """
+        try:
+            size = int(request.query_params.get("size", self.avatar_default_size))
+        except (TypeError, ValueError):
+            size = self.avatar_default_size
+        return max(16, min(size, 512))
+
+    @action(detail=False, methods=["post"], url_path="import")
+    def import_contacts(self, request):
+        """
+        Bulk import contacts from a raw CSV or JSON Lines request body, streamed and inserted in chunks.
+        Returns counts of created, duplicate, and invalid rows with throughput.
+        """
+        content_type = request.content_type.split(";")[0].strip().lower()
+        fmt = self.import_content_types.get(content_type)
+        if fmt is None:
+            supported = ", ".join(self.import_content_types)
+            return Response(
+                {"detail": f"Unsupported content type; use one of: {supported}."},
+                status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            )
+        stream = request.stream
+        lines = codecs.iterdecode(iter(stream.readline, b""), "utf-8") if stream is not None else []
+        try:
+            report = import_contacts(parse_contact_rows(lines, fmt), sandbox_id=get_request_sandbox_id(request))
+        except UnicodeDecodeError:
+            return Response({"detail": "Request body must be UTF-8 encoded."}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(report, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["get"], url_path=rf"export/(?P<export_format>{EXPORT_FORMAT_PATTERN})")
+    def export(self, request, export_format):
+        """
+        Stream all contacts (without profile pictures) as CSV or NDJSON in constant memory, read in keyset
+        chunks by id.
         """
-        return Contact.objects.exclude(user__username__in=["guest", "admin"])
+        queryset = self.filter_queryset(self.get_queryset()).values(*CONTACT_EXPORT_FIELDS)
+        rows = (row for chunk in iter_keyset_chunks(queryset, ("id",), EXPORT_CHUNK_SIZE) for row in chunk)
+        return stream_export(rows, CONTACT_EXPORT_FIELDS, export_format, "contacts")
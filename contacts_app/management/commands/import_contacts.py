@@ -0,0 +1,44 @@
+"""
+Management command to bulk import contacts from a CSV or JSON Lines file.
+"""
+
+from pathlib import Path
+from django.core.management.base import BaseCommand, CommandError
+from contacts_app.importer import DEFAULT_CHUNK_SIZE, IMPORT_FORMATS, import_contacts, parse_contact_rows
+
+
+class Command(BaseCommand):
+    """
+    Stream a CSV (with header) or JSON Lines file into the Contact table in validated, bulk-inserted chunks.
+    """
+
+    help = "Bulk import contacts from a CSV or JSON Lines file, skipping emails that already exist."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Path to the CSV or JSON Lines file.")
+        parser.add_argument(
+            "--format",
+            choices=IMPORT_FORMATS,
+            help="Input format; guessed from the file extension if omitted.",
+        )
+        parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Rows per chunk.")
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        fmt = options["format"] or ("csv" if path.suffix.lower() == ".csv" else "jsonl")
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be at least 1.")
+        try:
+            with path.open(encoding="utf-8", newline="") as lines:
+                report = import_contacts(parse_contact_rows(lines, fmt), chunk_size=options["chunk_size"])
+        except OSError as e:
+            raise CommandError(f"Cannot read {path}: {e}")
+        for error in report["errors"]:
+            self.stderr.write(f"line {error['line']}: {error['errors']}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {report['created']} of {report['received']} contacts "
+                f"({report['duplicates']} duplicates, {report['invalid']} invalid) "
+                f"in {report['seconds']}s ({report['rows_per_second']} rows/s)."
+            )
+        )
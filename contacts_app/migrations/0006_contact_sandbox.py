@@ -0,0 +1,27 @@
+# Generated by Django 5.2 on 2026-10-18 16:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contacts_app", "0005_contact_updated_at"),
+        ("user_auth_app", "0004_guest_sandbox"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="contact",
+            name="sandbox",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="contacts",
+                to="user_auth_app.guestsandbox",
+            ),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2 on 2026-10-18 16:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contacts_app", "0006_contact_sandbox"),
+        ("user_auth_app", "0004_guest_sandbox"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="contact",
+            name="email",
+            field=models.EmailField(max_length=254),
+        ),
+        migrations.AddConstraint(
+            model_name="contact",
+            constraint=models.UniqueConstraint(
+                fields=("sandbox", "email"), name="contact_sandbox_email_uniq"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="contact",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("sandbox__isnull", True)),
+                fields=("email",),
+                name="contact_shared_email_uniq",
+            ),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2 on 2026-10-18 18:02
+
+import django.db.models.functions.comparison
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contacts_app", "0007_contact_email_unique_per_sandbox"),
+        ("user_auth_app", "0004_guest_sandbox"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="contact",
+            name="contact_shared_email_uniq",
+        ),
+        migrations.AddConstraint(
+            model_name="contact",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.comparison.Coalesce(
+                    "sandbox", models.Value("")
+                ),
+                models.F("email"),
+                name="contact_scope_email_uniq",
+            ),
+        ),
+    ]
@@ -3,6 +3,8 @@ Models for storing contact information, including user linkage and profile visua
 """
 
 from django.db import models
+from django.db.models import Value
+from django.db.models.functions import Coalesce
 from django.contrib.auth.models import User
 import uuid
 
@@ -10,16 +12,45 @@ import uuid
 class Contact(models.Model):
     """
     Represents a contact with name, email, number, initials, profile picture, and optional user linkage.
+    Emails are unique among the shared contacts and within each guest sandbox.
     """
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, unique=True)
     name = models.CharField(max_length=255)
-    email = models.EmailField(unique=True)
+    email = models.EmailField()
     number = models.CharField(max_length=30, blank=True, null=True)
     first_letters = models.CharField(max_length=2, blank=True, null=True)
     is_user = models.BooleanField(default=False)
     profile_pic = models.TextField(blank=True, null=True)
     user = models.OneToOneField(User, on_delete=models.SET_NULL, blank=True, null=True, related_name="contact")
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    sandbox = models.ForeignKey(
+        "user_auth_app.GuestSandbox",
+        on_delete=models.CASCADE,
+        related_name="contacts",
+        blank=True,
+        null=True,
+        editable=False,
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["sandbox", "email"], name="contact_sandbox_email_uniq"),
+            # NULL sandboxes are distinct in unique indexes, and MySQL has no partial indexes, so shared contacts are
+            # covered by a functional index that maps them to one empty sandbox key
+            models.UniqueConstraint(Coalesce("sandbox", Value("")), "email", name="contact_scope_email_uniq"),
+        ]
+
+    def save(self, *args, update_fields=None, **kwargs):
+        """
+        Save the contact; a save limited to 'name' also writes the visuals derived from it in pre_save,
+        and every save limited to some fields also writes updated_at.
+        """
+        if update_fields is not None and "name" in update_fields:
+            update_fields = {*update_fields, "first_letters", "profile_pic"}
+        if update_fields is not None:
+            update_fields = {*update_fields, "updated_at"}
+        super().save(*args, update_fields=update_fields, **kwargs)
 
     def __str__(self):
         """Return the contact's name as string representation."""
@@ -1,7 +1,8 @@
 import logging
-from django.db.models.signals import pre_delete, post_save
+from django.db.models.signals import pre_delete, pre_save, post_save, post_delete
 from django.dispatch import receiver
 from django.contrib.auth.models import User
+from backend_join.events import event_scope, queue_event
 from .models import Contact
 from .utils import get_initials_from_name, generate_svg_circle_with_initials
 
@@ -31,18 +32,32 @@ def create_update_contact_profile(sender, instance, created, **kwargs):
 
 
 @receiver(post_save, sender=Contact)
-def update_contact_visuals(sender, instance, created, **kwargs):
+def publish_contact_save(sender, instance, **kwargs):
     """
-    Update first_letters and profile_pic for a Contact after save, if needed.
+    Queue a change event for a saved Contact.
+    """
+    queue_event("contact", "changed", instance.pk, **event_scope(instance.sandbox_id))
+
+
+@receiver(post_delete, sender=Contact)
+def publish_contact_delete(sender, instance, **kwargs):
+    """
+    Queue a deletion event for a deleted Contact.
+    """
+    queue_event("contact", "deleted", instance.pk, **event_scope(instance.sandbox_id))
+
+
+@receiver(pre_save, sender=Contact)
+def update_contact_visuals(sender, instance, update_fields=None, **kwargs):
+    """
+    Set first_letters and profile_pic on a Contact before it is written, so no second UPDATE is needed.
     """
-    update_fields = kwargs.get("update_fields")
     if update_fields is not None and "name" not in update_fields:
-        if "profile_pic" not in update_fields and "first_letters" not in update_fields:
-            return
+        return
     try:
         fields_to_update_dict = _get_fields_to_update(instance, update_fields)
-        if fields_to_update_dict:
-            _update_instance_visuals(sender, instance, fields_to_update_dict)
+        for field, value in fields_to_update_dict.items():
+            setattr(instance, field, value)
     except Exception as e:
         _log_update_visuals_error(instance, e)
 
@@ -70,17 +85,6 @@ def _get_fields_to_update(instance, update_fields):
     return fields_to_update_dict
 
 
-def _update_instance_visuals(sender, instance, fields_to_update_dict):
-    """
-    Update the Contact instance in the database and set attributes in memory.
-    """
-    rows_updated = sender._base_manager.filter(pk=instance.pk).update(**fields_to_update_dict)
-    if rows_updated > 0:
-        for field, value in fields_to_update_dict.items():
-            setattr(instance, field, value)
-        logger.info(f"Updated visuals for contact {instance.pk} in post_save signal.")
-
-
 def _log_update_visuals_error(instance, e):
     """
     Log errors that occur during contact visuals update.
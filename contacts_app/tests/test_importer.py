@@ -0,0 +1,96 @@
+from django.test import TestCase
+from django.db import connection
+from django.db.models.signals import post_save, pre_save
+from django.test.utils import CaptureQueriesContext
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from io import StringIO
+from unittest.mock import Mock
+from contacts_app.models import Contact
+from contacts_app.importer import import_contacts, parse_contact_rows
+import tempfile
+import os
+
+CSV_DATA = "name,email,number\nJohn Doe,john@example.com,123\nJane Roe,jane@example.com,\n"
+
+
+class ContactImporterTest(TestCase):
+    def setUp(self):
+        Contact.objects.create(name="Existing Person", email="existing@example.com")
+
+    def test_parse_csv_rows(self):
+        rows = list(parse_contact_rows(StringIO(CSV_DATA), "csv"))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0][1]["email"], "john@example.com")
+        self.assertIsNone(rows[0][2])
+
+    def test_parse_jsonl_rows_reports_bad_lines(self):
+        lines = StringIO('{"name": "A B", "email": "ab@example.com"}\n\nnot json\n[1]\n')
+        rows = list(parse_contact_rows(lines, "jsonl"))
+        self.assertEqual([line for line, _, _ in rows], [1, 3, 4])
+        self.assertIsNone(rows[0][2])
+        self.assertEqual(rows[1][2], {"non_field_errors": ["Invalid JSON."]})
+        self.assertEqual(rows[2][2], {"non_field_errors": ["Expected a JSON object."]})
+
+    def test_import_precomputes_visuals_and_skips_signals(self):
+        receiver = Mock()
+        pre_save.connect(receiver, sender=Contact)
+        post_save.connect(receiver, sender=Contact)
+        self.addCleanup(pre_save.disconnect, receiver, sender=Contact)
+        self.addCleanup(post_save.disconnect, receiver, sender=Contact)
+        report = import_contacts(parse_contact_rows(StringIO(CSV_DATA), "csv"))
+        receiver.assert_not_called()
+        self.assertEqual(report["created"], 2)
+        john = Contact.objects.get(email="john@example.com")
+        self.assertEqual(john.first_letters, "JD")
+        self.assertIn("JD", john.profile_pic)
+        self.assertIsNone(Contact.objects.get(email="jane@example.com").number)
+
+    def test_import_deduplicates_within_and_across_chunks(self):
+        rows = [
+            (1, {"name": "Existing Person", "email": "existing@example.com"}, None),
+            (2, {"name": "New One", "email": "new@example.com"}, None),
+            (3, {"name": "New One Again", "email": "new@example.com"}, None),
+            (4, {"name": "New Two", "email": "new2@example.com"}, None),
+            (5, {"name": "New Two", "email": "new2@example.com"}, None),
+        ]
+        report = import_contacts(rows, chunk_size=2)
+        self.assertEqual(report["received"], 5)
+        self.assertEqual(report["created"], 2)
+        self.assertEqual(report["duplicates"], 3)
+        self.assertEqual(Contact.objects.filter(email="new@example.com").get().name, "New One")
+
+    def test_import_reports_invalid_rows(self):
+        rows = [(1, {"name": "", "email": "bad"}, None), (2, None, {"non_field_errors": ["Invalid JSON."]})]
+        report = import_contacts(rows)
+        self.assertEqual(report["invalid"], 2)
+        self.assertEqual(report["created"], 0)
+        self.assertEqual(report["errors"][0]["line"], 1)
+        self.assertIn("email", report["errors"][0]["errors"])
+
+    def test_import_query_count_grows_per_chunk_not_per_row(self):
+        def rows(prefix, count):
+            return [(i, {"name": f"Person {i}", "email": f"{prefix}{i}@example.com"}, None) for i in range(count)]
+
+        with CaptureQueriesContext(connection) as one_chunk:
+            import_contacts(rows("a", 50), chunk_size=50)
+        with CaptureQueriesContext(connection) as two_chunks:
+            report = import_contacts(rows("b", 100), chunk_size=50)
+        self.assertEqual(report["created"], 100)
+        self.assertEqual(len(two_chunks), 2 * len(one_chunk))
+
+
+class ImportContactsCommandTest(TestCase):
+    def test_command_imports_csv_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "contacts.csv")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(CSV_DATA)
+            out = StringIO()
+            call_command("import_contacts", path, stdout=out, stderr=StringIO())
+        self.assertIn("Imported 2 of 2 contacts", out.getvalue())
+        self.assertEqual(Contact.objects.count(), 2)
+
+    def test_command_fails_for_missing_file(self):
+        with self.assertRaises(CommandError):
+            call_command("import_contacts", "/nonexistent/contacts.jsonl", stdout=StringIO())
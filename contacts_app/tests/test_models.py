@@ -1,5 +1,10 @@
+import datetime
+from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
 from django.test import TestCase
+from django.utils import timezone
 from contacts_app.models import Contact
+from user_auth_app.models import GuestSandbox
 
 
 class ContactModelTest(TestCase):
@@ -24,6 +29,17 @@ class ContactModelTest(TestCase):
         with self.assertRaises(Exception):
             Contact.objects.create(name="Jane Doe", email="john.doe@example.com")
 
+    def test_email_is_unique_per_sandbox_without_partial_indexes(self):
+        user = User.objects.create_user(username="guest-test", email="guest-test@user.de")
+        sandbox = GuestSandbox.objects.create(user=user, expires_at=timezone.now() + datetime.timedelta(hours=1))
+        Contact.objects.create(name="John Doe", email="john.doe@example.com")
+        Contact.objects.create(name="John Doe", email="john.doe@example.com", sandbox=sandbox)
+        for scope in (None, sandbox):
+            with self.assertRaises(IntegrityError), transaction.atomic():
+                Contact.objects.create(name="Jane Doe", email="john.doe@example.com", sandbox=scope)
+        # MySQL skips conditional constraints, so uniqueness must not depend on one
+        self.assertFalse(any(getattr(constraint, "condition", None) for constraint in Contact._meta.constraints))
+
     def test_optional_fields(self):
         contact = Contact.objects.create(name="John Doe", email="john.doe@example.com")
         contact.refresh_from_db()
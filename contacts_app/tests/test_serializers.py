@@ -101,3 +101,19 @@ class ContactSerializerTest(TestCase):
         serializer = ContactSerializer(data=data)
         self.assertFalse(serializer.is_valid())
         self.assertIn("email", serializer.errors)
+
+    def test_validate_contact_list_in_single_query(self):
+        contacts = [Contact.objects.create(name=f"Contact {i}", email=f"contact{i}@example.com") for i in range(5)]
+        data = [{"id": str(contact.id)} for contact in contacts]
+        serializer = ContactIDSerializer(data=data, many=True)
+        with self.assertNumQueries(1):
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual([item["contact"] for item in serializer.validated_data], contacts)
+
+    def test_validate_contact_list_reports_missing_ids_per_item(self):
+        non_existent_uuid = "123e4567-e89b-12d3-a456-426614174000"
+        data = [{"id": str(self.contact.id)}, {"id": non_existent_uuid}]
+        serializer = ContactIDSerializer(data=data, many=True)
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(serializer.errors[0], {})
+        self.assertEqual(serializer.errors[1]["id"][0], f"Contact with id {non_existent_uuid} does not exist.")
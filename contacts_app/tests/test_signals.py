@@ -1,8 +1,8 @@
 from django.test import TestCase
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 from django.contrib.auth.models import User
 from contacts_app.models import Contact
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, pre_save
 from contacts_app.signals import update_contact_visuals, create_update_contact_profile
 
 
@@ -33,12 +33,12 @@ class ContactUserSyncSignalTests(TestCase):
         mock_qs = mock_user_filter.return_value
         mock_qs.update.side_effect = Exception("Simulated DB error")
 
-        post_save.disconnect(update_contact_visuals, sender=Contact)
+        pre_save.disconnect(update_contact_visuals, sender=Contact)
         try:
             self.contact.email = "another@example.com"
             self.contact.save()
         finally:
-            post_save.connect(update_contact_visuals, sender=Contact)
+            pre_save.connect(update_contact_visuals, sender=Contact)
 
         mock_logger.assert_called_once_with("Error creating/updating contact profile: Simulated DB error")
         self.user.refresh_from_db()
@@ -173,51 +173,64 @@ class ContactVisualsSignalTests(TestCase):
         mock_logger.assert_called_once_with(expected_error_message, exc_info=True)
 
     def test_visuals_updated_if_pic_missing(self):
-        post_save.disconnect(update_contact_visuals, sender=Contact)
-        try:
-            self.contact.profile_pic = None
-            Contact._base_manager.filter(pk=self.contact.pk).update(profile_pic=None)
-
-            self.contact.refresh_from_db()
-            self.assertIsNone(
-                self.contact.profile_pic,
-                "Setup failed: profile_pic should be None after refresh_from_db.",
-            )
-
-            initial_name = self.contact.name
-            contact_pk = self.contact.pk
-            mock_svg_content = "<svg>Generated</svg>"
-
-            with (
-                patch("contacts_app.signals.generate_svg_circle_with_initials") as mock_generate_svg,
-                patch("contacts_app.signals.Contact._base_manager.filter") as mock_filter,
-            ):
-                mock_generate_svg.return_value = mock_svg_content
-                mock_qs = mock_filter.return_value
-                mock_qs.update.return_value = 1
-
-                update_contact_visuals(sender=Contact, instance=self.contact, created=False, update_fields=None)
-
-                mock_generate_svg.assert_called_once_with(initial_name)
-                mock_filter.assert_called_once_with(pk=contact_pk)
-                mock_qs.update.assert_called_once_with(profile_pic=mock_svg_content)
+        self.contact.profile_pic = None
+        initial_name = self.contact.name
+        mock_svg_content = "<svg>Generated</svg>"
 
-                self.assertEqual(self.contact.profile_pic, mock_svg_content)
+        with patch("contacts_app.signals.generate_svg_circle_with_initials") as mock_generate_svg:
+            mock_generate_svg.return_value = mock_svg_content
+            with self.assertNumQueries(0):
+                update_contact_visuals(sender=Contact, instance=self.contact, update_fields=None)
+            mock_generate_svg.assert_called_once_with(initial_name)
 
-        finally:
-            post_save.connect(update_contact_visuals, sender=Contact)
+        self.assertEqual(self.contact.profile_pic, mock_svg_content)
 
     def test_update_contact_visuals_skips_irrelevant_update_fields(self):
-        from contacts_app.signals import update_contact_visuals
-
         contact = self.contact
         contact.first_letters = "XX"
         contact.profile_pic = "<svg>old</svg>"
-        contact.save()
-        with (
-            patch("contacts_app.signals._get_fields_to_update") as mock_get_fields,
-            patch("contacts_app.signals._update_instance_visuals") as mock_update_instance,
-        ):
-            update_contact_visuals(sender=Contact, instance=contact, created=False, update_fields=["number"])
+        with patch("contacts_app.signals._get_fields_to_update") as mock_get_fields:
+            update_contact_visuals(sender=Contact, instance=contact, update_fields=["number"])
             mock_get_fields.assert_not_called()
-            mock_update_instance.assert_not_called()
+        self.assertEqual(contact.first_letters, "XX")
+
+    def test_create_writes_visuals_in_a_single_query(self):
+        with self.assertNumQueries(1):
+            contact = Contact.objects.create(name="Single Write", email="single@example.com")
+        contact.refresh_from_db()
+        self.assertEqual(contact.first_letters, "SW")
+        self.assertIn("SW", contact.profile_pic)
+
+    def test_rename_writes_visuals_in_a_single_query(self):
+        self.contact.name = "Other Person"
+        with self.assertNumQueries(1):
+            self.contact.save()
+        self.contact.refresh_from_db()
+        self.assertEqual(self.contact.first_letters, "OP")
+        self.assertIn("OP", self.contact.profile_pic)
+
+    def test_rename_with_update_fields_also_writes_visuals(self):
+        self.contact.name = "Other Person"
+        with self.assertNumQueries(1):
+            self.contact.save(update_fields=["name"])
+        self.contact.refresh_from_db()
+        self.assertEqual(self.contact.first_letters, "OP")
+        self.assertIn("OP", self.contact.profile_pic)
+
+
+class ContactEventTest(TestCase):
+    def test_contact_writes_publish_events_on_commit(self):
+        broker = Mock()
+        with patch("backend_join.events._broker", broker):
+            with self.captureOnCommitCallbacks(execute=True):
+                contact = Contact.objects.create(name="Event Person", email="event@example.com")
+            contact_id = contact.pk
+            with self.captureOnCommitCallbacks(execute=True):
+                contact.delete()
+        self.assertEqual(
+            [call.args[0] for call in broker.publish.call_args_list],
+            [
+                [{"type": "contact", "action": "changed", "id": str(contact_id)}],
+                [{"type": "contact", "action": "deleted", "id": str(contact_id)}],
+            ],
+        )
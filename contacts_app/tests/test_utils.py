@@ -1,5 +1,13 @@
 from django.test import TestCase
-from contacts_app.utils import generate_svg_circle_with_initials, _svg_profile_pic, get_initials_from_name
+from contacts_app.utils import (
+    generate_svg_circle_with_initials,
+    _svg_profile_pic,
+    get_initials_from_name,
+    get_color_from_profile_pic,
+    get_color_for_name,
+    render_avatar_svg,
+    PROFILE_PIC_COLORS,
+)
 
 
 class TestUtils(TestCase):
@@ -64,3 +72,24 @@ class TestUtils(TestCase):
     def test_get_initials_from_name_lowercase(self):
         self.assertEqual(get_initials_from_name("john doe"), "JD")
         self.assertEqual(get_initials_from_name("single"), "S")
+
+    def test_get_color_from_profile_pic(self):
+        svg = _svg_profile_pic("#FF4646", "JD", 120, 120)
+        self.assertEqual(get_color_from_profile_pic(svg), "#FF4646")
+        self.assertIsNone(get_color_from_profile_pic("<svg>...</svg>"))
+        self.assertIsNone(get_color_from_profile_pic(None))
+
+    def test_get_color_for_name_is_deterministic(self):
+        self.assertEqual(get_color_for_name("John Doe"), get_color_for_name("John Doe"))
+        self.assertEqual(get_color_for_name(" john doe "), get_color_for_name("John Doe"))
+        self.assertIn(get_color_for_name("John Doe"), PROFILE_PIC_COLORS)
+        self.assertIn(get_color_for_name(None), PROFILE_PIC_COLORS)
+        self.assertEqual(generate_svg_circle_with_initials("John Doe"), generate_svg_circle_with_initials("John Doe"))
+
+    def test_render_avatar_svg_is_cached(self):
+        render_avatar_svg.cache_clear()
+        first = render_avatar_svg("JD", "#FF4646", 64, 64)
+        second = render_avatar_svg("JD", "#FF4646", 64, 64)
+        self.assertIs(first, second)
+        self.assertEqual(render_avatar_svg.cache_info().hits, 1)
+        self.assertEqual(first, _svg_profile_pic("#FF4646", "JD", 64, 64))
@@ -4,6 +4,10 @@ from contacts_app.models import Contact
 from django.urls import reverse
 from rest_framework.authtoken.models import Token
 from django.contrib.auth.models import User
+import json
+from unittest import mock
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 
 class ContactViewSetTest(APITestCase):
@@ -76,3 +80,151 @@ class ContactViewSetTest(APITestCase):
         response = self.client.post(self.list_url, data)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("email", response.data)
+
+    def test_list_contacts_with_cursor_pagination(self):
+        for name in ["Anna", "Bert", "Anna"]:
+            Contact.objects.create(name=name, email=f"{name.lower()}{Contact.objects.count()}@example.com")
+        response = self.client.get(self.list_url, {"page_size": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        names = [contact["name"] for contact in response.data["results"]]
+        next_url = response.data["next"]
+        while next_url:
+            response = self.client.get(next_url)
+            names.extend(contact["name"] for contact in response.data["results"])
+            next_url = response.data["next"]
+        self.assertEqual(names, ["Anna", "Anna", "Bert", "John Doe", "testuser"])
+
+
+class ContactAvatarViewTest(APITestCase):
+    def setUp(self):
+        self.contact = Contact.objects.create(name="John Doe", email="john.doe@example.com")
+        self.url = reverse("contact-avatar", args=[self.contact.id])
+
+    def test_avatar_is_served_as_cacheable_svg(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "image/svg+xml")
+        self.assertIn("JD", response.content.decode())
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertEqual(response["Cache-Control"], "public, no-cache")
+
+    def test_avatar_is_deterministic(self):
+        first = self.client.get(self.url)
+        second = self.client.get(self.url)
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(first["ETag"], second["ETag"])
+
+    def test_avatar_matching_etag_returns_not_modified(self):
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+
+    def test_avatar_etag_changes_with_the_contact_name(self):
+        etag = self.client.get(self.url)["ETag"]
+        self.contact.name = "Jane Roe"
+        self.contact.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("JR", response.content.decode())
+
+    def test_avatar_size_is_clamped(self):
+        response = self.client.get(self.url, {"size": "4096"})
+        self.assertIn('width="512"', response.content.decode())
+        response = self.client.get(self.url, {"size": "abc"})
+        self.assertIn('width="120"', response.content.decode())
+
+    def test_avatar_unknown_contact_returns_404(self):
+        response = self.client.get(reverse("contact-avatar", args=["00000000-0000-0000-0000-000000000000"]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ContactImportViewTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", email="testuser@example.com", password="Test@1234")
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        self.url = reverse("contact-import-contacts")
+
+    def test_import_jsonl(self):
+        body = '{"name": "John Doe", "email": "john@example.com"}\n{"name": "X", "email": "invalid"}\n'
+        response = self.client.post(self.url, body, content_type="application/x-ndjson")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["created"], 1)
+        self.assertEqual(response.data["invalid"], 1)
+        self.assertEqual(response.data["errors"][0]["line"], 2)
+        self.assertTrue(Contact.objects.filter(email="john@example.com", first_letters="JD").exists())
+
+    def test_import_csv_skips_existing_emails(self):
+        body = "name,email\nTest User,testuser@example.com\nJane Roe,jane@example.com\n"
+        response = self.client.post(self.url, body, content_type="text/csv; charset=utf-8")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["created"], 1)
+        self.assertEqual(response.data["duplicates"], 1)
+        self.assertIn("rows_per_second", response.data)
+
+    def test_import_rejects_unsupported_content_type(self):
+        response = self.client.post(self.url, [{"name": "A"}], format="json")
+        self.assertEqual(response.status_code, status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+
+    def test_import_requires_authentication(self):
+        self.client.credentials()
+        response = self.client.post(self.url, "name,email\n", content_type="text/csv")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class ContactExportViewTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", email="testuser@example.com", password="Test@1234")
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        Contact.objects.create(name="John Doe", email="john.doe@example.com", number="+123")
+
+    def test_export_csv_without_profile_pics(self):
+        response = self.client.get(reverse("contact-export", args=["csv"]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0], "id,name,email,number,first_letters,is_user")
+        self.assertEqual(len(lines), 3)
+        self.assertNotIn("<svg", "".join(lines))
+
+    def test_export_ndjson(self):
+        response = self.client.get(reverse("contact-export", args=["ndjson"]))
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        self.assertEqual({row["email"] for row in rows}, {"john.doe@example.com", "testuser@example.com"})
+
+    def test_export_reads_contacts_in_bounded_chunks(self):
+        for i in range(3):
+            Contact.objects.create(name=f"Contact {i}", email=f"contact{i}@example.com")
+        with mock.patch("contacts_app.api.views.EXPORT_CHUNK_SIZE", 2):
+            response = self.client.get(reverse("contact-export", args=["ndjson"]))
+            with CaptureQueriesContext(connection) as queries:
+                rows = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        self.assertEqual([row["id"] for row in rows], sorted(row["id"] for row in rows))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(len(queries), 3)
+        self.assertTrue(all("LIMIT 2" in query["sql"] for query in queries))
+
+
+class ContactConditionalGetTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", email="testuser@example.com", password="Test@1234")
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        self.contact = Contact.objects.create(name="John Doe", email="john.doe@example.com")
+
+    def test_list_and_detail_return_304_until_changed(self):
+        detail_url = reverse("contact-detail", args=[self.contact.id])
+        list_etag = self.client.get(self.list_url())["ETag"]
+        detail_etag = self.client.get(detail_url)["ETag"]
+        self.assertEqual(self.client.get(self.list_url(), HTTP_IF_NONE_MATCH=list_etag).status_code, 304)
+        self.assertEqual(self.client.get(detail_url, HTTP_IF_NONE_MATCH=detail_etag).status_code, 304)
+
+        self.contact.name = "Jane Doe"
+        self.contact.save()
+        self.assertEqual(self.client.get(self.list_url(), HTTP_IF_NONE_MATCH=list_etag).status_code, 200)
+        self.assertEqual(self.client.get(detail_url, HTTP_IF_NONE_MATCH=detail_etag).status_code, 200)
+
+    def list_url(self):
+        return reverse("contact-list")
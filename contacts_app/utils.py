@@ -2,33 +2,54 @@
 Utility functions for contacts, including SVG profile generation and name initials extraction.
 """
 
-import random
+import re
+import zlib
+from functools import lru_cache
+
+PROFILE_PIC_COLORS = (
+    "#0038FF",
+    "#00BEE8",
+    "#1FD7C1",
+    "#6E52FF",
+    "#9327FF",
+    "#C3FF2B",
+    "#FC71FF",
+    "#FF4646",
+    "#FF5EB3",
+    "#FF745E",
+    "#FF7A00",
+    "#FFA35E",
+    "#FFBB2B",
+    "#FFC701",
+    "#FFE62B",
+)
+AVATAR_CACHE_SIZE = 1024
+PROFILE_PIC_COLOR_PATTERN = re.compile(r'<circle[^>]*fill="(#[0-9A-Fa-f]{6})"')
 
 
 def generate_svg_circle_with_initials(name, width=120, height=120):
     """
     Generate an SVG profile picture with initials for a given name.
+    The colour is derived from the name, so the same name always yields the same picture.
     """
-    colors = [
-        "#0038FF",
-        "#00BEE8",
-        "#1FD7C1",
-        "#6E52FF",
-        "#9327FF",
-        "#C3FF2B",
-        "#FC71FF",
-        "#FF4646",
-        "#FF5EB3",
-        "#FF745E",
-        "#FF7A00",
-        "#FFA35E",
-        "#FFBB2B",
-        "#FFC701",
-        "#FFE62B",
-    ]
-    random_color = random.choice(colors)
     initials = get_initials_from_name(name)
-    return _svg_profile_pic(random_color, initials, height, width)
+    return render_avatar_svg(initials, get_color_for_name(name), width, height)
+
+
+def get_color_for_name(name):
+    """
+    Return a stable palette colour for a name, independent of process and hash seed.
+    """
+    key = (name or "").strip().lower().encode()
+    return PROFILE_PIC_COLORS[zlib.crc32(key) % len(PROFILE_PIC_COLORS)]
+
+
+@lru_cache(maxsize=AVATAR_CACHE_SIZE)
+def render_avatar_svg(initials, color, width=120, height=120):
+    """
+    Return cached SVG markup for the given initials, colour, and size.
+    """
+    return _svg_profile_pic(color, initials, height, width)
 
 
 def _svg_profile_pic(color, initials, height, width):
@@ -63,3 +84,13 @@ def get_initials_from_name(name_string):
         return name_parts[0][0].upper()
     else:
         return (name_parts[0][0] + name_parts[-1][0]).upper()
+
+
+def get_color_from_profile_pic(profile_pic):
+    """
+    Return the circle fill colour of an SVG profile picture, or None if it cannot be found.
+    """
+    if not profile_pic:
+        return None
+    match = PROFILE_PIC_COLOR_PATTERN.search(profile_pic)
+    return match.group(1) if match else None
@@ -0,0 +1,75 @@
+"""
+Query-parameter filters for task list endpoints, applied in SQL.
+"""
+
+import datetime
+import uuid
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+from tasks_app.models import Task
+
+TASK_CHOICE_FILTERS = {
+    "status": [choice for choice, _ in Task.STATUS_CHOICES],
+    "prio": [choice for choice, _ in Task.PRIORITY_CHOICES],
+    "category": [choice for choice, _ in Task.CATEGORY_CHOICES],
+}
+
+
+def _split_param(value):
+    """
+    Split a comma-separated query parameter into its non-empty parts.
+    """
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+def _parse_choices(name, value):
+    """
+    Return the requested choice values, or raise a ValidationError naming the invalid ones.
+    """
+    values = _split_param(value)
+    invalid = [item for item in values if item not in TASK_CHOICE_FILTERS[name]]
+    if invalid:
+        raise ValidationError({name: [f"Invalid value(s): {', '.join(invalid)}."]})
+    return values
+
+
+def _parse_uuids(name, value):
+    """
+    Return the given comma-separated IDs as UUIDs, or raise a ValidationError.
+    """
+    try:
+        return [uuid.UUID(item) for item in _split_param(value)]
+    except ValueError:
+        raise ValidationError({name: ["Expected one or more comma-separated contact IDs."]})
+
+
+def _parse_date(name, value):
+    """
+    Return an ISO date query parameter as a date, or raise a ValidationError.
+    """
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        raise ValidationError({name: ["Expected a date in YYYY-MM-DD format."]})
+
+
+def filter_tasks(queryset, params):
+    """
+    Filter tasks by status, prio, category (comma-separated values), assigned_to (contact IDs),
+    date_from/date_to (inclusive), and search (title or description contains the text).
+    """
+    for name in TASK_CHOICE_FILTERS:
+        if params.get(name):
+            queryset = queryset.filter(**{f"{name}__in": _parse_choices(name, params[name])})
+    if params.get("assigned_to"):
+        contact_ids = _parse_uuids("assigned_to", params["assigned_to"])
+        links = Task.assigned_to.through.objects.filter(contact_id__in=contact_ids)
+        queryset = queryset.filter(id__in=links.values("task_id"))
+    if params.get("date_from"):
+        queryset = queryset.filter(date__gte=_parse_date("date_from", params["date_from"]))
+    if params.get("date_to"):
+        queryset = queryset.filter(date__lte=_parse_date("date_to", params["date_to"]))
+    search = params.get("search", "").strip()
+    if search:
+        queryset = queryset.filter(Q(title__icontains=search) | Q(description__icontains=search))
+    return queryset
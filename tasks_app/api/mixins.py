@@ -0,0 +1,248 @@
+"""
+Mixin providing a bulk create, update, and delete endpoint for tasks.
+"""
+
+import uuid
+from collections import defaultdict
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from tasks_app.models import Task, Subtask
+from tasks_app.api.serializers import TaskSerializer
+from tasks_app.search import schedule_task_reindex
+from contacts_app.models import Contact
+from contacts_app.api.serializers import ContactIDSerializer
+
+
+def _parse_uuid(value):
+    """
+    Return value as UUID, or None if it is not a valid UUID.
+    """
+    try:
+        return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+class BulkTaskMixin:
+    """
+    Adds a /bulk/ route to a task viewset: POST creates, PATCH updates, and DELETE removes many tasks.
+    Valid items are written in one transaction with bulk ORM operations; each item gets its own result.
+    """
+
+    bulk_batch_size = 500
+
+    @action(detail=False, methods=["post", "patch", "delete"], url_path="bulk")
+    def bulk(self, request):
+        """
+        Apply a list of task payloads (POST/PATCH) or task IDs (DELETE) and return per-item results.
+        """
+        items = request.data
+        if not isinstance(items, list):
+            return Response({"detail": "Expected a list of items."}, status=status.HTTP_400_BAD_REQUEST)
+        handlers = {"POST": self.bulk_create_tasks, "PATCH": self.bulk_update_tasks, "DELETE": self.bulk_delete_tasks}
+        results = handlers[request.method](items)
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
+    def get_bulk_serializer_context(self, items):
+        """
+        Return serializer context with all referenced contacts of the request's scope resolved in a single query.
+        """
+        contact_ids = set()
+        for item in items:
+            assigned_to = item.get("assigned_to") if isinstance(item, dict) else None
+            for contact_data in assigned_to if isinstance(assigned_to, list) else []:
+                contact_id = _parse_uuid(contact_data.get("id")) if isinstance(contact_data, dict) else None
+                if contact_id:
+                    contact_ids.add(contact_id)
+        context = self.get_serializer_context()
+        contacts = Contact.objects.filter(sandbox_id=context.get("sandbox_id")).only(*ContactIDSerializer.Meta.fields)
+        context["resolved_contacts"] = contacts.in_bulk(contact_ids) if contact_ids else {}
+        return context
+
+    def validate_bulk_item(self, serializer, item, instance=None):
+        """
+        Validate one item with a shared serializer, so its fields are only built once per request.
+        Returns (validated_data, None) on success or (None, errors) on failure.
+        """
+        serializer.instance = instance
+        try:
+            return dict(serializer.run_validation(item)), None
+        except ValidationError as exc:
+            return None, exc.detail
+
+    def bulk_create_tasks(self, items):
+        """
+        Validate and create tasks with their subtasks and assigned contacts using bulk inserts.
+        """
+        serializer = TaskSerializer(context=self.get_bulk_serializer_context(items))
+        results, valid = {}, []
+        for index, item in enumerate(items):
+            data, errors = self.validate_bulk_item(serializer, item)
+            if errors:
+                results[index] = {"index": index, "status": status.HTTP_400_BAD_REQUEST, "errors": errors}
+            else:
+                valid.append((index, data))
+        valid = self._reject_duplicate_ids(valid, results)
+
+        tasks, subtasks, links = [], [], []
+        through = Task.assigned_to.through
+        sandbox_id = self.get_sandbox_id()
+        for index, data in valid:
+            subtasks_data = data.pop("subtasks", [])
+            assigned_to_data = data.pop("assigned_to", [])
+            task = Task(**data, sandbox_id=sandbox_id)
+            tasks.append(task)
+            subtasks.extend(
+                Subtask(task=task, text=subtask["text"], status=subtask.get("status", "unchecked"))
+                for subtask in subtasks_data
+            )
+            contact_ids = dict.fromkeys(contact["id"] for contact in assigned_to_data)
+            links.extend(through(task_id=task.id, contact_id=contact_id) for contact_id in contact_ids)
+            results[index] = {"index": index, "id": str(task.id), "status": status.HTTP_201_CREATED}
+
+        with transaction.atomic():
+            Task.objects.bulk_create(tasks, batch_size=self.bulk_batch_size)
+            Subtask.objects.bulk_create(subtasks, batch_size=self.bulk_batch_size)
+            through.objects.bulk_create(links, batch_size=self.bulk_batch_size)
+        return [results[index] for index in sorted(results)]
+
+    def _reject_duplicate_ids(self, valid, results):
+        """
+        Drop items whose explicit task ID already exists or repeats within the request.
+        """
+        requested_ids = [data["id"] for _, data in valid if data.get("id")]
+        taken = set(Task.objects.filter(id__in=requested_ids).values_list("id", flat=True)) if requested_ids else set()
+        accepted = []
+        for index, data in valid:
+            task_id = data.get("id")
+            if task_id and task_id in taken:
+                error = {"id": [f"Task with id {task_id} already exists."]}
+                results[index] = {"index": index, "status": status.HTTP_400_BAD_REQUEST, "errors": error}
+                continue
+            if task_id:
+                taken.add(task_id)
+            accepted.append((index, data))
+        return accepted
+
+    def bulk_update_tasks(self, items):
+        """
+        Partially update tasks; subtasks and assigned contacts are only synced for items that include them.
+        """
+        serializer = TaskSerializer(partial=True, context=self.get_bulk_serializer_context(items))
+        ids = [_parse_uuid(item.get("id")) if isinstance(item, dict) else None for item in items]
+        instances = self.get_queryset().prefetch_related(None).in_bulk([task_id for task_id in ids if task_id])
+
+        results, updates, seen = [], [], set()
+        for index, (item, task_id) in enumerate(zip(items, ids)):
+            task = instances.get(task_id)
+            if task is None:
+                results.append({"index": index, "status": status.HTTP_404_NOT_FOUND, "errors": {"id": ["Not found."]}})
+                continue
+            if task_id in seen:
+                error = {"id": [f"Task with id {task_id} appears more than once."]}
+                results.append({"index": index, "status": status.HTTP_400_BAD_REQUEST, "errors": error})
+                continue
+            seen.add(task_id)
+            data, errors = self.validate_bulk_item(serializer, item, instance=task)
+            if errors:
+                results.append({"index": index, "status": status.HTTP_400_BAD_REQUEST, "errors": errors})
+                continue
+            updates.append((task, data))
+            results.append({"index": index, "id": str(task.id), "status": status.HTTP_200_OK})
+
+        with transaction.atomic():
+            self._bulk_update_task_fields(updates)
+            self._bulk_sync_subtasks(updates, serializer)
+            self._bulk_sync_assigned_to(updates)
+        return results
+
+    def _bulk_update_task_fields(self, updates):
+        """
+        Write changed scalar task fields and bump updated_at with a single bulk_update.
+        """
+        fields = {"updated_at"}
+        now = timezone.now()
+        for task, data in updates:
+            task.updated_at = now
+            for attr, value in data.items():
+                if attr not in ("id", "subtasks", "assigned_to"):
+                    setattr(task, attr, value)
+                    fields.add(attr)
+        if updates:
+            tasks = [task for task, _ in updates]
+            Task.objects.bulk_update(tasks, sorted(fields), batch_size=self.bulk_batch_size)
+
+    def _bulk_sync_subtasks(self, updates, serializer):
+        """
+        Diff the subtasks of all updated tasks against one query and apply one bulk create, update, and delete.
+        Bulk writes send no signals, so the tasks are scheduled for search reindexing here.
+        """
+        targets = [(task, data["subtasks"]) for task, data in updates if "subtasks" in data]
+        if not targets:
+            return
+        existing = defaultdict(dict)
+        for subtask in Subtask.objects.filter(task_id__in=[task.pk for task, _ in targets]):
+            existing[subtask.task_id][subtask.id] = subtask
+        to_create, to_update, removed = [], [], []
+        for task, subtasks_data in targets:
+            created, updated, kept_ids = serializer.diff_subtasks(task, existing[task.pk], subtasks_data)
+            to_create.extend(created)
+            to_update.extend(updated)
+            removed.extend((subtask_id, task.pk, task.sandbox_id) for subtask_id in existing[task.pk].keys() - kept_ids)
+        if to_create:
+            Subtask.objects.bulk_create(to_create, batch_size=self.bulk_batch_size)
+        if to_update:
+            Subtask.objects.bulk_update(to_update, ["text", "status"], batch_size=self.bulk_batch_size)
+        if removed:
+            Subtask.objects.filter(id__in=[row[0] for row in removed]).delete(rows=removed)
+        schedule_task_reindex(task.pk for task, _ in targets)
+
+    def _bulk_sync_assigned_to(self, updates):
+        """
+        Diff the contact links of all updated tasks against one query and apply one bulk insert and delete.
+        """
+        targets = {task.pk: data["assigned_to"] for task, data in updates if "assigned_to" in data}
+        if not targets:
+            return
+        through = Task.assigned_to.through
+        current = defaultdict(dict)
+        for link_id, task_id, contact_id in through.objects.filter(task_id__in=targets).values_list(
+            "id", "task_id", "contact_id"
+        ):
+            current[task_id][contact_id] = link_id
+        added, removed_link_ids = [], []
+        for task_id, assigned_to_data in targets.items():
+            wanted_ids = {contact["id"] for contact in assigned_to_data}
+            added.extend(
+                through(task_id=task_id, contact_id=contact_id) for contact_id in wanted_ids - current[task_id].keys()
+            )
+            removed_link_ids.extend(
+                link_id for contact_id, link_id in current[task_id].items() if contact_id not in wanted_ids
+            )
+        if added:
+            through.objects.bulk_create(added, batch_size=self.bulk_batch_size)
+        if removed_link_ids:
+            through.objects.filter(id__in=removed_link_ids).delete()
+
+    def bulk_delete_tasks(self, items):
+        """
+        Delete the tasks with the given IDs (plain IDs or objects with an 'id') in one query.
+        """
+        ids = [_parse_uuid(item.get("id") if isinstance(item, dict) else item) for item in items]
+        existing = set(
+            self.get_queryset().filter(id__in=[task_id for task_id in ids if task_id]).values_list("id", flat=True)
+        )
+        results = []
+        for index, task_id in enumerate(ids):
+            if task_id in existing:
+                results.append({"index": index, "id": str(task_id), "status": status.HTTP_204_NO_CONTENT})
+            else:
+                results.append({"index": index, "status": status.HTTP_404_NOT_FOUND, "errors": {"id": ["Not found."]}})
+        if existing:
+            with transaction.atomic():
+                Task.objects.filter(id__in=existing).delete()
+        return results
@@ -0,0 +1,13 @@
+"""
+Pagination classes for tasks_app API endpoints.
+"""
+
+from backend_join.pagination import KeysetPagination
+
+
+class TaskCursorPagination(KeysetPagination):
+    """
+    Opt-in keyset pagination for tasks, newest due date first with the id as tie-breaker.
+    """
+
+    ordering = ("-date", "id")
@@ -2,9 +2,10 @@
 Serializers for Task and Subtask models, including validation and nested handling.
 """
 
+from django.db import transaction
 from rest_framework import serializers
 from tasks_app.models import Task, Subtask
-from contacts_app.api.serializers import ContactIDSerializer
+from contacts_app.api.serializers import ContactIDSerializer, ContactRefSerializer
 from contacts_app.models import Contact
 
 
@@ -50,6 +51,16 @@ class TaskSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "prio_display", "status_display"]
 
+    def __init__(self, *args, **kwargs):
+        """
+        Restrict the output to the field names in context['fields'], if given.
+        """
+        super().__init__(*args, **kwargs)
+        requested = self.context.get("fields")
+        if requested:
+            for name in set(self.fields) - set(requested):
+                self.fields.pop(name)
+
     def validate_subtasks(self, value):
         """
         Ensure subtasks value is a list or empty.
@@ -69,60 +80,82 @@ class TaskSerializer(serializers.ModelSerializer):
                 raise serializers.ValidationError("Each contact must include an 'id' field.")
         return value
 
+    @transaction.atomic
     def handle_subtasks(self, instance, subtasks_data):
         """
-        Create, update, or delete subtasks for a given task instance.
+        Sync the subtasks of a task with the given data using at most one bulk create, update, and delete.
         """
-        existing_subtask_ids = set(instance.subtasks.values_list("id", flat=True))
-        new_subtask_ids = set()
-
-        for subtask_data in subtasks_data:
-            subtask_id = subtask_data.get("id")
-            if subtask_id:
-                new_subtask_ids.add(self.update_existing_subtask(subtask_id, subtask_data))
-            else:
-                new_subtask_ids.add(self.create_new_subtask(instance, subtask_data))
+        existing = {subtask.id: subtask for subtask in Subtask.objects.filter(task=instance)}
+        to_create, to_update, kept_ids = self.diff_subtasks(instance, existing, subtasks_data)
+        removed_ids = existing.keys() - kept_ids
 
-        removed_subtask_ids = existing_subtask_ids - new_subtask_ids
-        self.delete_removed_subtasks(removed_subtask_ids)
+        if to_create:
+            Subtask.objects.bulk_create(to_create)
+        if to_update:
+            Subtask.objects.bulk_update(to_update, ["text", "status"])
+        if removed_ids:
+            Subtask.objects.filter(task=instance, id__in=removed_ids).delete(
+                rows=[(subtask_id, instance.pk, instance.sandbox_id) for subtask_id in removed_ids]
+            )
 
-    def update_existing_subtask(self, subtask_id, subtask_data):
+    def diff_subtasks(self, instance, existing, subtasks_data):
         """
-        Update an existing subtask with new data.
+        Split subtask data into new subtasks, changed existing subtasks, and the ids of all existing ones to keep.
         """
-        subtask_instance = Subtask.objects.get(id=subtask_id)
-        subtask_instance.text = subtask_data.get("text", subtask_instance.text)
-        subtask_instance.status = subtask_data.get("status", subtask_instance.status)
-        subtask_instance.save()
-        return subtask_id
-
-    def create_new_subtask(self, instance, subtask_data):
+        to_create, to_update, kept_ids = [], [], set()
+        for subtask_data in subtasks_data:
+            subtask = existing.get(subtask_data.get("id"))
+            if subtask is None:
+                to_create.append(
+                    Subtask(task=instance, text=subtask_data["text"], status=subtask_data.get("status", "unchecked"))
+                )
+                continue
+            kept_ids.add(subtask.id)
+            text = subtask_data.get("text", subtask.text)
+            status = subtask_data.get("status", subtask.status)
+            if (text, status) != (subtask.text, subtask.status):
+                subtask.text, subtask.status = text, status
+                to_update.append(subtask)
+        return to_create, to_update, kept_ids
+
+    @transaction.atomic
+    def handle_assigned_to(self, instance, assigned_to_data):
         """
-        Create a new subtask for a given task instance.
+        Sync the assigned contacts of a task, adding only new links and removing only dropped ones.
+        Contacts already resolved during validation are not looked up again.
         """
-        new_subtask = Subtask.objects.create(task=instance, **subtask_data)
-        return new_subtask.id
+        wanted_ids = {contact_data["id"] for contact_data in assigned_to_data}
+        if not all("contact" in contact_data for contact_data in assigned_to_data):
+            self.ensure_contacts_exist(wanted_ids)
 
-    def delete_removed_subtasks(self, removed_subtask_ids):
-        """
-        Delete subtasks that are no longer present in the updated data.
-        """
-        for subtask_id in removed_subtask_ids:
-            Subtask.objects.get(id=subtask_id).delete()
+        through = Task.assigned_to.through
+        current_ids = set(through.objects.filter(task_id=instance.pk).values_list("contact_id", flat=True))
+        added_ids = wanted_ids - current_ids
+        removed_ids = current_ids - wanted_ids
 
-    def handle_assigned_to(self, instance, assigned_to_data):
+        if added_ids:
+            through.objects.bulk_create(
+                [through(task_id=instance.pk, contact_id=contact_id) for contact_id in added_ids]
+            )
+        if removed_ids:
+            through.objects.filter(task_id=instance.pk, contact_id__in=removed_ids).delete()
+
+    def ensure_contacts_exist(self, contact_ids):
         """
-        Set the assigned contacts for a task instance.
+        Raise a validation error listing every contact id that does not exist in the context's sandbox (or among
+        the shared contacts), using a single query.
         """
-        if not assigned_to_data:
-            instance.assigned_to.set([])
+        if not contact_ids:
             return
-        instance.assigned_to.clear()
-        for contact_data in assigned_to_data:
-            contact_id = contact_data.get("id")
-            contact = Contact.objects.get(id=contact_id)
-            instance.assigned_to.add(contact)
-
+        contacts = Contact.objects.filter(id__in=contact_ids, sandbox_id=self.context.get("sandbox_id"))
+        found_ids = set(contacts.values_list("id", flat=True))
+        missing_ids = sorted(str(contact_id) for contact_id in contact_ids - found_ids)
+        if missing_ids:
+            raise serializers.ValidationError(
+                {"assigned_to": [f"Contact with id {contact_id} does not exist." for contact_id in missing_ids]}
+            )
+
+    @transaction.atomic
     def create(self, validated_data):
         """
         Create a new Task instance with nested subtasks and assigned contacts.
@@ -137,6 +170,7 @@ class TaskSerializer(serializers.ModelSerializer):
         task.save()
         return task
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         """
         Update a Task instance with nested subtasks and assigned contacts.
@@ -152,3 +186,12 @@ class TaskSerializer(serializers.ModelSerializer):
 
         instance.save()
         return instance
+
+
+class TaskContactRefSerializer(TaskSerializer):
+    """
+    Read-only Task serializer that references assigned contacts by ID, initials, and colour only.
+    Full contact data is side-loaded once per response by the view.
+    """
+
+    assigned_to = ContactRefSerializer(many=True, read_only=True)
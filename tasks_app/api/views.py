@@ -2,21 +2,257 @@
 ViewSets and API views for managing tasks and providing summary statistics.
 """
 
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Count, Max, Prefetch, Subquery
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.viewsets import ModelViewSet
 from rest_framework.generics import ListAPIView
 from rest_framework import status
 from rest_framework.response import Response
-from tasks_app.models import Task
-from tasks_app.api.serializers import TaskSerializer
+from tasks_app.models import Task, Subtask
+from tasks_app.api.serializers import TaskSerializer, TaskContactRefSerializer
+from tasks_app.api.mixins import BulkTaskMixin
+from tasks_app.api.filters import filter_tasks
+from tasks_app.search import search_task_ids
+from tasks_app.utils import (
+    EXPORT_TASK_COLUMNS,
+    aggregate_task_summary,
+    build_board,
+    format_task_summary,
+    collect_task_changes,
+    committed_task_change_seq,
+    iter_task_export_rows,
+    read_task_summary,
+    task_changes_are_available,
+)
+from contacts_app.models import Contact
+from contacts_app.api.serializers import ContactIDSerializer
+from tasks_app.api.pagination import TaskCursorPagination
+from backend_join.conditional import conditional_get
+from backend_join.export import EXPORT_CHUNK_SIZE, EXPORT_FORMAT_PATTERN, stream_export
+from user_auth_app.sandbox import get_request_sandbox_id
 
 
-class TaskViewSet(ModelViewSet):
+class TaskViewSet(BulkTaskMixin, ModelViewSet):
     """
-    API endpoint for listing, creating, retrieving, updating, and deleting tasks.
+    API endpoint for listing, creating, retrieving, updating, and deleting tasks, individually or in bulk.
+    Guests only see and write the tasks of their own sandbox; everyone else works on the shared tasks.
     """
 
-    queryset = Task.objects.all()
     serializer_class = TaskSerializer
+    pagination_class = TaskCursorPagination
+
+    filtered_actions = ("list", "board", "export")
+    search_default_limit = 50
+    search_max_limit = 200
+    changes_default_limit = 500
+    changes_max_limit = 2000
+    field_columns = {"prio_display": "prio", "status_display": "status"}
+
+    def get_queryset(self):
+        """
+        Return the tasks of the request's scope with subtasks and assigned contacts prefetched to avoid per-task
+        queries. List endpoints apply the query-parameter filters and load only the columns of requested ?fields=.
+        """
+        prefetches = {
+            "subtasks": Prefetch("subtasks", queryset=Subtask.objects.only("id", "task_id", "text", "status")),
+            "assigned_to": Prefetch("assigned_to", queryset=Contact.objects.only(*ContactIDSerializer.Meta.fields)),
+        }
+        queryset = Task.objects.filter(sandbox_id=self.get_sandbox_id())
+        fields = self.get_requested_fields()
+        if fields:
+            columns = {"id", "date"} | {self.field_columns.get(name, name) for name in fields}
+            queryset = queryset.only(*(columns - prefetches.keys()))
+            prefetches = {name: prefetch for name, prefetch in prefetches.items() if name in fields}
+        queryset = queryset.prefetch_related(*prefetches.values())
+        if self.action in self.filtered_actions:
+            queryset = filter_tasks(queryset, self.request.query_params)
+        return queryset
+
+    def get_sandbox_id(self):
+        """
+        Return the guest sandbox of the request, or None for the shared tasks.
+        """
+        return get_request_sandbox_id(self.request)
+
+    def get_requested_fields(self):
+        """
+        Return the validated ?fields= selection for list requests, or None to return all fields.
+        """
+        if self.action != "list" or not self.request.query_params.get("fields"):
+            return None
+        fields = [name.strip() for name in self.request.query_params["fields"].split(",") if name.strip()]
+        unknown = [name for name in fields if name not in TaskSerializer.Meta.fields]
+        if unknown:
+            raise ValidationError({"fields": [f"Unknown field(s): {', '.join(unknown)}."]})
+        return fields
+
+    def get_serializer_context(self):
+        """
+        Pass the requested field selection and the sandbox that assigned contacts must belong to to the serializer.
+        """
+        context = super().get_serializer_context()
+        context["fields"] = self.get_requested_fields()
+        context["sandbox_id"] = self.get_sandbox_id()
+        return context
+
+    def perform_create(self, serializer):
+        """
+        Create the task in the request's sandbox.
+        """
+        serializer.save(sandbox_id=self.get_sandbox_id())
+
+    def get_list_version(self, request, *args, **kwargs):
+        """
+        Return the version of the filtered task list in one query: task count and latest task and contact change,
+        both within the request's sandbox.
+        No Last-Modified, as deleting a task does not move the latest change; the count in the ETag covers it.
+        """
+        queryset = self.filter_queryset(self.get_queryset()).prefetch_related(None).order_by()
+        contacts = Contact.objects.filter(sandbox_id=self.get_sandbox_id())
+        latest_contact = contacts.order_by("-updated_at").values("updated_at")[:1]
+        version = queryset.aggregate(
+            count=Count("pk"), updated=Max("updated_at"), contacts_updated=Max(Subquery(latest_contact))
+        )
+        return f"{version['count']}|{version['updated']}|{version['contacts_updated']}", None
+
+    def get_object_version(self, request, *args, **kwargs):
+        """
+        Return the version of one task from its own and its assigned contacts' updated_at, or None if not found.
+        """
+        try:
+            row = (
+                Task.objects.filter(
+                    pk=kwargs.get(self.lookup_url_kwarg or self.lookup_field), sandbox_id=self.get_sandbox_id()
+                )
+                .annotate(contacts_updated=Max("assigned_to__updated_at"))
+                .values_list("updated_at", "contacts_updated")
+                .first()
+            )
+        except (TypeError, ValueError, DjangoValidationError):
+            return None
+        if row is None:
+            return None
+        updated, contacts_updated = row
+        return f"{updated}|{contacts_updated}", max(filter(None, row))
+
+    @conditional_get("get_object_version")
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Retrieve a task; answers If-None-Match / If-Modified-Since with 304 if it has not changed.
+        """
+        return super().retrieve(request, *args, **kwargs)
+
+    @conditional_get("get_list_version")
+    def list(self, request, *args, **kwargs):
+        """
+        List tasks; with ?contacts=sideload, assignees are references and full contacts are side-loaded once.
+        Answers If-None-Match with 304 if no listed task or contact has changed.
+        """
+        if request.query_params.get("contacts") != "sideload":
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        tasks = list(queryset) if page is None else page
+        results = TaskContactRefSerializer(tasks, many=True, context=self.get_serializer_context()).data
+        contacts = self.get_sideloaded_contacts(tasks)
+        if page is None:
+            return Response({"results": results, "contacts": contacts})
+        response = self.get_paginated_response(results)
+        response.data["contacts"] = contacts
+        return response
+
+    def get_sideloaded_contacts(self, tasks):
+        """
+        Return a de-duplicated mapping of contact ID to full contact data for all assignees of the given tasks.
+        """
+        fields = self.get_requested_fields()
+        if fields and "assigned_to" not in fields:
+            return {}
+        contacts = {}
+        for task in tasks:
+            for contact in task.assigned_to.all():
+                contacts.setdefault(str(contact.id), contact)
+        return {contact_id: ContactIDSerializer(contact).data for contact_id, contact in contacts.items()}
+
+    @action(detail=False, methods=["get"], url_path="board")
+    def board(self, request):
+        """
+        Return the compact board projection: task fields, assignee initials/colours, and subtask counts.
+        """
+        return Response(build_board(self.get_queryset()))
+
+    @action(detail=False, methods=["get"], url_path=rf"export/(?P<export_format>{EXPORT_FORMAT_PATTERN})")
+    def export(self, request, export_format):
+        """
+        Stream all tasks with assignee IDs and subtasks as CSV or NDJSON in constant memory.
+        """
+        rows = iter_task_export_rows(self.filter_queryset(self.get_queryset()), EXPORT_CHUNK_SIZE)
+        return stream_export(rows, EXPORT_TASK_COLUMNS, export_format, "tasks")
+
+    @action(detail=False, methods=["get"], url_path="search")
+    def search(self, request):
+        """
+        Full-text search over titles, descriptions, and subtasks; returns matching task IDs, best match first.
+        Sandbox tasks are not in the search index and are searched by substring within the sandbox.
+        """
+        try:
+            limit = int(request.query_params.get("limit", self.search_default_limit))
+        except ValueError:
+            raise ValidationError({"limit": ["A valid integer is required."]})
+        limit = max(1, min(limit, self.search_max_limit))
+        sandbox_id = self.get_sandbox_id()
+        queryset = Task.objects.filter(sandbox_id=sandbox_id) if sandbox_id else None
+        task_ids = search_task_ids(request.query_params.get("q", ""), limit=limit, queryset=queryset)
+        return Response({"results": [str(task_id) for task_id in task_ids]})
+
+    @action(detail=False, methods=["get"], url_path="changes")
+    def changes(self, request):
+        """
+        Delta sync: return tasks changed after ?since=<cursor>, plus tombstones of deleted tasks and subtasks.
+        Without since, only the current cursor is returned; a stale cursor returns 410 and requires a full reload.
+        """
+        since = self.parse_int_param(request, "since", None)
+        limit = max(1, min(self.parse_int_param(request, "limit", self.changes_default_limit), self.changes_max_limit))
+        if since is None:
+            cursor = committed_task_change_seq()
+            return Response(
+                {"cursor": cursor, "has_more": False, "tasks": [], "deleted": {"tasks": [], "subtasks": []}}
+            )
+        if not task_changes_are_available(since):
+            return Response(
+                {"detail": "Changes since this cursor are no longer available; reload all tasks."},
+                status=status.HTTP_410_GONE,
+            )
+        changed, deleted_tasks, deleted_subtasks, cursor, has_more = collect_task_changes(
+            since, limit, self.get_sandbox_id()
+        )
+        tasks = self.get_queryset().filter(pk__in=changed).in_bulk() if changed else {}
+        deleted_tasks += [task_id for task_id in changed if task_id not in tasks]
+        data = self.get_serializer([tasks[task_id] for task_id in changed if task_id in tasks], many=True).data
+        return Response(
+            {
+                "cursor": cursor,
+                "has_more": has_more,
+                "tasks": data,
+                "deleted": {
+                    "tasks": [str(task_id) for task_id in deleted_tasks],
+                    "subtasks": [str(subtask_id) for subtask_id in deleted_subtasks],
+                },
+            }
+        )
+
+    def parse_int_param(self, request, name, default):
+        """
+        Return a non-negative integer query parameter, the default if it is missing, or raise a ValidationError.
+        """
+        value = request.query_params.get(name)
+        if value is None:
+            return default
+        if not value.isdigit():
+            raise ValidationError({name: ["A non-negative integer is required."]})
+        return int(value)
 
 
 class SummaryView(ListAPIView):
@@ -29,29 +265,11 @@ class SummaryView(ListAPIView):
 
     def get(self, request, *args, **kwargs):
         """
-        Return summary statistics for all tasks. If no tasks exist, return zeros for all fields.
-        """
-        tasks = self.get_queryset()
-        if not tasks.exists():
-            data = {
-                "todos": 0,
-                "in_progress": 0,
-                "await_feedback": 0,
-                "done": 0,
-                "total": 0,
-                "urgent": 0,
-                "next_urgent_due": None,
-            }
-            return Response(data, status=status.HTTP_200_OK)
-        tasks_date_sort = tasks.order_by("date")
-        next_urgent_due = tasks_date_sort.first().date if tasks_date_sort else None
-        data = {
-            "todos": tasks.filter(status="toDo").count(),
-            "in_progress": tasks.filter(status="inProgress").count(),
-            "await_feedback": tasks.filter(status="awaitFeedback").count(),
-            "done": tasks.filter(status="done").count(),
-            "total": tasks.count(),
-            "urgent": tasks.filter(prio="urgent").count(),
-            "next_urgent_due": next_urgent_due.strftime("%Y-%m-%d") if next_urgent_due else None,
-        }
-        return Response(data)
+        Return summary statistics for all tasks, read from the materialized summary counters.
+        Guests get the summary of their sandbox, aggregated from its few tasks.
+        """
+        sandbox_id = get_request_sandbox_id(request)
+        summary = (
+            aggregate_task_summary(Task.objects.filter(sandbox_id=sandbox_id)) if sandbox_id else read_task_summary()
+        )
+        return Response(format_task_summary(summary), status=status.HTTP_200_OK)
@@ -7,10 +7,16 @@ from django.apps import AppConfig
 
 class TasksAppConfig(AppConfig):
     """
-    Configuration for the Tasks Management app, including verbose names.
+    Configuration for the Tasks Management app, including verbose names and signal registration.
     """
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "tasks_app"
     verbose_name = "Tasks Management"
     verbose_name_plural = "Tasks Management"
+
+    def ready(self):
+        """
+        Import signals to ensure they are registered when the app is ready.
+        """
+        import tasks_app.signals
@@ -0,0 +1,24 @@
+"""
+Management command to prune old rows from the task change log.
+"""
+
+import datetime
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from tasks_app.utils import prune_task_changes
+
+
+class Command(BaseCommand):
+    """
+    Delete task change log rows older than the retention period; clients with older cursors must reload.
+    """
+
+    help = "Delete task change log rows older than the given number of days."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=30, help="Keep changes of the last N days (default: 30).")
+
+    def handle(self, *args, **options):
+        before = timezone.now() - datetime.timedelta(days=options["days"])
+        count = prune_task_changes(before)
+        self.stdout.write(self.style.SUCCESS(f"Pruned {count} task change log rows."))
@@ -0,0 +1,18 @@
+"""
+Management command to rebuild the full-text task search index.
+"""
+
+from django.core.management.base import BaseCommand
+from tasks_app.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    """
+    Rebuild the task search index from the Task and Subtask tables.
+    """
+
+    help = "Rebuild the full-text search index for tasks and subtasks."
+
+    def handle(self, *args, **options):
+        count = rebuild_search_index()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt task search index: {count} tasks indexed."))
@@ -0,0 +1,39 @@
+"""
+Management command to rebuild or verify the materialized task summary counters.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from tasks_app.utils import check_task_summary, rebuild_task_summary
+
+
+class Command(BaseCommand):
+    """
+    Rebuild the task summary counters from the Task table, or check them for consistency with --check.
+    """
+
+    help = "Rebuild the task summary counters from scratch, or verify them with --check."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only compare the counters with the Task table and fail if they differ.",
+        )
+
+    def handle(self, *args, **options):
+        if options["check"]:
+            self._check()
+            return
+        rows = rebuild_task_summary()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt task summary: {rows} counter rows written."))
+
+    def _check(self):
+        """
+        Report counter mismatches and raise a CommandError if any were found.
+        """
+        mismatches = check_task_summary()
+        for kind, key, stored, expected in mismatches:
+            self.stderr.write(f"{kind}:{key} stored={stored} expected={expected}")
+        if mismatches:
+            raise CommandError(f"Task summary is inconsistent: {len(mismatches)} counter(s) differ.")
+        self.stdout.write(self.style.SUCCESS("Task summary counters are consistent."))
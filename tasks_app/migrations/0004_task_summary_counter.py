@@ -0,0 +1,43 @@
+# Generated by Django 5.2 on 2026-10-18 15:10
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_summary_counters(apps, schema_editor):
+    Task = apps.get_model('tasks_app', 'Task')
+    TaskSummaryCounter = apps.get_model('tasks_app', 'TaskSummaryCounter')
+    counters = []
+    for status, count in Task.objects.order_by().values_list('status').annotate(count=Count('pk')):
+        counters.append(TaskSummaryCounter(kind='status', key=status, count=count))
+    for prio, count in Task.objects.order_by().values_list('prio').annotate(count=Count('pk')):
+        counters.append(TaskSummaryCounter(kind='prio', key=prio, count=count))
+    urgent_open = Task.objects.filter(prio='urgent').exclude(status='done').order_by()
+    for date, count in urgent_open.values_list('date').annotate(count=Count('pk')):
+        counters.append(TaskSummaryCounter(kind='urgent_due', key=str(date), count=count))
+    TaskSummaryCounter.objects.bulk_create(counters)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks_app', '0003_alter_task_assigned_to_alter_task_description'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskSummaryCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('status', 'Status'), ('prio', 'Priority'), ('urgent_due', 'Urgent due date')], max_length=20)),
+                ('key', models.CharField(max_length=20)),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Task summary counter',
+                'verbose_name_plural': 'Task summary counters',
+                'constraints': [models.UniqueConstraint(fields=('kind', 'key'), name='unique_task_summary_counter')],
+            },
+        ),
+        migrations.RunPython(populate_summary_counters, migrations.RunPython.noop),
+    ]
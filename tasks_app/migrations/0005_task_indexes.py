@@ -0,0 +1,28 @@
+# Generated by Django 5.2 on 2026-10-18 15:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contacts_app", "0004_alter_contact_number"),
+        ("tasks_app", "0004_task_summary_counter"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(fields=["-date", "id"], name="task_date_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(fields=["status", "date"], name="task_status_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["prio", "status", "date"], name="task_prio_status_date_idx"
+            ),
+        ),
+    ]
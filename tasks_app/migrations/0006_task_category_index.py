@@ -0,0 +1,20 @@
+# Generated by Django 5.2 on 2026-10-18 15:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contacts_app", "0004_alter_contact_number"),
+        ("tasks_app", "0005_task_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["category", "date"], name="task_category_date_idx"
+            ),
+        ),
+    ]
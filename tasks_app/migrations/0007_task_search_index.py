@@ -0,0 +1,42 @@
+from collections import defaultdict
+
+from django.db import migrations
+
+from tasks_app.search import SEARCH_TABLE, create_search_table, drop_search_table, search_backend
+
+
+def create_and_fill_search_index(apps, schema_editor):
+    """
+    Create the full-text search table and index all existing tasks.
+    """
+    if not search_backend(schema_editor.connection):
+        return
+    create_search_table(schema_editor)
+    Task = apps.get_model("tasks_app", "Task")
+    Subtask = apps.get_model("tasks_app", "Subtask")
+    subtasks = defaultdict(list)
+    for task_id, text in Subtask.objects.values_list("task_id", "text").iterator():
+        subtasks[task_id].append(text)
+    rows = [
+        (task_id.hex, title, description or "", "\n".join(subtasks[task_id]))
+        for task_id, title, description in Task.objects.values_list("id", "title", "description").iterator()
+    ]
+    with schema_editor.connection.cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {SEARCH_TABLE} (task_id, title, description, subtasks) VALUES (%s, %s, %s, %s)", rows
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    drop_search_table(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks_app", "0006_task_category_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_and_fill_search_index, drop_search_index),
+    ]
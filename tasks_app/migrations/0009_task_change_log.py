@@ -0,0 +1,35 @@
+# Generated by Django 5.2 on 2026-10-18 15:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks_app", "0008_task_updated_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TaskChange",
+            fields=[
+                ("seq", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[("task", "Task"), ("subtask", "Subtask")],
+                        default="task",
+                        max_length=10,
+                    ),
+                ),
+                ("object_id", models.UUIDField()),
+                ("task_id", models.UUIDField()),
+                ("deleted", models.BooleanField(default=False)),
+                ("created_at", models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                "verbose_name": "Task change",
+                "verbose_name_plural": "Task changes",
+            },
+        ),
+    ]
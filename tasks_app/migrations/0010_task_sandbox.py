@@ -0,0 +1,38 @@
+# Generated by Django 5.2 on 2026-10-18 16:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks_app", "0009_task_change_log"),
+        ("user_auth_app", "0004_guest_sandbox"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="sandbox",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="tasks",
+                to="user_auth_app.guestsandbox",
+            ),
+        ),
+        migrations.AddField(
+            model_name="taskchange",
+            name="sandbox_id",
+            field=models.UUIDField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="taskchange",
+            index=models.Index(
+                fields=["sandbox_id", "seq"], name="task_change_sandbox_seq_idx"
+            ),
+        ),
+    ]
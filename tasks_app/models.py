@@ -2,9 +2,122 @@
 Models for storing tasks and subtasks, including priorities, categories, and assignments.
 """
 
-from django.db import models
+from collections import Counter
+from contextvars import ContextVar
+from django.db import IntegrityError, models, transaction
+from django.db.models import F
+from django.utils import timezone
 import uuid
+from backend_join.events import event_scope, queue_events
 from contacts_app.models import Contact
+from tasks_app.search import schedule_task_reindex
+
+TASK_SUMMARY_FIELDS = ("status", "prio", "date")
+TASK_SEARCH_FIELDS = ("title", "description")
+
+task_delete_applied_in_bulk = ContextVar("task_delete_applied_in_bulk", default=False)
+
+
+def summary_counter_keys(state):
+    """
+    Return the (kind, key) counter buckets a task with the given (status, prio, date) state contributes to.
+    Sandbox tasks have no state (None) and are not counted.
+    """
+    if state is None:
+        return []
+    status, prio, date = state
+    keys = [(TaskSummaryCounter.KIND_STATUS, status), (TaskSummaryCounter.KIND_PRIO, prio)]
+    if prio == "urgent" and status != "done" and date:
+        keys.append((TaskSummaryCounter.KIND_URGENT_DUE, str(date)))
+    return keys
+
+
+def task_summary_state(sandbox_id, state):
+    """
+    Return the summary state of a task in the given sandbox: the state itself, or None for sandbox tasks.
+    """
+    return None if sandbox_id is not None else tuple(state)
+
+
+class TaskQuerySet(models.QuerySet):
+    """
+    QuerySet for Task that keeps the summary counters, search index, and change log in sync for bulk operations.
+    """
+
+    def bulk_create(self, objs, *args, **kwargs):
+        """
+        Bulk insert tasks, add their states to the summary counters, log them, and schedule search indexing.
+        """
+        with transaction.atomic(using=self.db):
+            objs = super().bulk_create(objs, *args, **kwargs)
+            TaskSummaryCounter.apply_changes(added=[task.summary_state for task in objs])
+            TaskChange.record_tasks([(task.pk, task.sandbox_id) for task in objs])
+            schedule_task_reindex(task.pk for task in objs if task.sandbox_id is None)
+        for task in objs:
+            task._summary_state = task.summary_state
+        return objs
+
+    def update(self, **kwargs):
+        """
+        Update tasks in bulk and log them, moving their states between summary counters if summary fields
+        change and scheduling a search reindex if their title or description changes.
+        This also covers bulk_update(), which is implemented on top of update().
+        """
+        summary_changed = bool(set(TASK_SUMMARY_FIELDS).intersection(kwargs))
+        search_changed = bool(set(TASK_SEARCH_FIELDS).intersection(kwargs))
+        with transaction.atomic(using=self.db):
+            rows = list(self.values_list("pk", "sandbox_id", *TASK_SUMMARY_FIELDS))
+            updated = super().update(**kwargs)
+            if summary_changed:
+                removed = [task_summary_state(row[1], row[2:]) for row in rows]
+                added = self._states_after_update(rows, kwargs)
+                TaskSummaryCounter.apply_changes(removed=removed, added=added)
+            if search_changed:
+                schedule_task_reindex(row[0] for row in rows)
+            TaskChange.record_tasks([row[:2] for row in rows])
+        return updated
+
+    def touch(self):
+        """
+        Bump updated_at of the tasks, e.g. after their subtasks or assignments changed.
+        """
+        return self.update(updated_at=timezone.now())
+
+    def delete(self):
+        """
+        Delete tasks, remove their states from the summary counters, and log tombstones in one pass
+        instead of per task.
+        """
+        with transaction.atomic(using=self.db):
+            rows = list(self.values_list("pk", "sandbox_id", *TASK_SUMMARY_FIELDS))
+            token = task_delete_applied_in_bulk.set(True)
+            try:
+                result = super().delete()
+            finally:
+                task_delete_applied_in_bulk.reset(token)
+            TaskSummaryCounter.apply_changes(removed=[task_summary_state(row[1], row[2:]) for row in rows])
+            TaskChange.record_tasks([row[:2] for row in rows], deleted=True)
+        return result
+
+    def _states_after_update(self, rows, kwargs, batch_size=500):
+        """
+        Derive the new task states from the update values, re-reading them if expressions were used.
+        """
+        if not any(hasattr(kwargs.get(field), "resolve_expression") for field in TASK_SUMMARY_FIELDS):
+            return [
+                task_summary_state(
+                    row[1], tuple(kwargs.get(field, value) for field, value in zip(TASK_SUMMARY_FIELDS, row[2:]))
+                )
+                for row in rows
+            ]
+        pks = [row[0] for row in rows]
+        states = []
+        for start in range(0, len(pks), batch_size):
+            batch = self.model._base_manager.filter(pk__in=pks[start : start + batch_size])
+            states.extend(
+                task_summary_state(row[0], row[1:]) for row in batch.values_list("sandbox_id", *TASK_SUMMARY_FIELDS)
+            )
+        return states
 
 
 class Task(models.Model):
@@ -35,15 +148,73 @@ class Task(models.Model):
     prio = models.CharField(max_length=10, choices=PRIORITY_CHOICES, default="medium")
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="toDo")
     assigned_to = models.ManyToManyField(Contact, related_name="tasks", blank=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    sandbox = models.ForeignKey(
+        "user_auth_app.GuestSandbox",
+        on_delete=models.CASCADE,
+        related_name="tasks",
+        blank=True,
+        null=True,
+        editable=False,
+    )
+
+    objects = TaskQuerySet.as_manager()
 
     def __str__(self):
         """Return the task's title as string representation."""
         return self.title
 
+    def save(self, *args, update_fields=None, **kwargs):
+        """
+        Save the task; a save limited to some fields also writes updated_at.
+        """
+        if update_fields is not None:
+            update_fields = {*update_fields, "updated_at"}
+        super().save(*args, update_fields=update_fields, **kwargs)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remember the loaded summary state so later saves can update the summary counters without a lookup.
+        """
+        instance = super().from_db(db, field_names, values)
+        if all(field in instance.__dict__ for field in ("sandbox_id", *TASK_SUMMARY_FIELDS)):
+            instance._summary_state = instance.summary_state
+        return instance
+
+    @property
+    def summary_state(self):
+        """Return the (status, prio, date) tuple that determines the task's summary counters, None in a sandbox."""
+        return task_summary_state(self.sandbox_id, tuple(getattr(self, field) for field in TASK_SUMMARY_FIELDS))
+
     class Meta:
         ordering = ["-date"]
         verbose_name = "Task"
         verbose_name_plural = "Tasks"
+        indexes = [
+            models.Index(fields=["-date", "id"], name="task_date_id_idx"),
+            models.Index(fields=["status", "date"], name="task_status_date_idx"),
+            models.Index(fields=["prio", "status", "date"], name="task_prio_status_date_idx"),
+            models.Index(fields=["category", "date"], name="task_category_date_idx"),
+        ]
+
+
+class SubtaskQuerySet(models.QuerySet):
+    """
+    QuerySet for Subtask that logs tombstones for bulk deletes.
+    """
+
+    def delete(self, rows=None):
+        """
+        Delete subtasks and log a tombstone for each of them.
+        Callers that already know the deleted (subtask_id, task_id, sandbox_id) rows pass them to skip the lookup.
+        """
+        with transaction.atomic(using=self.db):
+            if rows is None:
+                rows = list(self.values_list("pk", "task_id", "task__sandbox_id"))
+            result = super().delete()
+            TaskChange.record_subtask_deletions(rows)
+        return result
 
 
 class Subtask(models.Model):
@@ -61,11 +232,164 @@ class Subtask(models.Model):
     text = models.TextField()
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="unchecked")
 
+    objects = SubtaskQuerySet.as_manager()
+
     def __str__(self):
         """Return the subtask's text as string representation."""
         return self.text
 
+    @property
+    def task_sandbox_id(self):
+        """Return the sandbox of the subtask's task, loading only that column if the task is not cached."""
+        if Subtask.task.is_cached(self):
+            return self.task.sandbox_id
+        return Task._base_manager.filter(pk=self.task_id).values_list("sandbox_id", flat=True).first()
+
+    def delete(self, *args, **kwargs):
+        """
+        Delete the subtask, log its tombstone, bump its task's updated_at, and schedule a search reindex.
+        """
+        subtask_id, sandbox_id = self.pk, self.task_sandbox_id
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            TaskChange.record_subtask_deletions([(subtask_id, self.task_id, sandbox_id)])
+            Task.objects.filter(pk=self.task_id).touch()
+            schedule_task_reindex([self.task_id])
+        return result
+
     class Meta:
         ordering = ["id"]
         verbose_name = "Subtask"
         verbose_name_plural = "Subtasks"
+
+
+class TaskSummaryCounter(models.Model):
+    """
+    Materialized task summary: number of tasks per status, per priority, and per due date of open urgent tasks.
+    """
+
+    KIND_STATUS = "status"
+    KIND_PRIO = "prio"
+    KIND_URGENT_DUE = "urgent_due"
+
+    KIND_CHOICES = [
+        (KIND_STATUS, "Status"),
+        (KIND_PRIO, "Priority"),
+        (KIND_URGENT_DUE, "Urgent due date"),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    key = models.CharField(max_length=20)
+    count = models.IntegerField(default=0)
+
+    def __str__(self):
+        """Return the counter bucket and its value as string representation."""
+        return f"{self.kind}:{self.key}={self.count}"
+
+    @classmethod
+    def apply_changes(cls, removed=(), added=()):
+        """
+        Decrement the counters of removed task states and increment those of added ones.
+        """
+        deltas = Counter()
+        for state in removed:
+            deltas.subtract(summary_counter_keys(state))
+        for state in added:
+            deltas.update(summary_counter_keys(state))
+        for (kind, key), delta in deltas.items():
+            if delta:
+                cls._apply_delta(kind, key, delta)
+
+    @classmethod
+    def _apply_delta(cls, kind, key, delta):
+        """
+        Atomically add delta to a counter bucket, creating the bucket if it does not exist yet.
+        """
+        if cls.objects.filter(kind=kind, key=key).update(count=F("count") + delta):
+            return
+        try:
+            with transaction.atomic():
+                cls.objects.create(kind=kind, key=key, count=delta)
+        except IntegrityError:
+            cls.objects.filter(kind=kind, key=key).update(count=F("count") + delta)
+
+    class Meta:
+        verbose_name = "Task summary counter"
+        verbose_name_plural = "Task summary counters"
+        constraints = [
+            models.UniqueConstraint(fields=["kind", "key"], name="unique_task_summary_counter"),
+        ]
+
+
+class TaskChange(models.Model):
+    """
+    Append-only change log for delta sync: one row per task write, task delete, or subtask delete.
+    The auto-incrementing seq is the sync cursor; a client asks for all changes after the last seq it saw.
+    Subtasks deleted together with their task are covered by the task's tombstone.
+    Changes of sandbox tasks carry the sandbox ID, so each sandbox only syncs its own changes.
+    """
+
+    KIND_TASK = "task"
+    KIND_SUBTASK = "subtask"
+
+    KIND_CHOICES = [
+        (KIND_TASK, "Task"),
+        (KIND_SUBTASK, "Subtask"),
+    ]
+
+    seq = models.BigAutoField(primary_key=True)
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES, default=KIND_TASK)
+    object_id = models.UUIDField()
+    task_id = models.UUIDField()
+    deleted = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    sandbox_id = models.UUIDField(blank=True, null=True)
+
+    def __str__(self):
+        """Return the sequence number and changed object as string representation."""
+        return f"#{self.seq} {self.kind}:{self.object_id}{' deleted' if self.deleted else ''}"
+
+    @classmethod
+    def record_tasks(cls, rows, deleted=False):
+        """
+        Log a change (or tombstone) for each (task_id, sandbox_id) row with one bulk insert and queue their events.
+        """
+        if rows:
+            cls.objects.bulk_create(
+                cls(kind=cls.KIND_TASK, object_id=task_id, task_id=task_id, deleted=deleted, sandbox_id=sandbox_id)
+                for task_id, sandbox_id in rows
+            )
+            action = "deleted" if deleted else "changed"
+            queue_events(
+                {"type": "task", "action": action, "id": str(task_id), **event_scope(sandbox_id)}
+                for task_id, sandbox_id in rows
+            )
+
+    @classmethod
+    def record_subtask_deletions(cls, rows):
+        """
+        Log a tombstone for each deleted (subtask_id, task_id, sandbox_id) row with one bulk insert and queue
+        their events.
+        """
+        if rows:
+            cls.objects.bulk_create(
+                cls(kind=cls.KIND_SUBTASK, object_id=subtask_id, task_id=task_id, deleted=True, sandbox_id=sandbox_id)
+                for subtask_id, task_id, sandbox_id in rows
+            )
+            queue_events(
+                {
+                    "type": "subtask",
+                    "action": "deleted",
+                    "id": str(subtask_id),
+                    "task_id": str(task_id),
+                    **event_scope(sandbox_id),
+                }
+                for subtask_id, task_id, sandbox_id in rows
+            )
+
+    class Meta:
+        verbose_name = "Task change"
+        verbose_name_plural = "Task changes"
+        indexes = [
+            models.Index(fields=["sandbox_id", "seq"], name="task_change_sandbox_seq_idx"),
+        ]
@@ -0,0 +1,172 @@
+"""
+Full-text search over task titles, descriptions, and subtask texts.
+
+The index lives in its own table: an FTS5 virtual table on SQLite and an InnoDB table with a
+FULLTEXT index on MySQL. Task and subtask writes schedule a reindex of the affected tasks, which
+runs once per transaction on commit. Other database backends fall back to a substring search, which also
+serves searches within a guest sandbox, as sandbox tasks are not indexed.
+"""
+
+import re
+import threading
+import uuid
+from collections import defaultdict
+from django.db import connection, transaction
+from django.db.models import Q
+
+SEARCH_TABLE = "tasks_app_task_search"
+SEARCH_INDEX_BATCH_SIZE = 500
+SEARCH_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+_pending = threading.local()
+
+
+def search_backend(conn=connection):
+    """
+    Return 'sqlite' or 'mysql' if the connection supports the search index, otherwise None.
+    """
+    return conn.vendor if conn.vendor in ("sqlite", "mysql") else None
+
+
+def create_search_table(schema_editor):
+    """
+    Create the search index table for the schema editor's database.
+    """
+    backend = search_backend(schema_editor.connection)
+    if backend == "sqlite":
+        schema_editor.execute(f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5(task_id, title, description, subtasks)")
+    elif backend == "mysql":
+        schema_editor.execute(
+            f"CREATE TABLE {SEARCH_TABLE} (task_id char(32) NOT NULL PRIMARY KEY, title longtext NOT NULL, "
+            "description longtext NOT NULL, subtasks longtext NOT NULL, "
+            "FULLTEXT KEY task_search_fulltext (title, description, subtasks)) ENGINE=InnoDB"
+        )
+
+
+def drop_search_table(schema_editor):
+    """
+    Drop the search index table, if the database has one.
+    """
+    if search_backend(schema_editor.connection):
+        schema_editor.execute(f"DROP TABLE IF EXISTS {SEARCH_TABLE}")
+
+
+def schedule_task_reindex(task_ids):
+    """
+    Reindex the given tasks when the current transaction commits, once per task.
+    """
+    pending = getattr(_pending, "task_ids", None)
+    if pending is None:
+        pending = _pending.task_ids = set()
+    pending.update(task_ids)
+    transaction.on_commit(_reindex_pending)
+
+
+def _reindex_pending():
+    """
+    Reindex all scheduled tasks; later callbacks of the same transaction find nothing left to do.
+    """
+    task_ids, _pending.task_ids = getattr(_pending, "task_ids", None), None
+    if task_ids:
+        reindex_tasks(task_ids)
+
+
+def reindex_tasks(task_ids):
+    """
+    Replace the index rows of the given tasks with their current texts; deleted and sandbox tasks are removed.
+    """
+    from tasks_app.models import Task, Subtask
+
+    if not search_backend():
+        return
+    task_ids = list(task_ids)
+    for start in range(0, len(task_ids), SEARCH_INDEX_BATCH_SIZE):
+        batch = task_ids[start : start + SEARCH_INDEX_BATCH_SIZE]
+        subtasks = defaultdict(list)
+        for task_id, text in Subtask.objects.filter(task_id__in=batch).values_list("task_id", "text"):
+            subtasks[task_id].append(text)
+        rows = [
+            (task_id.hex, title, description or "", "\n".join(subtasks[task_id]))
+            for task_id, title, description in Task.objects.filter(id__in=batch, sandbox__isnull=True).values_list(
+                "id", "title", "description"
+            )
+        ]
+        _write_index_rows([task_id.hex for task_id in map(_as_uuid, batch)], rows)
+
+
+def _write_index_rows(task_hexes, rows):
+    """
+    Delete the index rows of the given tasks and insert the new ones.
+    On SQLite the rows are found through the indexed task_id column with MATCH instead of a table scan.
+    """
+    with connection.cursor() as cursor:
+        if search_backend() == "sqlite":
+            match = "task_id : (" + " OR ".join(f'"{task_hex}"' for task_hex in task_hexes) + ")"
+            cursor.execute(
+                f"DELETE FROM {SEARCH_TABLE} WHERE rowid IN "
+                f"(SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s)",
+                [match],
+            )
+        else:
+            placeholders = ", ".join(["%s"] * len(task_hexes))
+            cursor.execute(f"DELETE FROM {SEARCH_TABLE} WHERE task_id IN ({placeholders})", task_hexes)
+        if rows:
+            cursor.executemany(
+                f"INSERT INTO {SEARCH_TABLE} (task_id, title, description, subtasks) VALUES (%s, %s, %s, %s)", rows
+            )
+
+
+def rebuild_search_index():
+    """
+    Rebuild the whole search index from the Task and Subtask tables and return the number of indexed tasks.
+    """
+    from tasks_app.models import Task
+
+    if not search_backend():
+        return 0
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {SEARCH_TABLE}")
+        task_ids = list(Task.objects.filter(sandbox__isnull=True).values_list("id", flat=True))
+        reindex_tasks(task_ids)
+    return len(task_ids)
+
+
+def search_task_ids(query, limit=50, queryset=None):
+    """
+    Return the IDs of tasks matching all words of the query, best match first.
+    A queryset (e.g. the tasks of a sandbox) restricts the search to its tasks with a substring search
+    over titles, descriptions, and subtask texts.
+    """
+    from tasks_app.models import Task
+
+    tokens = SEARCH_TOKEN_PATTERN.findall(query or "")
+    if not tokens:
+        return []
+    backend = search_backend()
+    if backend is None or queryset is not None:
+        queryset = Task.objects.all() if queryset is None else queryset
+        for token in tokens:
+            queryset = queryset.filter(
+                Q(title__icontains=token) | Q(description__icontains=token) | Q(subtasks__text__icontains=token)
+            )
+        return list(queryset.values_list("id", flat=True).distinct()[:limit])
+    if backend == "sqlite":
+        sql = f"SELECT task_id FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s ORDER BY rank LIMIT %s"
+        terms = " ".join(f'"{token}"*' for token in tokens)
+        params = [f"{{title description subtasks}} : ({terms})", limit]
+    else:
+        match = "MATCH (title, description, subtasks) AGAINST (%s IN BOOLEAN MODE)"
+        sql = f"SELECT task_id FROM {SEARCH_TABLE} WHERE {match} ORDER BY {match} DESC LIMIT %s"
+        expression = " ".join(f"+{token}*" for token in tokens)
+        params = [expression, expression, limit]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [_as_uuid(row[0]) for row in cursor.fetchall()]
+
+
+def _as_uuid(value):
+    """
+    Return value as UUID.
+    """
+    return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
@@ -0,0 +1,133 @@
+"""
+Signal handlers keeping the task summary counters, search index, change log, and updated_at in sync with task
+writes, and queuing change events for real-time clients.
+"""
+
+from django.db.models.signals import m2m_changed, pre_delete, pre_save, post_save, post_delete
+from django.dispatch import receiver
+from backend_join.events import event_scope, queue_event
+from contacts_app.models import Contact
+from .models import (
+    Task,
+    Subtask,
+    TaskChange,
+    TaskSummaryCounter,
+    TASK_SUMMARY_FIELDS,
+    task_delete_applied_in_bulk,
+    task_summary_state,
+)
+from .search import schedule_task_reindex
+
+
+@receiver(pre_save, sender=Task)
+def remember_task_summary_state(sender, instance, **kwargs):
+    """
+    Load the stored summary state of an existing task if it was not recorded when the task was loaded.
+    """
+    if instance._state.adding or hasattr(instance, "_summary_state"):
+        return
+    row = sender._base_manager.filter(pk=instance.pk).values_list("sandbox_id", *TASK_SUMMARY_FIELDS).first()
+    instance._summary_state = task_summary_state(row[0], row[1:]) if row else None
+
+
+@receiver(post_save, sender=Task)
+def update_task_summary_on_save(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Move a saved task between summary counters if its status, priority, or date changed.
+    """
+    old_state = None if created else getattr(instance, "_summary_state", None)
+    new_state = instance.summary_state
+    if old_state is not None and new_state is not None and update_fields is not None:
+        new_state = tuple(
+            new if field in update_fields else old for field, old, new in zip(TASK_SUMMARY_FIELDS, old_state, new_state)
+        )
+    if old_state != new_state:
+        TaskSummaryCounter.apply_changes(removed=[old_state] if old_state else [], added=[new_state])
+    instance._summary_state = new_state
+
+
+@receiver(post_delete, sender=Task)
+def update_task_summary_on_delete(sender, instance, **kwargs):
+    """
+    Remove a deleted task from the summary counters, unless a bulk delete already accounts for it.
+    """
+    if task_delete_applied_in_bulk.get():
+        return
+    state = getattr(instance, "_summary_state", None) or instance.summary_state
+    TaskSummaryCounter.apply_changes(removed=[state])
+
+
+@receiver(post_save, sender=Task)
+def log_task_save(sender, instance, **kwargs):
+    """
+    Log a saved task in the change log for delta sync.
+    """
+    TaskChange.record_tasks([(instance.pk, instance.sandbox_id)])
+
+
+@receiver(post_delete, sender=Task)
+def log_task_delete(sender, instance, **kwargs):
+    """
+    Log a tombstone for a deleted task, unless a bulk delete already logs it.
+    """
+    if not task_delete_applied_in_bulk.get():
+        TaskChange.record_tasks([(instance.pk, instance.sandbox_id)], deleted=True)
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def reindex_task_on_write(sender, instance, **kwargs):
+    """
+    Schedule a search reindex of a saved or deleted task; sandbox tasks are not indexed.
+    """
+    if instance.sandbox_id is None:
+        schedule_task_reindex([instance.pk])
+
+
+@receiver(post_save, sender=Subtask)
+def reindex_task_on_subtask_save(sender, instance, **kwargs):
+    """
+    Schedule a search reindex of the task a saved subtask belongs to.
+    Deletes are handled in Subtask.delete(), as a post_delete receiver would disable fast deletes.
+    """
+    schedule_task_reindex([instance.task_id])
+
+
+@receiver(post_save, sender=Subtask)
+def touch_task_on_subtask_save(sender, instance, **kwargs):
+    """
+    Bump updated_at of the task a saved subtask belongs to.
+    """
+    Task.objects.filter(pk=instance.task_id).touch()
+
+
+@receiver(post_save, sender=Subtask)
+def publish_subtask_save(sender, instance, **kwargs):
+    """
+    Queue a change event for a saved subtask; bulk subtask writes are announced by their task's event.
+    """
+    queue_event(
+        "subtask", "changed", instance.pk, task_id=str(instance.task_id), **event_scope(instance.task_sandbox_id)
+    )
+
+
+@receiver(m2m_changed, sender=Task.assigned_to.through)
+def touch_tasks_on_assignment_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Bump updated_at of tasks whose assigned contacts were added, removed, or cleared.
+    """
+    if action in ("post_add", "post_remove") and pk_set:
+        Task.objects.filter(pk__in=pk_set if reverse else [instance.pk]).touch()
+    elif action == "post_clear" and not reverse:
+        Task.objects.filter(pk=instance.pk).touch()
+    elif action == "pre_clear" and reverse:
+        Task.objects.filter(assigned_to=instance).touch()
+
+
+@receiver(pre_delete, sender=Contact)
+def touch_tasks_on_assigned_contact_delete(sender, instance, **kwargs):
+    """
+    Bump updated_at of the tasks a deleted contact is assigned to, as the cascade removes the assignments
+    without m2m_changed.
+    """
+    Task.objects.filter(assigned_to=instance).touch()
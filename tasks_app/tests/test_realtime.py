@@ -0,0 +1,131 @@
+import asyncio
+import datetime
+import json
+from unittest import mock
+from asgiref.testing import ApplicationCommunicator
+from django.contrib.auth.models import User
+from django.test import TestCase, TransactionTestCase
+from rest_framework.authtoken.models import Token
+from backend_join.events import EventBroker, InMemoryBroker, MAX_EVENT_BATCH, RESYNC_EVENTS, SUBSCRIBER_QUEUE_SIZE
+from backend_join.realtime import CLOSE_NOT_FOUND, CLOSE_UNAUTHORIZED, websocket_events
+from tasks_app.models import Task, Subtask
+
+
+class RecordingBroker(EventBroker):
+    def __init__(self):
+        self.batches = []
+
+    def publish(self, events):
+        self.batches.append(events)
+
+
+def create_task(title="Task"):
+    return Task.objects.create(title=title, category="User Story", date=datetime.date.today())
+
+
+class TaskEventTest(TestCase):
+    def setUp(self):
+        self.broker = RecordingBroker()
+        patcher = mock.patch("backend_join.events._broker", self.broker)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_events_are_published_once_per_transaction_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            task = create_task()
+            subtask = Subtask.objects.create(task=task, text="Step")
+            self.assertEqual(self.broker.batches, [])
+        self.assertEqual(len(self.broker.batches), 1)
+        self.assertEqual(
+            self.broker.batches[0],
+            [
+                {"type": "task", "action": "changed", "id": str(task.id)},
+                {"type": "subtask", "action": "changed", "id": str(subtask.id), "task_id": str(task.id)},
+            ],
+        )
+
+    def test_rolled_back_writes_publish_nothing(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            create_task()
+        self.assertTrue(callbacks)
+        self.assertEqual(self.broker.batches, [])
+
+    def test_deletes_publish_tombstone_events(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            task = create_task()
+            subtask = Subtask.objects.create(task=task, text="Step")
+        subtask_id = subtask.id
+        with self.captureOnCommitCallbacks(execute=True):
+            subtask.delete()
+            Task.objects.filter(pk=task.pk).delete()
+        self.assertIn(
+            {"type": "subtask", "action": "deleted", "id": str(subtask_id), "task_id": str(task.id)},
+            self.broker.batches[1],
+        )
+        self.assertIn({"type": "task", "action": "deleted", "id": str(task.id)}, self.broker.batches[1])
+
+    def test_large_bulk_writes_publish_resync(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Task.objects.bulk_create(
+                Task(title=f"Task {i}", category="User Story", date=datetime.date.today())
+                for i in range(MAX_EVENT_BATCH + 1)
+            )
+        self.assertEqual(self.broker.batches, [RESYNC_EVENTS])
+
+
+class InMemoryBrokerTest(TestCase):
+    def test_slow_subscriber_gets_resync(self):
+        async def scenario():
+            broker = InMemoryBroker()
+            subscription = broker.subscribe()
+            for i in range(SUBSCRIBER_QUEUE_SIZE + 1):
+                broker.publish([{"type": "task", "action": "changed", "id": str(i)}])
+            await asyncio.sleep(0)
+            first = await subscription.get()
+            subscription.close()
+            return first, broker.subscriptions
+
+        first, subscriptions = asyncio.run(scenario())
+        self.assertEqual(first, RESYNC_EVENTS)
+        self.assertEqual(subscriptions, set())
+
+
+class WebSocketEventsTest(TransactionTestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", email="testuser@example.com", password="Test@1234")
+        self.token = Token.objects.create(user=self.user)
+        self.broker = InMemoryBroker()
+        patcher = mock.patch("backend_join.events._broker", self.broker)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def communicator(self, path="/ws/events/", token=None):
+        query = f"token={token or self.token.key}".encode()
+        return ApplicationCommunicator(websocket_events, {"type": "websocket", "path": path, "query_string": query})
+
+    async def test_pushes_committed_changes(self):
+        communicator = self.communicator()
+        await communicator.send_input({"type": "websocket.connect"})
+        self.assertEqual((await communicator.receive_output(timeout=5))["type"], "websocket.accept")
+
+        self.broker.publish([{"type": "task", "action": "changed", "id": "42"}])
+        message = await communicator.receive_output(timeout=5)
+        self.assertEqual(json.loads(message["text"]), {"events": [{"type": "task", "action": "changed", "id": "42"}]})
+
+        await communicator.send_input({"type": "websocket.disconnect", "code": 1000})
+        await communicator.wait(timeout=5)
+        self.assertEqual(self.broker.subscriptions, set())
+
+    async def test_rejects_invalid_token(self):
+        communicator = self.communicator(token="invalid")
+        await communicator.send_input({"type": "websocket.connect"})
+        self.assertEqual(
+            await communicator.receive_output(timeout=5), {"type": "websocket.close", "code": CLOSE_UNAUTHORIZED}
+        )
+
+    async def test_rejects_unknown_path(self):
+        communicator = self.communicator(path="/ws/other/")
+        await communicator.send_input({"type": "websocket.connect"})
+        self.assertEqual(
+            await communicator.receive_output(timeout=5), {"type": "websocket.close", "code": CLOSE_NOT_FOUND}
+        )
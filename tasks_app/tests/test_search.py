@@ -0,0 +1,106 @@
+from django.test import TestCase
+from django.core.management import call_command
+from io import StringIO
+from rest_framework.test import APITestCase
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from django.contrib.auth.models import User
+from tasks_app.models import Task, Subtask
+from tasks_app.search import rebuild_search_index, reindex_tasks, search_task_ids
+import datetime
+
+
+def create_task(title, description="", **kwargs):
+    return Task.objects.create(
+        title=title, description=description, category="User Story", date=datetime.date.today(), **kwargs
+    )
+
+
+class TaskSearchIndexTest(TestCase):
+    def test_task_writes_are_indexed_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            task = create_task("Deploy pipeline", "Configure the staging server")
+        self.assertEqual(search_task_ids("staging"), [task.id])
+        self.assertEqual(search_task_ids("deplo"), [task.id])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            task.title = "Release checklist"
+            task.save()
+        self.assertEqual(search_task_ids("deploy"), [])
+        self.assertEqual(search_task_ids("release checklist"), [task.id])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            task.delete()
+        self.assertEqual(search_task_ids("release"), [])
+
+    def test_subtask_writes_are_indexed(self):
+        task = create_task("Prepare launch")
+        with self.captureOnCommitCallbacks(execute=True):
+            subtask = Subtask.objects.create(task=task, text="Order balloons")
+        self.assertEqual(search_task_ids("balloons"), [task.id])
+        with self.captureOnCommitCallbacks(execute=True):
+            subtask.delete()
+        self.assertEqual(search_task_ids("balloons"), [])
+
+    def test_bulk_writes_are_indexed_once_per_task(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            tasks = Task.objects.bulk_create(
+                Task(title=f"Bulk item {i}", category="User Story", date=datetime.date.today()) for i in range(3)
+            )
+            Task.objects.filter(pk=tasks[0].pk).update(title="Renamed entry")
+        self.assertGreaterEqual(len(callbacks), 1)
+        self.assertEqual(set(search_task_ids("bulk")), {tasks[1].id, tasks[2].id})
+        self.assertEqual(search_task_ids("renamed"), [tasks[0].id])
+
+    def test_results_are_ranked(self):
+        weak = create_task("Notes", "Mentions the invoice once among many other words about unrelated topics")
+        strong = create_task("Invoice", "Invoice invoice")
+        reindex_tasks([weak.id, strong.id])
+        self.assertEqual(search_task_ids("invoice"), [strong.id, weak.id])
+
+    def test_query_syntax_is_not_interpreted(self):
+        task = create_task("Fix bug", "AND OR NOT")
+        reindex_tasks([task.id])
+        self.assertEqual(search_task_ids('fix" OR "*'), [task.id])
+        self.assertEqual(search_task_ids("  ...  "), [])
+
+    def test_search_within_queryset_covers_subtasks(self):
+        task = create_task("Prepare launch", "Party")
+        other = create_task("Other launch")
+        Subtask.objects.create(task=task, text="Order balloons")
+        Subtask.objects.create(task=task, text="Order cake")
+        queryset = Task.objects.filter(pk__in=[task.pk, other.pk])
+        self.assertEqual(search_task_ids("balloons", queryset=queryset), [task.id])
+        self.assertEqual(search_task_ids("order launch", queryset=queryset), [task.id])
+        self.assertEqual(search_task_ids("balloons", queryset=Task.objects.filter(pk=other.pk)), [])
+
+    def test_rebuild_command(self):
+        task = create_task("Orphaned", "Not yet indexed")
+        out = StringIO()
+        call_command("rebuild_task_search", stdout=out)
+        self.assertIn("1 tasks indexed", out.getvalue())
+        self.assertEqual(search_task_ids("orphaned"), [task.id])
+        self.assertEqual(rebuild_search_index(), 1)
+
+
+class TaskSearchViewTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", email="testuser@example.com", password="Test@1234")
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        self.task = create_task("Quarterly report", "Collect figures")
+        create_task("Something else")
+        rebuild_search_index()
+
+    def test_search_returns_ranked_ids(self):
+        response = self.client.get("/api/tasks/search/", {"q": "quarterly figures"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"results": [str(self.task.id)]})
+
+    def test_search_without_query_returns_empty(self):
+        response = self.client.get("/api/tasks/search/")
+        self.assertEqual(response.data, {"results": []})
+
+    def test_search_invalid_limit(self):
+        response = self.client.get("/api/tasks/search/", {"q": "report", "limit": "many"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -2,7 +2,11 @@ from django.test import TestCase
 from tasks_app.models import Task, Subtask
 from tasks_app.api.serializers import TaskSerializer, SubtaskSerializer
 from contacts_app.models import Contact
+from django.db import connection
+from rest_framework.exceptions import ValidationError
+from django.test.utils import CaptureQueriesContext
 import datetime
+import uuid
 
 
 class TaskSerializerTest(TestCase):
@@ -239,6 +243,41 @@ class HandleSubtasksTest(TestCase):
         serializer.handle_subtasks(self.task, subtasks_data)
         self.assertEqual(self.task.subtasks.count(), 2)
 
+    def test_handle_subtasks_uses_bulk_queries(self):
+        existing = [Subtask.objects.create(task=self.task, text=f"Subtask {i}") for i in range(50)]
+        subtasks_data = [
+            {"id": subtask.id, "text": f"Changed {i}", "status": "checked"} for i, subtask in enumerate(existing[:25])
+        ]
+        subtasks_data += [
+            {"id": subtask.id, "text": subtask.text, "status": subtask.status} for subtask in existing[25:40]
+        ]
+        subtasks_data += [{"text": f"New {i}", "status": "unchecked"} for i in range(10)]
+
+        with CaptureQueriesContext(connection) as ctx:
+            TaskSerializer().handle_subtasks(self.task, subtasks_data)
+        statements = [query["sql"] for query in ctx.captured_queries if "SAVEPOINT" not in query["sql"]]
+
+        # select, bulk create, bulk update, delete, and one insert of the subtask tombstones
+        self.assertEqual(len(statements), 5)
+        self.assertEqual(self.task.subtasks.count(), 50)
+        self.assertEqual(self.task.subtasks.filter(text__startswith="Changed", status="checked").count(), 25)
+        self.assertFalse(Subtask.objects.filter(id__in=[subtask.id for subtask in existing[40:]]).exists())
+
+    def test_handle_subtasks_skips_unchanged_rows(self):
+        subtask = Subtask.objects.create(task=self.task, text="Same", status="checked")
+        with CaptureQueriesContext(connection) as ctx:
+            TaskSerializer().handle_subtasks(self.task, [{"id": subtask.id, "text": "Same", "status": "checked"}])
+        statements = [query["sql"] for query in ctx.captured_queries if "SAVEPOINT" not in query["sql"]]
+        self.assertEqual(len(statements), 1)
+
+    def test_handle_subtasks_does_not_touch_other_tasks_subtasks(self):
+        other_task = Task.objects.create(title="Other", category="User Story", date=datetime.date.today())
+        foreign = Subtask.objects.create(task=other_task, text="Foreign", status="unchecked")
+        TaskSerializer().handle_subtasks(self.task, [{"id": foreign.id, "text": "Hijacked", "status": "checked"}])
+        foreign.refresh_from_db()
+        self.assertEqual(foreign.text, "Foreign")
+        self.assertEqual(self.task.subtasks.get().text, "Hijacked")
+
 
 class TaskSerializerHandleAssignedToTest(TestCase):
     def setUp(self):
@@ -276,3 +315,50 @@ class TaskSerializerHandleAssignedToTest(TestCase):
             assigned_to_errors[0]["id"][0],
             "Contact with id 00000000-0000-0000-0000-000000000000 does not exist.",
         )
+
+    def test_handle_assigned_to_adds_and_removes_only_changed_links(self):
+        keep, drop, add = [
+            Contact.objects.create(name=f"Contact {i}", email=f"contact{i}@example.com") for i in range(3)
+        ]
+        self.task.assigned_to.add(keep, drop)
+        through = Task.assigned_to.through
+        kept_link_id = through.objects.get(task=self.task, contact=keep).id
+
+        with CaptureQueriesContext(connection) as ctx:
+            TaskSerializer().handle_assigned_to(self.task, [{"id": keep.id}, {"id": add.id}])
+        statements = [query["sql"] for query in ctx.captured_queries if "SAVEPOINT" not in query["sql"]]
+
+        self.assertEqual(len(statements), 4)
+        self.assertEqual(set(self.task.assigned_to.all()), {keep, add})
+        self.assertEqual(through.objects.get(task=self.task, contact=keep).id, kept_link_id)
+
+    def test_handle_assigned_to_without_changes_does_not_write(self):
+        contact = Contact.objects.create(name="Jane Doe", email="jane.doe@example.com")
+        self.task.assigned_to.add(contact)
+        with CaptureQueriesContext(connection) as ctx:
+            TaskSerializer().handle_assigned_to(self.task, [{"id": contact.id}, {"id": contact.id}])
+        statements = [query["sql"] for query in ctx.captured_queries if "SAVEPOINT" not in query["sql"]]
+        self.assertEqual(len(statements), 2)
+        self.assertTrue(all(sql.startswith("SELECT") for sql in statements))
+
+    def test_handle_assigned_to_unknown_contact_raises_validation_error(self):
+        unknown_id = uuid.UUID("00000000-0000-0000-0000-000000000001")
+        with self.assertRaises(ValidationError) as ctx:
+            TaskSerializer().handle_assigned_to(self.task, [{"id": unknown_id}])
+        self.assertEqual(ctx.exception.detail["assigned_to"][0], f"Contact with id {unknown_id} does not exist.")
+        self.assertFalse(self.task.assigned_to.exists())
+
+    def test_save_reuses_contacts_resolved_during_validation(self):
+        contacts = [Contact.objects.create(name=f"Contact {i}", email=f"contact{i}@example.com") for i in range(3)]
+        data = {"title": "Updated Task", "assigned_to": [{"id": str(contact.id)} for contact in contacts]}
+        serializer = TaskSerializer(instance=self.task, data=data, partial=True)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        with CaptureQueriesContext(connection) as ctx:
+            serializer.save()
+        contact_lookups = [
+            query["sql"]
+            for query in ctx.captured_queries
+            if 'FROM "contacts_app_contact"' in query["sql"] and "task_assigned_to" not in query["sql"]
+        ]
+        self.assertEqual(contact_lookups, [])
+        self.assertEqual(set(self.task.assigned_to.all()), set(contacts))
@@ -0,0 +1,142 @@
+from django.test import TestCase
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models import F
+from io import StringIO
+from tasks_app.models import Task, Subtask, TaskSummaryCounter
+from contacts_app.models import Contact
+from tasks_app.utils import aggregate_task_summary, check_task_summary, read_task_summary
+import datetime
+
+
+class TaskSummaryCounterSignalTest(TestCase):
+    def setUp(self):
+        self.today = datetime.date.today()
+
+    def _create_task(self, **kwargs):
+        data = {
+            "title": "Task",
+            "category": "User Story",
+            "date": self.today,
+            "prio": "medium",
+            "status": "toDo",
+        }
+        data.update(kwargs)
+        return Task.objects.create(**data)
+
+    def assertCountersMatchTasks(self):
+        self.assertEqual(check_task_summary(), [])
+        self.assertEqual(read_task_summary(), aggregate_task_summary(Task.objects.all()))
+
+    def test_counters_follow_create_update_and_delete(self):
+        task = self._create_task(prio="urgent")
+        self._create_task(status="done")
+        self.assertEqual(read_task_summary()["todos"], 1)
+        self.assertEqual(read_task_summary()["next_urgent_due"], self.today)
+
+        task.status = "done"
+        task.save()
+        self.assertCountersMatchTasks()
+        self.assertIsNone(read_task_summary()["next_urgent_due"])
+
+        task.delete()
+        self.assertCountersMatchTasks()
+        self.assertEqual(read_task_summary()["total"], 1)
+
+    def test_save_without_summary_changes_skips_counter_writes(self):
+        task = self._create_task()
+        task.title = "Renamed"
+        # the update and its change log row
+        with self.assertNumQueries(2):
+            task.save()
+
+    def test_save_of_deferred_instance_uses_stored_state(self):
+        task = self._create_task(prio="urgent")
+        deferred = Task.objects.only("id", "title").get(pk=task.pk)
+        deferred.status = "done"
+        deferred.save()
+        self.assertCountersMatchTasks()
+        self.assertIsNone(read_task_summary()["next_urgent_due"])
+
+    def test_bulk_create_and_queryset_update(self):
+        Task.objects.bulk_create(
+            [
+                Task(title=f"Task {i}", category="User Story", date=self.today, prio="urgent", status="toDo")
+                for i in range(5)
+            ]
+        )
+        self.assertCountersMatchTasks()
+
+        Task.objects.filter(status="toDo").update(status="inProgress")
+        self.assertCountersMatchTasks()
+        self.assertEqual(read_task_summary()["in_progress"], 5)
+
+        Task.objects.update(date=F("date") + datetime.timedelta(days=1))
+        self.assertCountersMatchTasks()
+
+        Task.objects.all().delete()
+        self.assertCountersMatchTasks()
+        self.assertEqual(read_task_summary()["total"], 0)
+
+    def test_bulk_update_moves_counters(self):
+        tasks = [self._create_task(prio="urgent") for _ in range(3)]
+        for task in tasks[:2]:
+            task.status = "done"
+        Task.objects.bulk_update(tasks, ["status"])
+        self.assertCountersMatchTasks()
+        self.assertEqual(read_task_summary()["done"], 2)
+
+
+class RebuildTaskSummaryCommandTest(TestCase):
+    def setUp(self):
+        Task.objects.create(
+            title="Task", category="User Story", date=datetime.date.today(), prio="urgent", status="toDo"
+        )
+
+    def test_check_passes_for_consistent_counters(self):
+        out = StringIO()
+        call_command("rebuild_task_summary", "--check", stdout=out)
+        self.assertIn("consistent", out.getvalue())
+
+    def test_check_fails_and_rebuild_repairs_drift(self):
+        TaskSummaryCounter.objects.filter(kind=TaskSummaryCounter.KIND_STATUS).update(count=42)
+        with self.assertRaises(CommandError):
+            call_command("rebuild_task_summary", "--check", stdout=StringIO(), stderr=StringIO())
+
+        call_command("rebuild_task_summary", stdout=StringIO())
+        self.assertEqual(check_task_summary(), [])
+        self.assertEqual(read_task_summary()["todos"], 1)
+
+
+class TaskUpdatedAtTest(TestCase):
+    def setUp(self):
+        self.task = Task.objects.create(title="Task", category="User Story", date=datetime.date.today())
+        self.contact = Contact.objects.create(name="John Doe", email="john.doe@example.com")
+        self.past = self.task.updated_at - datetime.timedelta(days=1)
+        Task.objects.filter(pk=self.task.pk).update(updated_at=self.past)
+
+    def assertTouched(self):
+        self.task.refresh_from_db()
+        self.assertGreater(self.task.updated_at, self.past)
+        Task.objects.filter(pk=self.task.pk).update(updated_at=self.past)
+
+    def test_subtask_save_and_delete_bump_task(self):
+        subtask = Subtask.objects.create(task=self.task, text="Step")
+        self.assertTouched()
+        subtask.delete()
+        self.assertTouched()
+
+    def test_assignment_changes_bump_task(self):
+        self.task.assigned_to.add(self.contact)
+        self.assertTouched()
+        self.task.assigned_to.remove(self.contact)
+        self.assertTouched()
+        self.contact.tasks.add(self.task)
+        self.assertTouched()
+        self.contact.tasks.clear()
+        self.assertTouched()
+
+    def test_save_with_update_fields_bumps_task(self):
+        self.task.title = "Renamed"
+        self.task.save(update_fields=["title"])
+        self.assertTouched()
@@ -5,6 +5,19 @@ from contacts_app.models import Contact
 import datetime
 from rest_framework.authtoken.models import Token
 from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from tasks_app.utils import check_task_summary, iter_task_export_rows, prune_task_changes
+from tasks_app.models import TaskChange
+from django.utils import timezone
+from django.utils.http import http_date
+import base64
+import csv
+import io
+import json
+import time
+from contacts_app.utils import get_color_from_profile_pic
+import uuid
 
 
 class TaskViewSetTest(APITestCase):
@@ -168,7 +181,704 @@ class SummaryViewTest(APITestCase):
         }
         self.assertEqual(response.data, expected_data)
 
+    def test_summary_view_next_urgent_due_ignores_done_and_non_urgent(self):
+        today = datetime.date.today()
+        Task.objects.create(
+            title="Early Medium Task",
+            category="User Story",
+            date=today - datetime.timedelta(days=10),
+            prio="medium",
+            status="toDo",
+        )
+        Task.objects.create(
+            title="Early Urgent Done Task",
+            category="User Story",
+            date=today - datetime.timedelta(days=5),
+            prio="urgent",
+            status="done",
+        )
+        Task.objects.create(
+            title="Later Urgent Task",
+            category="User Story",
+            date=today + datetime.timedelta(days=3),
+            prio="urgent",
+            status="toDo",
+        )
+        response = self.client.get("/api/tasks/summary/")
+        self.assertEqual(response.data["next_urgent_due"], str(today))
+
+        Task.objects.filter(prio="urgent", date=today).update(status="done")
+        response = self.client.get("/api/tasks/summary/")
+        self.assertEqual(response.data["next_urgent_due"], str(today + datetime.timedelta(days=3)))
+
+    def test_summary_view_reads_counters_without_scanning_tasks(self):
+        self.client.get("/api/tasks/summary/")
+        # the token lookup is cached by the first request
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/tasks/summary/")
+        self.assertEqual(response.data["total"], 4)
+
     def test_summary_view_method_not_allowed(self):
         response = self.client.post("/api/tasks/summary/")
         self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
         self.assertEqual(response.data, {"detail": 'Method "POST" not allowed.'})
+
+
+class TaskViewSetQueryCountTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", email="testuser@example.com", password="Test@1234")
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        self.contacts = [Contact.objects.create(name=f"Contact {i}", email=f"contact{i}@example.com") for i in range(3)]
+
+    def _create_tasks(self, count):
+        for i in range(count):
+            task = Task.objects.create(
+                title=f"Task {i}",
+                category="User Story",
+                date=datetime.date.today(),
+                prio="medium",
+                status="toDo",
+            )
+            task.assigned_to.add(*self.contacts)
+            Subtask.objects.create(task=task, text=f"Subtask {i}a", status="unchecked")
+            Subtask.objects.create(task=task, text=f"Subtask {i}b", status="checked")
+
+    def test_list_query_count_is_constant(self):
+        self._create_tasks(2)
+        self.client.get("/api/tasks/")
+        with CaptureQueriesContext(connection) as small_board:
+            response = self.client.get("/api/tasks/")
+        self.assertEqual(len(response.data), 2)
+
+        self._create_tasks(20)
+        with CaptureQueriesContext(connection) as large_board:
+            response = self.client.get("/api/tasks/")
+        self.assertEqual(len(response.data), 22)
+
+        self.assertEqual(len(small_board), len(large_board))
+        self.assertLessEqual(len(large_board), 5)
+
+    def test_list_includes_prefetched_relations(self):
+        self._create_tasks(1)
+        response = self.client.get("/api/tasks/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        task_data = response.data[0]
+        self.assertEqual(len(task_data["subtasks"]), 2)
+        self.assertEqual(len(task_data["assigned_to"]), 3)
+        self.assertIn("<svg", task_data["assigned_to"][0]["profile_pic"])
+
+
+class TaskCursorPaginationTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", email="testuser@example.com", password="Test@1234")
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        today = datetime.date.today()
+        for i in range(7):
+            Task.objects.create(
+                title=f"Task {i}",
+                category="User Story",
+                date=today - datetime.timedelta(days=i // 2),
+                prio="medium",
+                status="toDo",
+            )
+
+    def _walk_pages(self, url):
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(task["id"] for task in response.data["results"])
+            url = response.data["next"]
+        return ids
+
+    def test_list_without_pagination_params_returns_plain_list(self):
+        response = self.client.get("/api/tasks/")
+        self.assertIsInstance(response.data, list)
+        self.assertEqual(len(response.data), 7)
+
+    def test_pages_follow_date_and_id_ordering(self):
+        ids = self._walk_pages("/api/tasks/?page_size=3")
+        expected = [str(pk) for pk in Task.objects.order_by("-date", "id").values_list("id", flat=True)]
+        self.assertEqual(ids, expected)
+
+    def test_pages_stay_stable_under_concurrent_inserts(self):
+        first_page = self.client.get("/api/tasks/?page_size=3").data
+        Task.objects.create(
+            title="Inserted",
+            category="User Story",
+            date=datetime.date.today(),
+            prio="low",
+            status="toDo",
+        )
+        seen = [task["id"] for task in first_page["results"]] + self._walk_pages(first_page["next"])
+        self.assertEqual(len(seen), len(set(seen)))
+        originals = set(str(pk) for pk in Task.objects.exclude(title="Inserted").values_list("id", flat=True))
+        self.assertTrue(originals.issubset(seen))
+
+    def test_previous_link_returns_preceding_page(self):
+        first_page = self.client.get("/api/tasks/?page_size=3").data
+        second_page = self.client.get(first_page["next"]).data
+        self.assertIsNone(first_page["previous"])
+        previous_page = self.client.get(second_page["previous"]).data
+        self.assertEqual(previous_page["results"], first_page["results"])
+
+    def test_invalid_cursor_returns_not_found(self):
+        response = self.client.get("/api/tasks/?cursor=not-a-cursor")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_cursor_with_malformed_position_returns_not_found(self):
+        for position in (["notadate", "x"], ["2024-01-01", "zzz"], [{"a": 1}, None]):
+            cursor = base64.urlsafe_b64encode(json.dumps({"p": position}).encode()).decode()
+            response = self.client.get("/api/tasks/", {"cursor": cursor})
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND, position)
+
+
+class TaskBulkEndpointTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", email="testuser@example.com", password="Test@1234")
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        self.contacts = [Contact.objects.create(name=f"Contact {i}", email=f"contact{i}@example.com") for i in range(3)]
+        self.url = "/api/tasks/bulk/"
+
+    def _payload(self, i, **kwargs):
+        data = {
+            "title": f"Imported {i}",
+            "category": "Technical Task",
+            "date": "2025-04-02",
+            "prio": "urgent",
+            "status": "toDo",
+            "assigned_to": [{"id": str(contact.id)} for contact in self.contacts[:2]],
+            "subtasks": [{"text": f"Step {i}.{j}", "status": "unchecked"} for j in range(2)],
+        }
+        data.update(kwargs)
+        return data
+
+    def test_bulk_create_with_nested_data_and_per_item_errors(self):
+        payload = [self._payload(0), self._payload(1, prio="invalid"), self._payload(2)]
+        response = self.client.post(self.url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]
+        self.assertEqual([result["status"] for result in results], [201, 400, 201])
+        self.assertIn("prio", results[1]["errors"])
+
+        task = Task.objects.get(id=results[0]["id"])
+        self.assertEqual(task.subtasks.count(), 2)
+        self.assertEqual(set(task.assigned_to.all()), set(self.contacts[:2]))
+        self.assertEqual(Task.objects.count(), 2)
+        self.assertEqual(check_task_summary(), [])
+
+    def test_bulk_create_query_count_does_not_grow_with_items(self):
+        self.client.post(self.url, [self._payload("warm-up")], format="json")
+        with CaptureQueriesContext(connection) as small_batch:
+            self.client.post(self.url, [self._payload(i) for i in range(2)], format="json")
+        with CaptureQueriesContext(connection) as large_batch:
+            self.client.post(self.url, [self._payload(i) for i in range(20)], format="json")
+        self.assertEqual(len(small_batch), len(large_batch))
+        self.assertEqual(Task.objects.count(), 23)
+
+    def test_bulk_create_rejects_unknown_contact(self):
+        payload = [self._payload(0, assigned_to=[{"id": "00000000-0000-0000-0000-000000000000"}])]
+        response = self.client.post(self.url, payload, format="json")
+        self.assertEqual(response.data["results"][0]["status"], 400)
+        self.assertFalse(Task.objects.exists())
+
+    def test_bulk_update_tasks(self):
+        created = self.client.post(self.url, [self._payload(i) for i in range(3)], format="json").data["results"]
+        ids = [result["id"] for result in created]
+        payload = [
+            {"id": ids[0], "status": "done"},
+            {"id": ids[1], "subtasks": [{"text": "Only step", "status": "checked"}], "assigned_to": []},
+            {"id": "00000000-0000-0000-0000-000000000000", "status": "done"},
+        ]
+        response = self.client.patch(self.url, payload, format="json")
+        self.assertEqual([result["status"] for result in response.data["results"]], [200, 200, 404])
+
+        first, second, third = (Task.objects.get(id=task_id) for task_id in ids)
+        self.assertEqual(first.status, "done")
+        self.assertEqual(first.subtasks.count(), 2)
+        self.assertEqual(list(second.subtasks.values_list("text", flat=True)), ["Only step"])
+        self.assertFalse(second.assigned_to.exists())
+        self.assertEqual(third.status, "toDo")
+        self.assertEqual(check_task_summary(), [])
+
+    def test_bulk_delete_tasks(self):
+        created = self.client.post(self.url, [self._payload(i) for i in range(3)], format="json").data["results"]
+        ids = [result["id"] for result in created]
+        response = self.client.delete(self.url, ids[:2] + ["not-a-uuid"], format="json")
+        self.assertEqual([result["status"] for result in response.data["results"]], [204, 204, 404])
+        self.assertEqual(list(Task.objects.values_list("id", flat=True)), [uuid.UUID(ids[2])])
+        self.assertFalse(Subtask.objects.exclude(task_id=ids[2]).exists())
+        self.assertEqual(check_task_summary(), [])
+
+    def test_bulk_requires_list_body(self):
+        response = self.client.post(self.url, {"title": "Not a list"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TaskBoardViewTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", email="testuser@example.com", password="Test@1234")
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        self.contact = Contact.objects.create(name="John Doe", email="john.doe@example.com")
+        self.task = Task.objects.create(
+            title="Board Task",
+            description="A long description that the board does not need.",
+            category="User Story",
+            date=datetime.date.today(),
+            prio="urgent",
+            status="inProgress",
+        )
+        self.task.assigned_to.add(self.contact)
+        Subtask.objects.create(task=self.task, text="Done step", status="checked")
+        Subtask.objects.create(task=self.task, text="Open step", status="unchecked")
+
+    def test_board_returns_compact_projection(self):
+        response = self.client.get("/api/tasks/board/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.contact.refresh_from_db()
+        self.assertEqual(
+            response.data,
+            [
+                {
+                    "id": str(self.task.id),
+                    "title": "Board Task",
+                    "category": "User Story",
+                    "prio": "urgent",
+                    "status": "inProgress",
+                    "date": str(datetime.date.today()),
+                    "assigned_to": [
+                        {
+                            "id": str(self.contact.id),
+                            "initials": "JD",
+                            "color": get_color_from_profile_pic(self.contact.profile_pic),
+                        }
+                    ],
+                    "subtasks_done": 1,
+                    "subtasks_total": 2,
+                }
+            ],
+        )
+        self.assertIsNotNone(response.data[0]["assigned_to"][0]["color"])
+
+    def test_board_query_count_is_constant(self):
+        self.client.get("/api/tasks/board/")
+        with CaptureQueriesContext(connection) as small_board:
+            self.client.get("/api/tasks/board/")
+        for i in range(10):
+            task = Task.objects.create(title=f"Task {i}", category="User Story", date=datetime.date.today())
+            task.assigned_to.add(self.contact)
+        with CaptureQueriesContext(connection) as large_board:
+            response = self.client.get("/api/tasks/board/")
+        self.assertEqual(len(response.data), 11)
+        self.assertEqual(len(small_board), len(large_board))
+
+    def test_board_payload_is_smaller_than_full_list(self):
+        board = self.client.get("/api/tasks/board/")
+        full = self.client.get("/api/tasks/")
+        self.assertLess(len(board.content) * 3, len(full.content))
+
+
+class TaskSideloadContactsTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", email="testuser@example.com", password="Test@1234")
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        self.contact = Contact.objects.create(name="John Doe", email="john.doe@example.com")
+        self.other = Contact.objects.create(name="Jane Roe", email="jane.roe@example.com")
+        for i in range(3):
+            task = Task.objects.create(title=f"Task {i}", category="User Story", date=datetime.date.today())
+            task.assigned_to.add(self.contact, self.other)
+
+    def test_sideload_references_contacts_and_deduplicates_them(self):
+        response = self.client.get("/api/tasks/?contacts=sideload")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.contact.refresh_from_db()
+        self.assertEqual(len(response.data["results"]), 3)
+        self.assertEqual(set(response.data["contacts"]), {str(self.contact.id), str(self.other.id)})
+        self.assertEqual(response.data["contacts"][str(self.contact.id)]["profile_pic"], self.contact.profile_pic)
+        for task in response.data["results"]:
+            self.assertIn(
+                {
+                    "id": str(self.contact.id),
+                    "initials": "JD",
+                    "color": get_color_from_profile_pic(self.contact.profile_pic),
+                },
+                task["assigned_to"],
+            )
+
+    def test_sideload_with_pagination_keeps_links(self):
+        response = self.client.get("/api/tasks/?contacts=sideload&page_size=2")
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertIsNotNone(response.data["next"])
+        self.assertEqual(len(response.data["contacts"]), 2)
+
+    def test_sideload_payload_is_smaller_than_embedded_contacts(self):
+        sideloaded = self.client.get("/api/tasks/?contacts=sideload")
+        embedded = self.client.get("/api/tasks/")
+        self.assertLess(len(sideloaded.content), len(embedded.content))
+
+    def test_default_response_still_embeds_contacts(self):
+        response = self.client.get("/api/tasks/")
+        self.assertIn("profile_pic", response.data[0]["assigned_to"][0])
+
+
+class TaskExportTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", email="testuser@example.com", password="Test@1234")
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        self.contact = Contact.objects.create(name="John Doe", email="john.doe@example.com")
+        self.task = Task.objects.create(title="Export Task", category="User Story", date=datetime.date(2025, 1, 1))
+        self.task.assigned_to.add(self.contact)
+        self.subtask = Subtask.objects.create(task=self.task, text="Step, with comma", status="checked")
+
+    def test_export_ndjson(self):
+        response = self.client.get("/api/tasks/export/ndjson/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        row = json.loads(lines[0])
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(row["id"], str(self.task.id))
+        self.assertEqual(row["date"], "2025-01-01")
+        self.assertEqual(row["assigned_to"], [str(self.contact.id)])
+        self.assertEqual(
+            row["subtasks"], [{"id": str(self.subtask.id), "text": "Step, with comma", "status": "checked"}]
+        )
+
+    def test_export_csv(self):
+        response = self.client.get("/api/tasks/export/csv/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('filename="tasks.csv"', response["Content-Disposition"])
+        rows = list(csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode())))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["title"], "Export Task")
+        self.assertEqual(json.loads(rows[0]["assigned_to"]), [str(self.contact.id)])
+        self.assertEqual(json.loads(rows[0]["subtasks"])[0]["text"], "Step, with comma")
+
+    def test_export_unknown_format_returns_404(self):
+        response = self.client.get("/api/tasks/export/xml/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_export_reads_in_chunks(self):
+        for i in range(4):
+            Task.objects.create(title=f"Task {i}", category="User Story", date=datetime.date.today())
+        with CaptureQueriesContext(connection) as queries:
+            rows = list(iter_task_export_rows(Task.objects.all(), chunk_size=2))
+        self.assertEqual(
+            [row["id"] for row in rows], list(Task.objects.order_by("-date", "id").values_list("id", flat=True))
+        )
+        self.assertEqual(len(queries), 3 * 3)
+        task_queries = [query["sql"] for query in queries if 'FROM "tasks_app_task"' in query["sql"]]
+        self.assertEqual(len(task_queries), 3)
+        self.assertTrue(all("LIMIT 2" in sql for sql in task_queries))
+
+
+class TaskFilterTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", email="testuser@example.com", password="Test@1234")
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        self.contact = Contact.objects.create(name="John Doe", email="john.doe@example.com")
+        self.other = Contact.objects.create(name="Jane Roe", email="jane.roe@example.com")
+        today = datetime.date(2025, 6, 15)
+        self.bug = Task.objects.create(
+            title="Fix login bug",
+            description="Crash on submit",
+            category="Technical Task",
+            date=today,
+            prio="urgent",
+            status="toDo",
+        )
+        self.story = Task.objects.create(
+            title="Write story",
+            description="Onboarding flow for new users",
+            category="User Story",
+            date=today + datetime.timedelta(days=10),
+            prio="low",
+            status="done",
+        )
+        self.review = Task.objects.create(
+            title="Review design",
+            category="User Story",
+            date=today - datetime.timedelta(days=10),
+            prio="medium",
+            status="inProgress",
+        )
+        self.bug.assigned_to.add(self.contact, self.other)
+        self.story.assigned_to.add(self.other)
+
+    def get_ids(self, params):
+        response = self.client.get("/api/tasks/", params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        return {task["id"] for task in response.data}
+
+    def test_filter_by_choices(self):
+        self.assertEqual(self.get_ids({"status": "toDo"}), {str(self.bug.id)})
+        self.assertEqual(self.get_ids({"status": "toDo,done"}), {str(self.bug.id), str(self.story.id)})
+        self.assertEqual(self.get_ids({"prio": "medium"}), {str(self.review.id)})
+        self.assertEqual(self.get_ids({"category": "User Story", "prio": "low"}), {str(self.story.id)})
+
+    def test_filter_by_assigned_contact_without_duplicates(self):
+        response = self.client.get("/api/tasks/", {"assigned_to": f"{self.contact.id},{self.other.id}"})
+        self.assertEqual(len(response.data), 2)
+        self.assertEqual(self.get_ids({"assigned_to": str(self.contact.id)}), {str(self.bug.id)})
+
+    def test_filter_by_date_window(self):
+        params = {"date_from": "2025-06-15", "date_to": "2025-06-30"}
+        self.assertEqual(self.get_ids(params), {str(self.bug.id), str(self.story.id)})
+
+    def test_search_title_and_description(self):
+        self.assertEqual(self.get_ids({"search": "LOGIN"}), {str(self.bug.id)})
+        self.assertEqual(self.get_ids({"search": "onboarding"}), {str(self.story.id)})
+
+    def test_invalid_filters_return_400(self):
+        for params in [
+            {"status": "later"},
+            {"assigned_to": "not-a-uuid"},
+            {"date_from": "15.06.2025"},
+            {"fields": "title,secret"},
+        ]:
+            response = self.client.get("/api/tasks/", params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+
+    def test_filters_apply_to_board_and_pagination(self):
+        board = self.client.get("/api/tasks/board/", {"status": "done"})
+        self.assertEqual([task["id"] for task in board.data], [str(self.story.id)])
+        page = self.client.get("/api/tasks/", {"prio": "urgent,low", "page_size": 1})
+        self.assertEqual(page.data["results"][0]["id"], str(self.story.id))
+        following = self.client.get(page.data["next"])
+        self.assertEqual([task["id"] for task in following.data["results"]], [str(self.bug.id)])
+
+    def test_filters_do_not_affect_detail(self):
+        response = self.client.get(f"/api/tasks/{self.review.id}/", {"status": "done"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_sparse_fields_select_columns_and_skip_prefetches(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/tasks/", {"fields": "id,title,status_display"})
+        self.assertEqual(set(response.data[0]), {"id", "title", "status_display"})
+        task_queries = [
+            query["sql"] for query in queries if "tasks_app_task" in query["sql"] and "MAX(" not in query["sql"]
+        ]
+        self.assertEqual(len(task_queries), 1)
+        self.assertNotIn("description", task_queries[0])
+
+
+class TaskConditionalGetTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", email="testuser@example.com", password="Test@1234")
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        self.contact = Contact.objects.create(name="John Doe", email="john.doe@example.com")
+        self.task = Task.objects.create(title="Cached", category="User Story", date=datetime.date.today())
+        self.task.assigned_to.add(self.contact)
+        self.detail_url = f"/api/tasks/{self.task.id}/"
+
+    def assertNotModified(self, url, etag, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+        self.assertFalse(any("tasks_app_subtask" in query["sql"] for query in queries))
+
+    def test_list_returns_304_until_a_task_changes(self):
+        response = self.client.get("/api/tasks/")
+        etag = response["ETag"]
+        self.assertNotIn("Last-Modified", response)
+        self.assertNotModified("/api/tasks/", etag)
+
+        Subtask.objects.create(task=self.task, text="New step")
+        response = self.client.get("/api/tasks/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_list_etag_depends_on_query(self):
+        etag = self.client.get("/api/tasks/")["ETag"]
+        response = self.client.get("/api/tasks/", {"status": "done"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_changes_when_a_task_is_deleted(self):
+        other = Task.objects.create(title="Other", category="User Story", date=datetime.date.today())
+        etag = self.client.get("/api/tasks/")["ETag"]
+        Task.objects.filter(pk=other.pk).delete()
+        response = self.client.get("/api/tasks/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_if_modified_since_is_not_answered_with_304_after_a_delete(self):
+        other = Task.objects.create(title="Other", category="User Story", date=datetime.date.today())
+        since = http_date(time.time() + 60)
+        Task.objects.filter(pk=other.pk).delete()
+        response = self.client.get("/api/tasks/", HTTP_IF_MODIFIED_SINCE=since)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+
+    def test_detail_changes_with_assigned_contact(self):
+        etag = self.client.get(self.detail_url)["ETag"]
+        self.assertNotModified(self.detail_url, etag)
+        self.contact.number = "+49 123"
+        self.contact.save()
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_and_detail_change_when_an_assigned_contact_is_deleted(self):
+        newer = Contact.objects.create(name="Jane Roe", email="jane.roe@example.com")
+        self.task.assigned_to.add(newer)
+        list_etag = self.client.get("/api/tasks/")["ETag"]
+        detail_etag = self.client.get(self.detail_url)["ETag"]
+        self.contact.delete()
+        response = self.client.get("/api/tasks/", HTTP_IF_NONE_MATCH=list_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([contact["id"] for contact in response.data[0]["assigned_to"]], [str(newer.id)])
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=detail_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_detail_if_modified_since(self):
+        last_modified = self.client.get(self.detail_url)["Last-Modified"]
+        response = self.client.get(self.detail_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        Task.objects.filter(pk=self.task.pk).update(updated_at=self.task.updated_at + datetime.timedelta(seconds=5))
+        response = self.client.get(self.detail_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_detail_of_unknown_task_returns_404(self):
+        response = self.client.get(f"/api/tasks/{uuid.uuid4()}/", HTTP_IF_NONE_MATCH='"x"')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.get("/api/tasks/not-a-uuid/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TaskChangesTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", email="testuser@example.com", password="Test@1234")
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        self.task = Task.objects.create(title="Synced", category="User Story", date=datetime.date.today())
+        self.subtask = Subtask.objects.create(task=self.task, text="Step")
+        self.url = "/api/tasks/changes/"
+
+    def cursor(self):
+        return self.client.get(self.url).data["cursor"]
+
+    def test_without_since_returns_current_cursor(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["cursor"], TaskChange.objects.latest("seq").seq)
+        self.assertEqual(response.data["tasks"], [])
+
+    def test_returns_only_changes_after_cursor(self):
+        cursor = self.cursor()
+        other = Task.objects.create(title="New", category="User Story", date=datetime.date.today())
+        self.task.title = "Renamed"
+        self.task.save()
+        self.task.title = "Renamed again"
+        self.task.save()
+
+        response = self.client.get(self.url, {"since": cursor})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([task["id"] for task in response.data["tasks"]], [str(other.id), str(self.task.id)])
+        self.assertEqual(response.data["tasks"][1]["title"], "Renamed again")
+        self.assertFalse(response.data["has_more"])
+
+        response = self.client.get(self.url, {"since": response.data["cursor"]})
+        self.assertEqual(response.data["tasks"], [])
+        self.assertEqual(response.data["deleted"], {"tasks": [], "subtasks": []})
+
+    def test_returns_tombstones_for_deleted_tasks_and_subtasks(self):
+        other = Task.objects.create(title="Gone", category="User Story", date=datetime.date.today())
+        Subtask.objects.create(task=other, text="Gone with its task")
+        subtask_id = self.subtask.id
+        cursor = self.cursor()
+        self.subtask.delete()
+        Task.objects.filter(pk=other.pk).delete()
+
+        response = self.client.get(self.url, {"since": cursor})
+        self.assertEqual([task["id"] for task in response.data["tasks"]], [str(self.task.id)])
+        self.assertEqual(response.data["deleted"]["tasks"], [str(other.id)])
+        # subtasks of deleted tasks are covered by the task tombstone
+        self.assertEqual(response.data["deleted"]["subtasks"], [str(subtask_id)])
+
+    def test_bulk_writes_are_logged(self):
+        cursor = self.cursor()
+        Task.objects.filter(pk=self.task.pk).update(status="done")
+        response = self.client.get(self.url, {"since": cursor})
+        self.assertEqual(response.data["tasks"][0]["status"], "done")
+
+        cursor = response.data["cursor"]
+        self.client.put(
+            f"{self.url.replace('changes/', '')}{self.task.id}/",
+            {
+                "title": "Edited",
+                "category": "User Story",
+                "date": datetime.date.today().isoformat(),
+                "subtasks": [],
+                "assigned_to": [],
+            },
+            format="json",
+        )
+        response = self.client.get(self.url, {"since": cursor})
+        self.assertEqual(response.data["tasks"][0]["title"], "Edited")
+        self.assertEqual(response.data["deleted"]["subtasks"], [str(self.subtask.id)])
+
+    def test_pages_with_limit(self):
+        cursor = self.cursor()
+        created = [
+            Task.objects.create(title=f"Task {i}", category="User Story", date=datetime.date.today()) for i in range(3)
+        ]
+        response = self.client.get(self.url, {"since": cursor, "limit": 2})
+        self.assertTrue(response.data["has_more"])
+        self.assertEqual([task["id"] for task in response.data["tasks"]], [str(task.id) for task in created[:2]])
+        response = self.client.get(self.url, {"since": response.data["cursor"], "limit": 2})
+        self.assertFalse(response.data["has_more"])
+        self.assertEqual([task["id"] for task in response.data["tasks"]], [str(created[2].id)])
+
+    def test_pruned_cursor_returns_410(self):
+        cursor = self.cursor()
+        Task.objects.create(title="Later", category="User Story", date=datetime.date.today())
+        Task.objects.create(title="Latest", category="User Story", date=datetime.date.today())
+        prune_task_changes(timezone.now() + datetime.timedelta(seconds=1))
+        self.assertEqual(TaskChange.objects.count(), 1)
+
+        response = self.client.get(self.url, {"since": cursor})
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+        response = self.client.get(self.url, {"since": self.cursor()})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_invalid_since_returns_400(self):
+        response = self.client.get(self.url, {"since": "abc"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_cursor_waits_for_a_transaction_that_commits_late(self):
+        cursor = self.cursor()
+        # transaction A takes seq cursor + 1 but has not committed yet; transaction B takes cursor + 2 and commits
+        late_task = Task.objects.create(title="Late", category="User Story", date=datetime.date.today())
+        TaskChange.objects.filter(task_id=late_task.id).delete()
+        other = Task.objects.create(title="Early", category="User Story", date=datetime.date.today())
+        TaskChange.objects.filter(task_id=other.id).update(seq=cursor + 2)
+
+        response = self.client.get(self.url, {"since": cursor})
+        self.assertEqual(response.data["cursor"], cursor)
+        self.assertEqual(response.data["tasks"], [])
+        self.assertEqual(self.cursor(), cursor)
+
+        # transaction A commits
+        TaskChange.objects.create(seq=cursor + 1, object_id=late_task.id, task_id=late_task.id)
+        response = self.client.get(self.url, {"since": cursor})
+        self.assertEqual(response.data["cursor"], cursor + 2)
+        self.assertEqual([task["id"] for task in response.data["tasks"]], [str(late_task.id), str(other.id)])
+
+    def test_cursor_passes_old_gaps_of_rolled_back_transactions(self):
+        cursor = self.cursor()
+        other = Task.objects.create(title="After rollback", category="User Story", date=datetime.date.today())
+        TaskChange.objects.filter(task_id=other.id).update(seq=cursor + 2)
+        self.assertEqual(self.client.get(self.url, {"since": cursor}).data["cursor"], cursor)
+
+        with self.settings(TASK_CHANGE_COMMIT_LAG=0):
+            response = self.client.get(self.url, {"since": cursor})
+        self.assertEqual(response.data["cursor"], cursor + 2)
+        self.assertEqual([task["id"] for task in response.data["tasks"]], [str(other.id)])
@@ -0,0 +1,266 @@
+"""
+Utility functions for tasks, including summary statistics aggregation.
+"""
+
+import datetime
+from collections import defaultdict
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Max, Min, Q
+from django.utils import timezone
+from tasks_app.models import Task, Subtask, TaskChange, TaskSummaryCounter
+from contacts_app.models import Contact
+from contacts_app.utils import get_color_from_profile_pic
+from backend_join.export import iter_keyset_chunks
+
+BOARD_TASK_FIELDS = ("id", "title", "category", "prio", "status", "date")
+EXPORT_TASK_FIELDS = ("id", "title", "description", "category", "date", "prio", "status")
+EXPORT_TASK_COLUMNS = EXPORT_TASK_FIELDS + ("assigned_to", "subtasks")
+
+SUMMARY_STATUS_KEYS = {
+    "toDo": "todos",
+    "inProgress": "in_progress",
+    "awaitFeedback": "await_feedback",
+    "done": "done",
+}
+
+
+def aggregate_task_summary(queryset):
+    """
+    Compute status counts, total, urgent count and next urgent due date in a single query.
+    """
+    aggregates = {key: Count("pk", filter=Q(status=status)) for status, key in SUMMARY_STATUS_KEYS.items()}
+    aggregates["total"] = Count("pk")
+    aggregates["urgent"] = Count("pk", filter=Q(prio="urgent"))
+    aggregates["next_urgent_due"] = Min("date", filter=Q(prio="urgent") & ~Q(status="done"))
+    return queryset.order_by().aggregate(**aggregates)
+
+
+def format_task_summary(summary):
+    """
+    Return a summary dictionary with the next urgent due date rendered as an ISO string.
+    """
+    next_urgent_due = summary.get("next_urgent_due")
+    return {**summary, "next_urgent_due": next_urgent_due.strftime("%Y-%m-%d") if next_urgent_due else None}
+
+
+def read_task_summary():
+    """
+    Read the task summary from the materialized counters without scanning the Task table.
+    """
+    counter_rows = TaskSummaryCounter.objects.exclude(kind=TaskSummaryCounter.KIND_URGENT_DUE)
+    counters = {(kind, key): count for kind, key, count in counter_rows.values_list("kind", "key", "count")}
+    next_urgent_due = (
+        TaskSummaryCounter.objects.filter(kind=TaskSummaryCounter.KIND_URGENT_DUE, count__gt=0)
+        .order_by("key")
+        .values_list("key", flat=True)
+        .first()
+    )
+    summary = {
+        key: counters.get((TaskSummaryCounter.KIND_STATUS, status), 0) for status, key in SUMMARY_STATUS_KEYS.items()
+    }
+    summary["total"] = sum(summary.values())
+    summary["urgent"] = counters.get((TaskSummaryCounter.KIND_PRIO, "urgent"), 0)
+    summary["next_urgent_due"] = datetime.date.fromisoformat(next_urgent_due) if next_urgent_due else None
+    return summary
+
+
+def _expected_counters():
+    """
+    Compute the counter buckets the shared (non-sandbox) tasks currently imply, keyed by (kind, key).
+    """
+    expected = {}
+    tasks = Task.objects.filter(sandbox__isnull=True).order_by()
+    for status, count in tasks.values_list("status").annotate(count=Count("pk")):
+        expected[(TaskSummaryCounter.KIND_STATUS, status)] = count
+    for prio, count in tasks.values_list("prio").annotate(count=Count("pk")):
+        expected[(TaskSummaryCounter.KIND_PRIO, prio)] = count
+    urgent_open = tasks.filter(prio="urgent").exclude(status="done")
+    for date, count in urgent_open.values_list("date").annotate(count=Count("pk")):
+        expected[(TaskSummaryCounter.KIND_URGENT_DUE, str(date))] = count
+    return expected
+
+
+def rebuild_task_summary():
+    """
+    Recreate all summary counters from the Task table and return the number of counter rows written.
+    """
+    with transaction.atomic():
+        expected = _expected_counters()
+        TaskSummaryCounter.objects.all().delete()
+        TaskSummaryCounter.objects.bulk_create(
+            TaskSummaryCounter(kind=kind, key=key, count=count) for (kind, key), count in expected.items()
+        )
+    return len(expected)
+
+
+def check_task_summary():
+    """
+    Compare the summary counters with the Task table and return a list of (kind, key, stored, expected) mismatches.
+    """
+    expected = _expected_counters()
+    stored = {
+        (kind, key): count
+        for kind, key, count in TaskSummaryCounter.objects.exclude(count=0).values_list("kind", "key", "count")
+    }
+    return [
+        (kind, key, stored.get((kind, key), 0), expected.get((kind, key), 0))
+        for kind, key in sorted(expected.keys() | stored.keys())
+        if stored.get((kind, key), 0) != expected.get((kind, key), 0)
+    ]
+
+
+def build_board(queryset):
+    """
+    Return the compact Kanban board projection of the given tasks using three queries:
+    tasks with annotated subtask counts, task/contact links, and the distinct assigned contacts.
+    """
+    tasks = list(
+        queryset.prefetch_related(None)
+        .annotate(
+            subtasks_total=Count("subtasks"),
+            subtasks_done=Count("subtasks", filter=Q(subtasks__status="checked")),
+        )
+        .values(*BOARD_TASK_FIELDS, "subtasks_total", "subtasks_done")
+    )
+    links = defaultdict(list)
+    if tasks:
+        task_ids = queryset.order_by().values("pk")
+        link_rows = Task.assigned_to.through.objects.filter(task_id__in=task_ids).values_list("task_id", "contact_id")
+        for task_id, contact_id in link_rows:
+            links[task_id].append(contact_id)
+    assignees = _board_assignees({contact_id for contact_ids in links.values() for contact_id in contact_ids})
+    return [
+        {
+            "id": str(task["id"]),
+            "title": task["title"],
+            "category": task["category"],
+            "prio": task["prio"],
+            "status": task["status"],
+            "date": task["date"].isoformat(),
+            "assigned_to": [assignees[contact_id] for contact_id in links[task["id"]] if contact_id in assignees],
+            "subtasks_done": task["subtasks_done"],
+            "subtasks_total": task["subtasks_total"],
+        }
+        for task in tasks
+    ]
+
+
+def _board_assignees(contact_ids):
+    """
+    Return a mapping of contact id to its compact board representation (id, initials, colour).
+    """
+    if not contact_ids:
+        return {}
+    rows = Contact.objects.filter(id__in=contact_ids).values_list("id", "first_letters", "profile_pic")
+    return {
+        contact_id: {"id": str(contact_id), "initials": initials, "color": get_color_from_profile_pic(profile_pic)}
+        for contact_id, initials, profile_pic in rows
+    }
+
+
+def iter_task_export_rows(queryset, chunk_size):
+    """
+    Yield export rows with assignee IDs and subtasks, reading the tasks in keyset chunks by (-date, id).
+    Each chunk costs one query for its tasks, one for its subtasks and one for its contact links, so memory
+    stays constant.
+    """
+    rows = queryset.prefetch_related(None).values(*EXPORT_TASK_FIELDS)
+    for chunk in iter_keyset_chunks(rows, ("-date", "id"), chunk_size):
+        task_ids = [task["id"] for task in chunk]
+        subtasks = defaultdict(list)
+        for task_id, subtask_id, text, status in Subtask.objects.filter(task_id__in=task_ids).values_list(
+            "task_id", "id", "text", "status"
+        ):
+            subtasks[task_id].append({"id": subtask_id, "text": text, "status": status})
+        links = defaultdict(list)
+        for task_id, contact_id in Task.assigned_to.through.objects.filter(task_id__in=task_ids).values_list(
+            "task_id", "contact_id"
+        ):
+            links[task_id].append(contact_id)
+        for task in chunk:
+            task["assigned_to"] = links[task["id"]]
+            task["subtasks"] = subtasks[task["id"]]
+            yield task
+
+
+def latest_task_change_seq():
+    """
+    Return the sequence number of the latest logged change, or 0 if there is none.
+    """
+    return TaskChange.objects.aggregate(seq=Max("seq"))["seq"] or 0
+
+
+DEFAULT_TASK_CHANGE_COMMIT_LAG = 10
+
+
+def committed_task_change_seq(since=0, now=None):
+    """
+    Return the highest sequence number up to which no change can still appear, i.e. a safe sync cursor.
+    Sequence numbers are assigned on insert but become visible on commit, so a missing seq followed by a
+    change younger than TASK_CHANGE_COMMIT_LAG seconds may belong to a transaction that has not committed
+    yet; the cursor stops before it. Older gaps are rolled back inserts and are skipped, as are the pruned
+    sequence numbers before the oldest logged change.
+    """
+    lag = getattr(settings, "TASK_CHANGE_COMMIT_LAG", DEFAULT_TASK_CHANGE_COMMIT_LAG)
+    horizon = (now or timezone.now()) - datetime.timedelta(seconds=lag)
+    changes = TaskChange.objects.filter(seq__gt=since)
+    recent = list(changes.filter(created_at__gt=horizon).order_by("seq").values_list("seq", flat=True))
+    settled = changes.filter(created_at__lte=horizon)
+    if recent:
+        settled = settled.filter(seq__lt=recent[0])
+    base = settled.aggregate(seq=Max("seq"))["seq"]
+    if base is None:
+        oldest = TaskChange.objects.order_by("seq").values_list("seq", flat=True).first()
+        base = max(since, oldest - 1) if oldest else since
+    expected = base + 1
+    for seq in recent:
+        if seq != expected:
+            break
+        expected = seq + 1
+    return expected - 1
+
+
+def task_changes_are_available(since):
+    """
+    Return False if changes after the given sequence number may have been pruned from the log.
+    """
+    oldest = TaskChange.objects.order_by("seq").values_list("seq", flat=True).first()
+    return oldest is None or since >= oldest - 1
+
+
+def collect_task_changes(since, limit, sandbox_id=None):
+    """
+    Return the objects of the sandbox (or the shared tasks) changed after the since sequence number, each only
+    once with its latest change. Returns (changed task IDs, deleted task IDs, deleted subtask IDs, new cursor,
+    has_more). Changes after a possibly uncommitted seq are held back until it commits or turns out rolled back.
+    """
+    committed = committed_task_change_seq(since)
+    latest = list(
+        TaskChange.objects.filter(seq__gt=since, seq__lte=committed, sandbox_id=sandbox_id)
+        .values("kind", "object_id")
+        .annotate(last_seq=Max("seq"))
+        .order_by("last_seq")[: limit + 1]
+    )
+    has_more = len(latest) > limit
+    latest = latest[:limit]
+    rows = TaskChange.objects.filter(seq__in=[change["last_seq"] for change in latest]).order_by("seq")
+    changed, deleted_tasks, deleted_subtasks = [], [], []
+    for kind, object_id, deleted in rows.values_list("kind", "object_id", "deleted"):
+        if kind == TaskChange.KIND_SUBTASK:
+            deleted_subtasks.append(object_id)
+        elif deleted:
+            deleted_tasks.append(object_id)
+        else:
+            changed.append(object_id)
+    cursor = latest[-1]["last_seq"] if has_more else committed
+    return changed, deleted_tasks, deleted_subtasks, cursor, has_more
+
+
+def prune_task_changes(before):
+    """
+    Delete change log rows created before the given time, always keeping the latest row, and return the count.
+    """
+    latest = latest_task_change_seq()
+    deleted, _ = TaskChange.objects.filter(created_at__lt=before, seq__lt=latest).delete()
+    return deleted
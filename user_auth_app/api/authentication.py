@@ -0,0 +1,195 @@
+"""
+API authentication: DB token authentication with an in-process cache of token key -> user, and stateless
+HMAC-signed short-lived access tokens that authenticate without any query.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core import signing
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import BaseAuthentication, TokenAuthentication, get_authorization_header
+
+DEFAULT_TOKEN_AUTH_CACHE_TTL = 60
+DEFAULT_TOKEN_AUTH_CACHE_SIZE = 10000
+DEFAULT_ACCESS_TOKEN_TTL = 300
+ACCESS_TOKEN_SALT = "user_auth_app.access_token"
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+class TokenUserCache:
+    """
+    Thread-safe LRU cache of token key -> (user, token) whose entries expire after ttl seconds.
+    A ttl of 0 disables the cache.
+    """
+
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Return the cached (user, token) for the key, or None if it is missing or expired.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            expires_at, user, token = entry
+            if expires_at <= time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return user, token
+
+    def set(self, key, user, token):
+        """
+        Cache the user and token of the key, evicting the least recently used entries beyond max_size.
+        """
+        if self.ttl <= 0:
+            return
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, user, token)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def invalidate_key(self, key):
+        """
+        Drop the entry of a token key.
+        """
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def invalidate_user(self, user_id):
+        """
+        Drop all entries of a user.
+        """
+        with self.lock:
+            for key in [key for key, (_, user, _) in self.entries.items() if user.pk == user_id]:
+                del self.entries[key]
+
+    def clear(self):
+        """
+        Drop all entries.
+        """
+        with self.lock:
+            self.entries.clear()
+
+
+def get_token_cache():
+    """
+    Return the process-wide token cache configured by TOKEN_AUTH_CACHE_TTL and TOKEN_AUTH_CACHE_SIZE.
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = TokenUserCache(
+                    max_size=getattr(settings, "TOKEN_AUTH_CACHE_SIZE", DEFAULT_TOKEN_AUTH_CACHE_SIZE),
+                    ttl=getattr(settings, "TOKEN_AUTH_CACHE_TTL", DEFAULT_TOKEN_AUTH_CACHE_TTL),
+                )
+    return _cache
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication that caches the Token + User lookup per process.
+    Entries are invalidated by the Token and User signals of this process; other processes notice
+    changes after at most TOKEN_AUTH_CACHE_TTL seconds. Each request gets its own copy of the user.
+    The user's guest sandbox is loaded with the token, so scoping a request to it needs no further query.
+    """
+
+    def authenticate_credentials(self, key):
+        cache = get_token_cache()
+        cached = cache.get(key)
+        if cached is not None:
+            user, token = cached
+            return copy.copy(user), copy.copy(token)
+        model = self.get_model()
+        try:
+            token = model.objects.select_related("user", "user__guest_sandbox").get(key=key)
+        except model.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_("Invalid token."))
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_("User inactive or deleted."))
+        cache.set(key, token.user, token)
+        return copy.copy(token.user), copy.copy(token)
+
+
+def get_access_token_ttl():
+    """
+    Return the lifetime of signed access tokens in seconds; 0 disables them.
+    """
+    return getattr(settings, "ACCESS_TOKEN_TTL", DEFAULT_ACCESS_TOKEN_TTL)
+
+
+def create_access_token(user, contact_id, sandbox_id=None):
+    """
+    Return a signed access token embedding the user id, username, contact id, expiry, and the guest sandbox
+    (if any), or None if disabled.
+    """
+    ttl = get_access_token_ttl()
+    if ttl <= 0:
+        return None
+    payload = {
+        "uid": user.pk,
+        "un": user.get_username(),
+        "cid": str(contact_id) if contact_id else None,
+        "exp": int(time.time()) + ttl,
+    }
+    if sandbox_id:
+        payload["sbx"] = str(sandbox_id)
+    return signing.dumps(payload, salt=ACCESS_TOKEN_SALT, compress=True)
+
+
+def read_access_token(token):
+    """
+    Return the payload of a valid, unexpired access token, or raise AuthenticationFailed.
+    """
+    try:
+        payload = signing.loads(token, salt=ACCESS_TOKEN_SALT)
+    except signing.BadSignature:
+        raise exceptions.AuthenticationFailed("Invalid access token.")
+    if payload.get("exp", 0) <= time.time():
+        raise exceptions.AuthenticationFailed("Access token expired.")
+    return payload
+
+
+class SignedAccessTokenAuthentication(BaseAuthentication):
+    """
+    Authenticates "Authorization: Bearer <access token>" without touching the database.
+    request.user is a lightweight User carrying only id and username; request.auth is the token payload.
+    Access tokens cannot be revoked, so they are short-lived and renewed with the DB token.
+    """
+
+    keyword = "Bearer"
+
+    def authenticate(self, request):
+        auth = get_authorization_header(request).split()
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+        if len(auth) != 2:
+            raise exceptions.AuthenticationFailed("Invalid access token header.")
+        if get_access_token_ttl() <= 0:
+            raise exceptions.AuthenticationFailed("Access tokens are disabled.")
+        try:
+            token = auth[1].decode()
+        except UnicodeError:
+            raise exceptions.AuthenticationFailed("Invalid access token.")
+        payload = read_access_token(token)
+        user = User(id=payload["uid"], username=payload["un"], is_active=True)
+        user._state.adding = False
+        user._state.db = "default"
+        return user, payload
+
+    def authenticate_header(self, request):
+        return self.keyword
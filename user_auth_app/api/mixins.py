@@ -3,20 +3,28 @@ Mixin for building user response dictionaries for authentication endpoints.
 """
 
 from contacts_app.models import Contact
+from user_auth_app.api.authentication import create_access_token, get_access_token_ttl
 
 
 class AuthUserResponseMixin:
     """
     Provides a helper method to build a user/token response for login, registration, and guest endpoints.
+    The response carries the DB token and, unless disabled, a short-lived signed access token.
     """
 
-    def _build_user_response(self, user, token, include_name=True):
+    def _build_user_response(self, user, token, include_name=True, contact_id=None, sandbox_id=None):
+        if contact_id is None:
+            contact_id = Contact.objects.get(user=user).id
         response = {
             "username": user.username,
             "email": user.email,
             "token": token.key,
-            "id": Contact.objects.get(user=user).id,
+            "id": contact_id,
         }
+        access = create_access_token(user, contact_id, sandbox_id)
+        if access:
+            response["access"] = access
+            response["access_expires_in"] = get_access_token_ttl()
         if include_name:
             response["name"] = f"{user.first_name} {user.last_name}"
         return response
@@ -4,11 +4,17 @@ Serializers for user registration and validation logic.
 
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
+from rest_framework.authtoken.models import Token
+
+EMAIL_EXISTS_MESSAGE = "Email already exists."
 
 
 class RegisterSerializer(serializers.ModelSerializer):
     """
     Serializer for user registration, including password validation and duplicate email checks.
+    With context["check_email_on_save"], duplicate emails are detected by the unique username and contact email
+    constraints when saving instead of by a lookup during validation.
     """
 
     repeated_password = serializers.CharField()
@@ -24,10 +30,12 @@ class RegisterSerializer(serializers.ModelSerializer):
 
     def validate_email(self, value):
         """
-        Ensure the email is unique in the User model.
+        Ensure the email is unique in the User model, unless save() is trusted to detect duplicates.
         """
+        if self.context.get("check_email_on_save"):
+            return value
         if User.objects.filter(email=value).exists():
-            raise serializers.ValidationError("Email already exists.")
+            raise serializers.ValidationError(EMAIL_EXISTS_MESSAGE)
         return value
 
     def validate_password(self, value):
@@ -61,7 +69,8 @@ class RegisterSerializer(serializers.ModelSerializer):
 
     def save(self):
         """
-        Create and save a new User instance with validated data.
+        Create and save a new User instance with its auth token in one transaction; its contact is created by
+        the post_save signal. Raises a ValidationError and rolls back if the email is already taken.
         """
         login = self.validated_data["email"].lower()
         name = self.validated_data["name"]
@@ -73,6 +82,13 @@ class RegisterSerializer(serializers.ModelSerializer):
             last_name=name.split()[1] if len(name.split()) > 1 else "",
         )
         user.set_password(password)
-        user.save()
+        try:
+            with transaction.atomic():
+                user.save()
+                if getattr(user, "contact", None) is None:
+                    raise IntegrityError(f"Contact with email {login} belongs to another user.")
+                Token.objects.create(user=user)
+        except IntegrityError:
+            raise serializers.ValidationError({"email": [EMAIL_EXISTS_MESSAGE]})
 
         return user
@@ -0,0 +1,23 @@
+"""
+Rate limit for guest logins, each of which creates a sandbox with a copy of the demo board.
+"""
+
+from django.conf import settings
+from rest_framework.throttling import SimpleRateThrottle
+
+DEFAULT_GUEST_LOGIN_RATE = "20/hour"
+
+
+class GuestLoginRateThrottle(SimpleRateThrottle):
+    """
+    Limit guest logins per client IP to GUEST_LOGIN_RATE (e.g. "20/hour"; None disables the limit).
+    The history is kept in the default cache, so the limit is per process unless that cache is shared.
+    """
+
+    scope = "guest_login"
+
+    def get_rate(self):
+        return getattr(settings, "GUEST_LOGIN_RATE", DEFAULT_GUEST_LOGIN_RATE)
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {"scope": self.scope, "ident": self.get_ident(request)}
@@ -1,9 +1,10 @@
 from django.urls import path
-from .views import GuestUserView, UserLoginView, UserRegistrationView, CheckAuthStatusView
+from .views import AccessTokenRefreshView, GuestUserView, UserLoginView, UserRegistrationView, CheckAuthStatusView
 
 urlpatterns = [
     path("login/", UserLoginView.as_view(), name="user_login"),
     path("register/", UserRegistrationView.as_view(), name="user_register"),
     path("guest/", GuestUserView.as_view(), name="user_guest"),
+    path("token/refresh/", AccessTokenRefreshView.as_view(), name="access_token_refresh"),
     path("status/", CheckAuthStatusView.as_view(), name="auth_status"),
 ]
@@ -1,16 +1,26 @@
 """
-API views for user authentication: login, guest login, registration, and auth status check.
+API views for user authentication: login, guest login, registration, access token refresh, and auth status check.
 """
 
-from django.contrib.auth.models import User
-from django.db import transaction
 from rest_framework import generics, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.authtoken.views import ObtainAuthToken
 from rest_framework.authtoken.models import Token
 from rest_framework.response import Response
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.views import APIView
+from contacts_app.models import Contact
+from user_auth_app.api.authentication import CachedTokenAuthentication, create_access_token, get_access_token_ttl
 from user_auth_app.api.serializers import RegisterSerializer
 from user_auth_app.api.mixins import AuthUserResponseMixin
+from user_auth_app.api.throttling import GuestLoginRateThrottle
+from user_auth_app.guest import get_guest_identity
+from user_auth_app.sandbox import (
+    create_guest_sandbox,
+    get_guest_sandbox_ttl,
+    get_user_sandbox_id,
+    maybe_start_sandbox_sweep,
+)
 
 
 class UserLoginView(AuthUserResponseMixin, ObtainAuthToken):
@@ -35,44 +45,79 @@ class UserLoginView(AuthUserResponseMixin, ObtainAuthToken):
 class GuestUserView(AuthUserResponseMixin, ObtainAuthToken):
     """
     API endpoint for guest login. Returns token and guest user info.
+    Each login gets its own guest user with a private copy of the demo board (see user_auth_app/sandbox.py).
+    Sandbox logins are rate limited per client IP (GUEST_LOGIN_RATE). With GUEST_SANDBOX_TTL = 0 all guests
+    share one guest identity, cached per process, so guest logins take no locks, run no queries, and are not
+    throttled.
     """
 
     permission_classes = (AllowAny,)
+    throttle_classes = (GuestLoginRateThrottle,)
+
+    def get_throttles(self):
+        if get_guest_sandbox_ttl() > 0:
+            return super().get_throttles()
+        return []
 
     def post(self, request):
-        with transaction.atomic():
-            guest_user, created_user = User.objects.select_for_update().get_or_create(
-                username="guest",
-                defaults={"password": "guest", "first_name": "Guest", "last_name": "User", "email": "guest@user.de"},
+        if get_guest_sandbox_ttl() > 0:
+            guest_user, token, contact_id, sandbox = create_guest_sandbox()
+            maybe_start_sandbox_sweep()
+            data = self._build_user_response(
+                guest_user, token, include_name=False, contact_id=contact_id, sandbox_id=sandbox.pk
             )
-            if created_user:
-                guest_user.set_password("guest")
-                guest_user.save()
-            token, created_token = Token.objects.get_or_create(user=guest_user)
-
-        data = self._build_user_response(guest_user, token, include_name=False)
-        status_code = status.HTTP_201_CREATED if created_user or created_token else status.HTTP_200_OK
+            return Response(data, status=status.HTTP_201_CREATED)
+        guest_user, token, contact_id, created = get_guest_identity()
+        data = self._build_user_response(guest_user, token, include_name=False, contact_id=contact_id)
+        status_code = status.HTTP_201_CREATED if created else status.HTTP_200_OK
         return Response(data, status=status_code)
 
 
 class UserRegistrationView(AuthUserResponseMixin, generics.CreateAPIView):
     """
     API endpoint for user registration. Returns token and user info on success.
+    The user, its contact, and its token are written in one transaction without lookups: duplicate emails
+    are caught by the unique constraints, and the contact created by the signal is reused for the response.
     """
 
     serializer_class = RegisterSerializer
     permission_classes = (AllowAny,)
 
+    def get_serializer_context(self):
+        """
+        Let the serializer detect duplicate emails on save instead of with a lookup during validation.
+        """
+        return {**super().get_serializer_context(), "check_email_on_save": True}
+
     def post(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
-        if serializer.is_valid():
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        try:
             user = serializer.save()
-            token, created = Token.objects.get_or_create(user=user)
-            data = self._build_user_response(user, token)
-        else:
-            data = serializer.errors
-        status_code = status.HTTP_201_CREATED if serializer.is_valid() else status.HTTP_400_BAD_REQUEST
-        return Response(data, status=status_code)
+        except ValidationError as exc:
+            return Response(exc.detail, status=status.HTTP_400_BAD_REQUEST)
+        data = self._build_user_response(user, user.auth_token, contact_id=user.contact.pk)
+        return Response(data, status=status.HTTP_201_CREATED)
+
+
+class AccessTokenRefreshView(APIView):
+    """
+    API endpoint issuing a new signed access token for a valid DB token ("Authorization: Token <key>").
+    """
+
+    authentication_classes = (CachedTokenAuthentication,)
+    permission_classes = (IsAuthenticated,)
+
+    def post(self, request):
+        access = create_access_token(
+            request.user,
+            Contact.objects.filter(user=request.user).values_list("id", flat=True).first(),
+            get_user_sandbox_id(request.user),
+        )
+        if access is None:
+            return Response({"detail": "Access tokens are disabled."}, status=status.HTTP_404_NOT_FOUND)
+        return Response({"access": access, "access_expires_in": get_access_token_ttl()})
 
 
 class CheckAuthStatusView(generics.RetrieveAPIView):
@@ -0,0 +1,152 @@
+"""
+Template of the demo board: the contacts and tasks of the seed script and of every guest sandbox.
+"""
+
+DEMO_CONTACTS = [
+    {"name": "Alice Anderson", "email": "alice.anderson@webmail.de", "number": "+4915112345678"},
+    {"name": "Bob Baker", "email": "bob.baker@company.com", "number": "+4915223456789"},
+    {"name": "Carla Schmidt", "email": "carla.schmidt@uni-hamburg.de", "number": "+4915334567890"},
+    {"name": "David Müller", "email": "d.mueller@it-consulting.de", "number": "+4915445678901"},
+    {"name": "Eva Klein", "email": "eva.klein@posteo.net", "number": "+4915556789012"},
+    {"name": "Frank Nowak", "email": "frank.nowak@freemail.de", "number": "+4915667890123"},
+    {"name": "Gina Hoffmann", "email": "gina.hoffmann@startup.io", "number": "+4915778901234"},
+    {"name": "Hannes Weber", "email": "hannes.weber@devmail.com", "number": "+4915889012345"},
+    {"name": "Ines Fischer", "email": "ines.fischer@schule.de", "number": "+4915990123456"},
+    {"name": "Jonas Krüger", "email": "jonas.krueger@projektmail.de", "number": "+4916012345678"},
+]
+
+# Due dates are given as days before today; "assigned" holds indexes into DEMO_CONTACTS.
+DEMO_TASKS = [
+    {
+        "title": "Set up Django project structure",
+        "category": "Technical Task",
+        "prio": "urgent",
+        "status": "done",
+        "description": "Initialize the Django project and apps for backend development.",
+        "subtasks": [
+            {"text": "Create virtual environment", "status": "checked"},
+            {"text": "Install Django", "status": "checked"},
+            {"text": "Start project and apps", "status": "checked"},
+        ],
+        "assigned": [0, 1],
+        "days_ago": 14,
+    },
+    {
+        "title": "Design REST API endpoints",
+        "category": "User Story",
+        "prio": "medium",
+        "status": "inProgress",
+        "description": "Define endpoints for tasks, contacts, and authentication.",
+        "subtasks": [
+            {"text": "List all endpoints", "status": "checked"},
+            {"text": "Document API structure", "status": "unchecked"},
+        ],
+        "assigned": [2, 3],
+        "days_ago": 10,
+    },
+    {
+        "title": "Implement authentication",
+        "category": "Technical Task",
+        "prio": "urgent",
+        "status": "toDo",
+        "description": "Add user registration, login, and token authentication.",
+        "subtasks": [
+            {"text": "User registration", "status": "unchecked"},
+            {"text": "Token login", "status": "unchecked"},
+        ],
+        "assigned": [4],
+        "days_ago": 7,
+    },
+    {
+        "title": "Create models for tasks and contacts",
+        "category": "Technical Task",
+        "prio": "medium",
+        "status": "done",
+        "description": "Define Django models for tasks, subtasks, and contacts.",
+        "subtasks": [
+            {"text": "Task model", "status": "checked"},
+            {"text": "Subtask model", "status": "checked"},
+            {"text": "Contact model", "status": "checked"},
+        ],
+        "assigned": [5, 6],
+        "days_ago": 12,
+    },
+    {
+        "title": "Write unit tests for API",
+        "category": "User Story",
+        "prio": "low",
+        "status": "awaitFeedback",
+        "description": "Ensure all endpoints are covered by tests.",
+        "subtasks": [
+            {"text": "Test user registration", "status": "checked"},
+            {"text": "Test task creation", "status": "unchecked"},
+        ],
+        "assigned": [7],
+        "days_ago": 5,
+    },
+    {
+        "title": "Add Swagger/OpenAPI documentation",
+        "category": "Technical Task",
+        "prio": "medium",
+        "status": "toDo",
+        "description": "Integrate drf-yasg for automatic API docs.",
+        "subtasks": [
+            {"text": "Install drf-yasg", "status": "checked"},
+            {"text": "Configure schema view", "status": "unchecked"},
+        ],
+        "assigned": [8],
+        "days_ago": 3,
+    },
+    {
+        "title": "Frontend-Backend Integration",
+        "category": "User Story",
+        "prio": "urgent",
+        "status": "inProgress",
+        "description": "Connect frontend to backend API and test data flow.",
+        "subtasks": [
+            {"text": "CORS setup", "status": "checked"},
+            {"text": "Test API calls from frontend", "status": "unchecked"},
+        ],
+        "assigned": [9, 0],
+        "days_ago": 2,
+    },
+    {
+        "title": "Deploy backend locally",
+        "category": "Technical Task",
+        "prio": "low",
+        "status": "toDo",
+        "description": "Run backend with manage.py runserver for local testing.",
+        "subtasks": [
+            {"text": "Check local DB", "status": "unchecked"},
+            {"text": "Test endpoints", "status": "unchecked"},
+        ],
+        "assigned": [1],
+        "days_ago": 0,
+    },
+    {
+        "title": "Create admin interface",
+        "category": "Technical Task",
+        "prio": "medium",
+        "status": "done",
+        "description": "Register models in Django admin for easy management.",
+        "subtasks": [
+            {"text": "Register Task model", "status": "checked"},
+            {"text": "Register Contact model", "status": "checked"},
+        ],
+        "assigned": [2, 3],
+        "days_ago": 8,
+    },
+    {
+        "title": "Write project documentation",
+        "category": "User Story",
+        "prio": "low",
+        "status": "awaitFeedback",
+        "description": "Document setup, usage, and API for the backend.",
+        "subtasks": [
+            {"text": "Write README.md", "status": "checked"},
+            {"text": "Add API examples", "status": "unchecked"},
+        ],
+        "assigned": [4, 5],
+        "days_ago": 1,
+    },
+]
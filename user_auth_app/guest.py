@@ -0,0 +1,98 @@
+"""
+Guest identity shared by all guest logins, provisioned once and then served from a per-process cache.
+Cached identities expire after GUEST_IDENTITY_CACHE_TTL seconds, so changes made by other processes
+(e.g. a deleted or rotated guest token) are picked up without a restart.
+"""
+
+import threading
+import time
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import transaction
+from rest_framework.authtoken.models import Token
+from contacts_app.models import Contact
+
+GUEST_USERNAME = "guest"
+GUEST_PASSWORD = "guest"
+GUEST_DEFAULTS = {"first_name": "Guest", "last_name": "User", "email": "guest@user.de"}
+DEFAULT_GUEST_IDENTITY_CACHE_TTL = 60
+
+_cached = None
+_identity_lock = threading.Lock()
+
+
+def provision_guest():
+    """
+    Create the guest user, token, and contact if missing and return (user, token, contact_id, created).
+    Concurrent provisioning in other processes is resolved by the unique username and token constraints
+    instead of row locks: get_or_create() falls back to reading the row the other process created.
+    """
+    user, created_user = User.objects.get_or_create(username=GUEST_USERNAME, defaults=GUEST_DEFAULTS)
+    if created_user:
+        user.set_password(GUEST_PASSWORD)
+        user.save(update_fields=["password"])
+    token, created_token = Token.objects.get_or_create(user=user)
+    contact_id = Contact.objects.filter(user=user).values_list("id", flat=True).first()
+    return user, token, contact_id, created_user or created_token
+
+
+def get_guest_identity():
+    """
+    Return (user, token, contact_id, created) of the guest, provisioning it on first use in this process.
+    created is only True for the call that created the guest user or token. The identity is cached on
+    commit, so a rolled back provisioning is never served from the cache, and re-read once the cache expires.
+    """
+    identity = _fresh_identity()
+    if identity is not None:
+        return identity[:3] + (False,)
+    with _identity_lock:
+        identity = _fresh_identity()
+        if identity is not None:
+            return identity[:3] + (False,)
+        identity = provision_guest()
+        if identity[2] is not None:
+            transaction.on_commit(lambda: _remember_guest_identity(identity))
+    return identity
+
+
+def get_guest_identity_cache_ttl():
+    """
+    Return the lifetime of the cached guest identity in seconds; 0 disables the cache.
+    """
+    return getattr(settings, "GUEST_IDENTITY_CACHE_TTL", DEFAULT_GUEST_IDENTITY_CACHE_TTL)
+
+
+def _fresh_identity():
+    """
+    Return the cached guest identity, or None if it is missing or expired.
+    """
+    cached = _cached
+    if cached is None or cached[0] <= time.monotonic():
+        return None
+    return cached[1]
+
+
+def _remember_guest_identity(identity):
+    """
+    Cache the guest identity once the transaction that provisioned or read it has committed.
+    """
+    global _cached
+    ttl = get_guest_identity_cache_ttl()
+    if ttl > 0:
+        _cached = (time.monotonic() + ttl, identity)
+
+
+def get_cached_guest_identity():
+    """
+    Return the cached (user, token, contact_id, created) of the guest without provisioning it, or None.
+    """
+    cached = _cached
+    return cached[1] if cached is not None else None
+
+
+def forget_guest_identity():
+    """
+    Drop the cached guest identity, e.g. after the guest user, token, or contact changed.
+    """
+    global _cached
+    _cached = None
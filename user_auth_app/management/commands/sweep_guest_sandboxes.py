@@ -0,0 +1,32 @@
+"""
+Management command to delete expired guest sandboxes.
+"""
+
+import datetime
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from user_auth_app.sandbox import SWEEP_BATCH_SIZE, sweep_expired_sandboxes
+
+
+class Command(BaseCommand):
+    """
+    Delete expired guest sandboxes with their guest users, tasks, and contacts.
+    """
+
+    help = "Delete expired guest sandboxes with their guest users, tasks, and contacts."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--grace", type=int, default=0, help="Only delete sandboxes expired more than N seconds ago (default: 0)."
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=SWEEP_BATCH_SIZE,
+            help=f"Sandboxes deleted per transaction (default: {SWEEP_BATCH_SIZE}).",
+        )
+
+    def handle(self, *args, **options):
+        now = timezone.now() - datetime.timedelta(seconds=options["grace"])
+        count = sweep_expired_sandboxes(now=now, batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Swept {count} expired guest sandboxes."))
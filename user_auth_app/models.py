@@ -0,0 +1,27 @@
+"""
+Models for guest sandboxes: per-guest copies of the demo board that expire.
+"""
+
+import uuid
+from django.contrib.auth.models import User
+from django.db import models
+
+
+class GuestSandbox(models.Model):
+    """
+    A guest's private copy of the demo board. Tasks and contacts with this sandbox are only visible to its
+    guest user; the sandbox is deleted together with its guest user after it expires.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="guest_sandbox")
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        """Return the guest's username and expiry as string representation."""
+        return f"{self.user.username} (expires {self.expires_at:%Y-%m-%d %H:%M})"
+
+    class Meta:
+        verbose_name = "Guest sandbox"
+        verbose_name_plural = "Guest sandboxes"
@@ -0,0 +1,196 @@
+"""
+Guest sandboxes: every guest login gets its own user and a private copy of the demo board, cloned with a
+handful of bulk inserts. Sandboxes expire after GUEST_SANDBOX_TTL seconds and are bulk-deleted by a
+throttled background sweep or the sweep_guest_sandboxes command.
+"""
+
+import datetime
+import logging
+import threading
+import time
+import uuid
+from contextlib import nullcontext
+from functools import lru_cache
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from contacts_app.models import Contact
+from contacts_app.utils import generate_svg_circle_with_initials, get_initials_from_name
+from tasks_app.models import Task, Subtask, TaskChange
+from user_auth_app.demo_board import DEMO_CONTACTS, DEMO_TASKS
+from user_auth_app.models import GuestSandbox
+
+DEFAULT_GUEST_SANDBOX_TTL = 4 * 60 * 60
+DEFAULT_GUEST_SANDBOX_SWEEP_INTERVAL = 5 * 60
+SWEEP_BATCH_SIZE = 100
+
+logger = logging.getLogger(__name__)
+
+_last_sweep = time.monotonic()
+_sweep_lock = threading.Lock()
+_sqlite_write_lock = threading.Lock()
+
+
+def get_guest_sandbox_ttl():
+    """
+    Return the lifetime of guest sandboxes in seconds; 0 disables them.
+    """
+    return getattr(settings, "GUEST_SANDBOX_TTL", DEFAULT_GUEST_SANDBOX_TTL)
+
+
+def get_user_sandbox_id(user):
+    """
+    Return the ID of the user's guest sandbox, or None for regular and anonymous users.
+    """
+    try:
+        return user.guest_sandbox.pk
+    except (AttributeError, ObjectDoesNotExist):
+        return None
+
+
+def get_request_sandbox_id(request):
+    """
+    Return the guest sandbox of the authenticated request, read from the signed access token or the user.
+    """
+    if isinstance(request.auth, dict):
+        sandbox_id = request.auth.get("sbx")
+        return uuid.UUID(sandbox_id) if sandbox_id else None
+    return get_user_sandbox_id(request.user)
+
+
+@lru_cache(maxsize=None)
+def _demo_contact_visuals():
+    """
+    Return the (initials, profile picture) of each demo contact, rendered once per process.
+    """
+    return [
+        (get_initials_from_name(contact["name"]), generate_svg_circle_with_initials(contact["name"]))
+        for contact in DEMO_CONTACTS
+    ]
+
+
+def _serialized_writes():
+    """
+    Return a lock around sandbox write transactions on SQLite, which allows one writer at a time and fails
+    concurrent writers of a shared in-memory database with "table is locked" instead of waiting.
+    Other databases write sandboxes in parallel.
+    """
+    return _sqlite_write_lock if connection.vendor == "sqlite" else nullcontext()
+
+
+def create_guest_sandbox():
+    """
+    Create a guest user with a token and a private copy of the demo board in one transaction.
+    Returns (user, token, contact_id, sandbox).
+    """
+    sandbox_id = uuid.uuid4()
+    with _serialized_writes(), transaction.atomic():
+        user = User.objects.create_user(
+            username=f"guest-{sandbox_id.hex}",
+            email=f"guest-{sandbox_id.hex}@user.de",
+            first_name="Guest",
+            last_name="User",
+        )
+        sandbox = GuestSandbox.objects.create(
+            id=sandbox_id, user=user, expires_at=timezone.now() + datetime.timedelta(seconds=get_guest_sandbox_ttl())
+        )
+        token = Token.objects.create(user=user)
+        contact = user.contact
+        contact.sandbox = sandbox
+        contact.save(update_fields=["sandbox"])
+        clone_demo_board(sandbox)
+    return user, token, contact.pk, sandbox
+
+
+def clone_demo_board(sandbox):
+    """
+    Copy the demo contacts, tasks, subtasks, and assignments into the sandbox with one bulk insert each.
+    """
+    contacts = [
+        Contact(
+            name=data["name"],
+            email=data["email"],
+            number=data["number"],
+            first_letters=initials,
+            profile_pic=profile_pic,
+            sandbox=sandbox,
+        )
+        for data, (initials, profile_pic) in zip(DEMO_CONTACTS, _demo_contact_visuals())
+    ]
+    today = timezone.localdate()
+    tasks, subtasks, links = [], [], []
+    through = Task.assigned_to.through
+    for data in DEMO_TASKS:
+        task = Task(
+            title=data["title"],
+            description=data["description"],
+            category=data["category"],
+            date=today - datetime.timedelta(days=data["days_ago"]),
+            prio=data["prio"],
+            status=data["status"],
+            sandbox=sandbox,
+        )
+        tasks.append(task)
+        subtasks.extend(Subtask(task=task, text=item["text"], status=item["status"]) for item in data["subtasks"])
+        links.extend(through(task_id=task.id, contact_id=contacts[index].id) for index in data["assigned"])
+    Contact.objects.bulk_create(contacts)
+    Task.objects.bulk_create(tasks)
+    Subtask.objects.bulk_create(subtasks)
+    through.objects.bulk_create(links)
+
+
+def sweep_expired_sandboxes(now=None, batch_size=SWEEP_BATCH_SIZE):
+    """
+    Delete expired sandboxes with their guest users, tokens, tasks, and contacts, batch_size sandboxes per
+    transaction, and return the number of deleted sandboxes.
+    """
+    now = now or timezone.now()
+    swept = 0
+    while True:
+        expired = GuestSandbox.objects.filter(expires_at__lte=now).order_by("expires_at")
+        sandbox_ids = list(expired.values_list("id", flat=True)[:batch_size])
+        if not sandbox_ids:
+            return swept
+        with _serialized_writes(), transaction.atomic():
+            Task.objects.filter(sandbox_id__in=sandbox_ids).delete()
+            TaskChange.objects.filter(sandbox_id__in=sandbox_ids).delete()
+            contacts = Contact.objects.filter(sandbox_id__in=sandbox_ids)
+            contacts.filter(user__isnull=False).update(user=None, is_user=False)
+            contacts.delete()
+            User.objects.filter(guest_sandbox__in=sandbox_ids).delete()
+        swept += len(sandbox_ids)
+
+
+def maybe_start_sandbox_sweep():
+    """
+    Sweep expired sandboxes in a background thread if the last sweep of this process is more than
+    GUEST_SANDBOX_SWEEP_INTERVAL seconds ago. Returns True if a sweep was started.
+    """
+    global _last_sweep
+    interval = getattr(settings, "GUEST_SANDBOX_SWEEP_INTERVAL", DEFAULT_GUEST_SANDBOX_SWEEP_INTERVAL)
+    if interval <= 0:
+        return False
+    with _sweep_lock:
+        now = time.monotonic()
+        if now - _last_sweep < interval:
+            return False
+        _last_sweep = now
+    threading.Thread(target=_sweep_in_background, name="guest-sandbox-sweep", daemon=True).start()
+    return True
+
+
+def _sweep_in_background():
+    """
+    Run a sweep on the thread's own database connection and close it afterwards.
+    """
+    try:
+        count = sweep_expired_sandboxes()
+        if count:
+            logger.info(f"Swept {count} expired guest sandboxes.")
+    except Exception as e:
+        logger.error(f"Error sweeping expired guest sandboxes: {e}", exc_info=True)
+    finally:
+        connection.close()
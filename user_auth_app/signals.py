@@ -1,14 +1,19 @@
 import logging
-from django.db.models.signals import post_save, pre_delete
+from django.db import IntegrityError, connection, transaction
+from django.db.models.signals import post_delete, post_save, pre_delete
 from django.dispatch import receiver
 from django.contrib.auth.models import User
+from rest_framework.authtoken.models import Token
 from contacts_app.models import Contact
 from contacts_app.utils import generate_svg_circle_with_initials, get_initials_from_name
+from user_auth_app.api.authentication import get_token_cache
+from user_auth_app.guest import forget_guest_identity, get_cached_guest_identity
 
 logger = logging.getLogger(__name__)
 
 """
-Signal handlers for synchronizing User and Contact models and updating contact attributes.
+Signal handlers for synchronizing User and Contact models, updating contact attributes, and invalidating the
+token authentication cache and the cached guest identity.
 """
 
 
@@ -55,7 +60,9 @@ def create_or_update_contact(sender, instance, created, **kwargs):
         name, letters, pic = _calculate_contact_attributes(instance)
         if created:
             contact, was_created = _get_or_create_contact(instance, name, letters, pic)
-            if not was_created:
+            if not was_created and contact.user_id not in (None, instance.pk):
+                logger.info(f"Contact {contact.pk} already belongs to another user; not linking {instance.username}.")
+            elif not was_created:
                 _update_contact_found_by_email(contact, instance, name, letters, pic)
         else:
             _update_contact_if_exists(instance, name, letters, pic)
@@ -66,18 +73,29 @@ def create_or_update_contact(sender, instance, created, **kwargs):
 def _get_or_create_contact(instance, name, letters, pic):
     """
     Get or create a Contact for a User, initializing with user data.
+    The insert is tried first and the unique email constraint of the shared contacts decides, so a new email
+    costs no lookup; contacts in guest sandboxes are never linked. Backends without expression indexes (MariaDB)
+    lack that constraint, so there the shared contact is looked up first.
     """
-    return Contact.objects.get_or_create(
-        email=instance.email,
-        defaults={
-            "name": name,
-            "number": "Please add your number",
-            "first_letters": letters,
-            "profile_pic": pic,
-            "is_user": True,
-            "user": instance,
-        },
-    )
+    if not connection.features.supports_expression_indexes:
+        contact = Contact.objects.filter(email=instance.email, sandbox__isnull=True).first()
+        if contact is not None:
+            return contact, False
+    try:
+        with transaction.atomic():
+            contact = Contact.objects.create(
+                email=instance.email,
+                name=name,
+                number="Please add your number",
+                first_letters=letters,
+                profile_pic=pic,
+                is_user=True,
+                user_id=instance.pk,
+            )
+        contact.user = instance  # caches user.contact, so callers reuse the new contact without a query
+        return contact, True
+    except IntegrityError:
+        return Contact.objects.get(email=instance.email, sandbox__isnull=True), False
 
 
 def _update_contact_if_exists(instance, name, letters, pic):
@@ -100,3 +118,47 @@ def delete_user_tag_in_contact(sender, instance, **kwargs):
             logger.info(f"No contact found for user {instance.username} during deletion.")
     except Exception as e:
         logger.error(f"Error in pre_delete signal for user {instance.username}: {e}")
+
+
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def invalidate_cached_token(sender, instance, **kwargs):
+    """
+    Drop a changed or deleted token from the authentication cache, again on commit so that a request
+    running before the commit cannot leave the old state cached.
+    """
+    cache = get_token_cache()
+    cache.invalidate_key(instance.key)
+    transaction.on_commit(lambda: cache.invalidate_key(instance.key))
+    _forget_guest_identity_of(instance.user_id)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user_tokens(sender, instance, **kwargs):
+    """
+    Drop the cached tokens of a changed or deleted user, e.g. after deactivation; again on commit.
+    """
+    cache = get_token_cache()
+    cache.invalidate_user(instance.pk)
+    transaction.on_commit(lambda: cache.invalidate_user(instance.pk))
+    _forget_guest_identity_of(instance.pk)
+
+
+@receiver(post_save, sender=Contact)
+@receiver(post_delete, sender=Contact)
+def forget_guest_identity_on_contact_change(sender, instance, **kwargs):
+    """
+    Drop the cached guest identity if the guest's contact changed or was deleted.
+    """
+    _forget_guest_identity_of(instance.user_id)
+
+
+def _forget_guest_identity_of(user_id):
+    """
+    Drop the cached guest identity if it belongs to the given user; again on commit.
+    """
+    identity = get_cached_guest_identity()
+    if identity is not None and identity[0].pk == user_id:
+        forget_guest_identity()
+        transaction.on_commit(forget_guest_identity)
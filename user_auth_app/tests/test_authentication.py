@@ -0,0 +1,131 @@
+from unittest import mock
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from contacts_app.models import Contact
+from user_auth_app.api.authentication import TokenUserCache, create_access_token, get_token_cache
+
+
+class CachedTokenAuthenticationTest(APITestCase):
+    def setUp(self):
+        get_token_cache().clear()
+        self.user = User.objects.create_user(username="testuser", email="testuser@example.com", password="Test@1234")
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        self.url = "/auth/status/"
+
+    def test_repeated_requests_skip_the_token_query(self):
+        with self.assertNumQueries(1):
+            self.client.get(self.url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response.data, {"username": "testuser", "authenticated": True})
+
+    def test_deleted_token_is_rejected(self):
+        self.client.get("/api/tasks/")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.token.delete()
+        response = self.client.get("/api/tasks/")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deactivated_user_is_rejected(self):
+        self.client.get("/api/tasks/")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+        response = self.client.get("/api/tasks/")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_user_changes_are_visible(self):
+        self.client.get(self.url)
+        self.user.username = "renamed"
+        self.user.save()
+        self.assertEqual(self.client.get(self.url).data["username"], "renamed")
+
+
+class TokenUserCacheTest(TestCase):
+    def setUp(self):
+        self.user = User(pk=1, username="one")
+
+    def test_entries_expire_after_ttl(self):
+        cache = TokenUserCache(max_size=10, ttl=60)
+        with mock.patch("user_auth_app.api.authentication.time.monotonic", return_value=100):
+            cache.set("key", self.user, "token")
+            self.assertEqual(cache.get("key"), (self.user, "token"))
+        with mock.patch("user_auth_app.api.authentication.time.monotonic", return_value=160):
+            self.assertIsNone(cache.get("key"))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = TokenUserCache(max_size=2, ttl=60)
+        cache.set("a", self.user, "a")
+        cache.set("b", self.user, "b")
+        cache.get("a")
+        cache.set("c", self.user, "c")
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+
+    def test_invalidate_user_drops_all_tokens_of_the_user(self):
+        cache = TokenUserCache(max_size=10, ttl=60)
+        cache.set("a", self.user, "a")
+        cache.set("b", User(pk=2, username="two"), "b")
+        cache.invalidate_user(1)
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("b"))
+
+    def test_zero_ttl_disables_the_cache(self):
+        cache = TokenUserCache(max_size=10, ttl=0)
+        cache.set("a", self.user, "a")
+        self.assertIsNone(cache.get("a"))
+
+
+class SignedAccessTokenTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", email="testuser@example.com", password="Test@1234")
+        self.token = Token.objects.create(user=self.user)
+        self.contact = Contact.objects.get(user=self.user)
+
+    def test_login_returns_access_token_that_authenticates_without_queries(self):
+        response = self.client.post("/auth/login/", {"username": "testuser", "password": "Test@1234"}, format="json")
+        self.assertEqual(response.data["access_expires_in"], 300)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + response.data["access"])
+        with self.assertNumQueries(0):
+            response = self.client.get("/auth/status/")
+        self.assertEqual(response.data, {"username": "testuser", "authenticated": True})
+        self.assertEqual(self.client.get("/api/tasks/").status_code, status.HTTP_200_OK)
+
+    def test_expired_access_token_is_rejected(self):
+        with mock.patch("user_auth_app.api.authentication.time.time", return_value=1000):
+            access = create_access_token(self.user, self.contact.id)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + access)
+        response = self.client.get("/api/tasks/")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(str(response.data["detail"]), "Access token expired.")
+
+    def test_tampered_access_token_is_rejected(self):
+        access = create_access_token(self.user, self.contact.id)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + access[:-2] + "xx")
+        self.assertEqual(self.client.get("/api/tasks/").status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_refresh_requires_a_valid_db_token(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        response = self.client.post("/auth/token/refresh/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + response.data["access"])
+        self.assertEqual(self.client.get("/auth/status/").data["username"], "testuser")
+
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + response.data["access"])
+        self.assertEqual(self.client.post("/auth/token/refresh/").status_code, status.HTTP_401_UNAUTHORIZED)
+        key = self.token.key
+        with self.captureOnCommitCallbacks(execute=True):
+            self.token.delete()
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + key)
+        self.assertEqual(self.client.post("/auth/token/refresh/").status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(ACCESS_TOKEN_TTL=0)
+    def test_access_tokens_can_be_disabled(self):
+        response = self.client.post("/auth/login/", {"username": "testuser", "password": "Test@1234"}, format="json")
+        self.assertNotIn("access", response.data)
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        self.assertEqual(self.client.post("/auth/token/refresh/").status_code, status.HTTP_404_NOT_FOUND)
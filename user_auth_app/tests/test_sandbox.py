@@ -0,0 +1,278 @@
+import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient, APITestCase
+from backend_join.realtime import events_for_sandbox
+from contacts_app.models import Contact
+from tasks_app.models import Task, Subtask, TaskChange, TaskSummaryCounter
+from user_auth_app.api.authentication import get_token_cache, read_access_token
+from user_auth_app.guest import forget_guest_identity
+from user_auth_app.demo_board import DEMO_CONTACTS, DEMO_TASKS
+from user_auth_app.models import GuestSandbox
+from user_auth_app.sandbox import create_guest_sandbox, sweep_expired_sandboxes
+
+GUEST_URL = "/auth/guest/"
+TASKS_URL = "/api/tasks/"
+CONTACTS_URL = "/api/contacts/"
+
+
+def task_payload(**overrides):
+    return {"title": "Sandbox task", "category": "User Story", "date": "2030-01-01", "prio": "urgent", **overrides}
+
+
+@override_settings(GUEST_SANDBOX_TTL=3600, GUEST_SANDBOX_SWEEP_INTERVAL=0, GUEST_LOGIN_RATE=None)
+class GuestSandboxLoginTest(APITestCase):
+    def setUp(self):
+        get_token_cache().clear()
+        forget_guest_identity()
+        self.addCleanup(forget_guest_identity)
+
+    def login(self):
+        response = self.client.post(GUEST_URL, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        client = self.client_class()
+        client.credentials(HTTP_AUTHORIZATION="Token " + response.data["token"])
+        return client, response.data
+
+    @override_settings(GUEST_LOGIN_RATE="2/hour")
+    def test_guest_logins_are_rate_limited_per_client(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.login()
+        self.login()
+        response = self.client.post(GUEST_URL, format="json")
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(GuestSandbox.objects.count(), 2)
+        response = self.client.post(GUEST_URL, format="json", REMOTE_ADDR="10.0.0.2")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_guest_login_clones_the_demo_board(self):
+        _, data = self.login()
+        sandbox = GuestSandbox.objects.get(user__username=data["username"])
+        self.assertTrue(data["username"].startswith("guest-"))
+        self.assertEqual(Task.objects.filter(sandbox=sandbox).count(), len(DEMO_TASKS))
+        self.assertEqual(
+            Subtask.objects.filter(task__sandbox=sandbox).count(), sum(len(task["subtasks"]) for task in DEMO_TASKS)
+        )
+        self.assertEqual(
+            Task.assigned_to.through.objects.filter(task__sandbox=sandbox).count(),
+            sum(len(task["assigned"]) for task in DEMO_TASKS),
+        )
+        self.assertEqual(Contact.objects.filter(sandbox=sandbox, user__isnull=True).count(), len(DEMO_CONTACTS))
+        self.assertEqual(Contact.objects.get(pk=data["id"]).sandbox, sandbox)
+
+    def test_demo_board_is_cloned_with_bulk_inserts(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.login()
+        inserts = [query["sql"] for query in queries if query["sql"].startswith('INSERT INTO "tasks_app_task"')]
+        self.assertEqual(len(inserts), 1)
+        self.assertLessEqual(len(queries), 20)
+
+    def test_guests_only_see_their_own_sandbox(self):
+        shared = Task.objects.create(title="Shared", category="User Story", date=datetime.date.today())
+        first, _ = self.login()
+        second, _ = self.login()
+        created = first.post(TASKS_URL, task_payload(), format="json")
+        self.assertEqual(created.status_code, status.HTTP_201_CREATED)
+
+        first_ids = {task["id"] for task in first.get(TASKS_URL).data}
+        second_ids = {task["id"] for task in second.get(TASKS_URL).data}
+        self.assertIn(created.data["id"], first_ids)
+        self.assertNotIn(created.data["id"], second_ids)
+        self.assertNotIn(str(shared.id), first_ids | second_ids)
+        self.assertEqual(len(second_ids), len(DEMO_TASKS))
+        self.assertEqual(second.get(f"{TASKS_URL}{created.data['id']}/").status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(second.delete(f"{TASKS_URL}{created.data['id']}/").status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_guests_only_see_and_assign_their_own_contacts(self):
+        shared = Contact.objects.create(name="Shared Contact", email="shared@example.com")
+        first, first_data = self.login()
+        second, _ = self.login()
+        first_contacts = {contact["id"] for contact in first.get(CONTACTS_URL).data}
+        second_contacts = {contact["id"] for contact in second.get(CONTACTS_URL).data}
+        self.assertEqual(len(first_contacts), len(DEMO_CONTACTS))
+        self.assertFalse(first_contacts & second_contacts)
+        self.assertNotIn(str(shared.id), first_contacts)
+        self.assertNotIn(str(first_data["id"]), first_contacts)
+
+        foreign = first.post(TASKS_URL, task_payload(assigned_to=[{"id": next(iter(second_contacts))}]), format="json")
+        self.assertEqual(foreign.status_code, status.HTTP_400_BAD_REQUEST)
+        own = first.post(TASKS_URL, task_payload(assigned_to=[{"id": next(iter(first_contacts))}]), format="json")
+        self.assertEqual(own.status_code, status.HTTP_201_CREATED)
+
+    def test_contacts_created_by_guests_stay_in_their_sandbox(self):
+        guest, data = self.login()
+        response = guest.post(CONTACTS_URL, {"name": "Sandbox Contact", "email": "sandbox@example.com"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        contact = Contact.objects.get(pk=response.data["id"])
+        self.assertEqual(contact.sandbox.user.username, data["username"])
+
+    def test_guests_can_reuse_emails_of_shared_and_other_sandbox_contacts(self):
+        Contact.objects.create(name="Shared Contact", email="shared@example.com")
+        first, _ = self.login()
+        second, _ = self.login()
+        payload = {"name": "Sandbox Contact", "email": "shared@example.com"}
+        self.assertEqual(first.post(CONTACTS_URL, payload, format="json").status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.post(CONTACTS_URL, payload, format="json").status_code, status.HTTP_201_CREATED)
+        duplicate = first.post(CONTACTS_URL, payload, format="json")
+        self.assertEqual(duplicate.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("email", duplicate.data)
+
+    def test_contact_import_only_reports_duplicates_within_the_sandbox(self):
+        Contact.objects.create(name="Shared Contact", email="shared@example.com")
+        guest, _ = self.login()
+        body = '{"name": "Shared Contact", "email": "shared@example.com"}\n'
+        response = guest.post(f"{CONTACTS_URL}import/", body, content_type="application/jsonl")
+        self.assertEqual((response.data["created"], response.data["duplicates"]), (1, 0))
+        response = guest.post(f"{CONTACTS_URL}import/", body, content_type="application/jsonl")
+        self.assertEqual((response.data["created"], response.data["duplicates"]), (0, 1))
+
+    def test_registering_with_an_email_used_in_a_sandbox_creates_a_shared_contact(self):
+        guest, _ = self.login()
+        guest.post(CONTACTS_URL, {"name": "Victim", "email": "victim@example.com"}, format="json")
+        payload = {"email": "victim@example.com", "name": "Victim User", "password": "Victim@123"}
+        response = self.client.post("/auth/register/", {**payload, "repeated_password": "Victim@123"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        contact = Contact.objects.get(pk=response.data["id"])
+        self.assertIsNone(contact.sandbox_id)
+        self.assertEqual(contact.user.email, "victim@example.com")
+
+        self.assertEqual(sweep_expired_sandboxes(now=timezone.now() + datetime.timedelta(hours=2)), 1)
+        login = self.client.post("/auth/login/", {"username": "victim@example.com", "password": "Victim@123"})
+        self.assertEqual(login.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(login.data["id"], contact.pk)
+
+    def test_sandbox_contact_changes_do_not_change_the_shared_task_list_etag(self):
+        user = User.objects.create_user(username="member", email="member@example.com", password="Member@123")
+        member = self.client_class()
+        member.credentials(HTTP_AUTHORIZATION="Token " + Token.objects.create(user=user).key)
+        Task.objects.create(title="Shared", category="User Story", date=datetime.date.today())
+        guest, _ = self.login()
+        shared_etag = member.get(TASKS_URL)["ETag"]
+        guest_etag = guest.get(TASKS_URL)["ETag"]
+
+        contact_id = guest.get(CONTACTS_URL).data[0]["id"]
+        guest.patch(f"{CONTACTS_URL}{contact_id}/", {"number": "+49 111"}, format="json")
+        self.assertEqual(
+            member.get(TASKS_URL, HTTP_IF_NONE_MATCH=shared_etag).status_code, status.HTTP_304_NOT_MODIFIED
+        )
+        self.assertEqual(guest.get(TASKS_URL, HTTP_IF_NONE_MATCH=guest_etag).status_code, status.HTTP_200_OK)
+
+    def test_sandbox_tasks_do_not_touch_the_shared_summary(self):
+        guest, _ = self.login()
+        guest.post(TASKS_URL, task_payload(), format="json")
+        self.assertFalse(TaskSummaryCounter.objects.exclude(count=0).exists())
+        summary = guest.get(f"{TASKS_URL}summary/").data
+        self.assertEqual(summary["total"], len(DEMO_TASKS) + 1)
+
+    def test_bulk_endpoint_creates_tasks_in_the_sandbox(self):
+        guest, data = self.login()
+        response = guest.post(f"{TASKS_URL}bulk/", [task_payload(title="Bulk")], format="json")
+        task = Task.objects.get(pk=response.data["results"][0]["id"])
+        self.assertEqual(task.sandbox.user.username, data["username"])
+
+    def test_search_and_changes_are_scoped(self):
+        first, _ = self.login()
+        second, _ = self.login()
+        cursor = first.get(f"{TASKS_URL}changes/").data["cursor"]
+        created = first.post(TASKS_URL, task_payload(title="Unicorn launch"), format="json").data
+        self.assertEqual(first.get(f"{TASKS_URL}search/", {"q": "unicorn"}).data["results"], [created["id"]])
+        self.assertEqual(second.get(f"{TASKS_URL}search/", {"q": "unicorn"}).data["results"], [])
+        self.assertEqual(
+            [task["id"] for task in first.get(f"{TASKS_URL}changes/", {"since": cursor}).data["tasks"]], [created["id"]]
+        )
+        self.assertEqual(second.get(f"{TASKS_URL}changes/", {"since": cursor}).data["tasks"], [])
+
+    def test_access_token_carries_the_sandbox(self):
+        _, data = self.login()
+        payload = read_access_token(data["access"])
+        sandbox = GuestSandbox.objects.get(user__username=data["username"])
+        self.assertEqual(payload["sbx"], str(sandbox.pk))
+        client = self.client_class()
+        client.credentials(HTTP_AUTHORIZATION="Bearer " + data["access"])
+        self.assertEqual(len(client.get(TASKS_URL).data), len(DEMO_TASKS))
+
+    @override_settings(GUEST_SANDBOX_TTL=0)
+    def test_sandboxes_can_be_disabled(self):
+        response = self.client.post(GUEST_URL, format="json")
+        self.assertEqual(response.data["username"], "guest")
+        self.assertFalse(GuestSandbox.objects.exists())
+
+
+@override_settings(GUEST_SANDBOX_TTL=3600, GUEST_SANDBOX_SWEEP_INTERVAL=0, GUEST_LOGIN_RATE=None)
+class GuestSandboxConcurrencyTest(TransactionTestCase):
+    def test_parallel_guest_logins_each_get_a_sandbox(self):
+        logins = 50
+        barrier = threading.Barrier(logins, timeout=30)
+
+        def login(_):
+            barrier.wait()
+            try:
+                return APIClient().post(GUEST_URL, format="json")
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=logins) as pool:
+            responses = list(pool.map(login, range(logins)))
+
+        self.assertEqual({response.status_code for response in responses}, {status.HTTP_201_CREATED})
+        self.assertEqual(len({response.data["username"] for response in responses}), logins)
+        self.assertEqual(GuestSandbox.objects.count(), logins)
+        self.assertEqual(Task.objects.count(), logins * len(DEMO_TASKS))
+
+
+@override_settings(GUEST_SANDBOX_TTL=3600)
+class SweepExpiredSandboxesTest(TestCase):
+    def test_sweep_deletes_expired_sandboxes_with_their_data(self):
+        expired_user, expired_token, _, expired = create_guest_sandbox()
+        kept_user, _, _, kept = create_guest_sandbox()
+        GuestSandbox.objects.filter(pk=expired.pk).update(expires_at=timezone.now() - datetime.timedelta(seconds=1))
+        shared = Task.objects.create(title="Shared", category="User Story", date=datetime.date.today())
+
+        self.assertEqual(sweep_expired_sandboxes(), 1)
+        self.assertFalse(User.objects.filter(pk=expired_user.pk).exists())
+        self.assertFalse(Token.objects.filter(pk=expired_token.pk).exists())
+        self.assertFalse(Task.objects.filter(sandbox_id=expired.pk).exists())
+        self.assertFalse(Contact.objects.filter(sandbox_id=expired.pk).exists())
+        self.assertFalse(TaskChange.objects.filter(sandbox_id=expired.pk).exists())
+        self.assertTrue(User.objects.filter(pk=kept_user.pk).exists())
+        self.assertEqual(Task.objects.filter(sandbox=kept).count(), len(DEMO_TASKS))
+        self.assertTrue(Task.objects.filter(pk=shared.pk).exists())
+
+    def test_sweep_works_in_batches(self):
+        for _ in range(3):
+            create_guest_sandbox()
+        later = timezone.now() + datetime.timedelta(hours=2)
+        self.assertEqual(sweep_expired_sandboxes(now=later, batch_size=2), 3)
+        self.assertFalse(GuestSandbox.objects.exists())
+        self.assertFalse(User.objects.filter(username__startswith="guest-").exists())
+
+    def test_management_command(self):
+        _, _, _, sandbox = create_guest_sandbox()
+        GuestSandbox.objects.filter(pk=sandbox.pk).update(expires_at=timezone.now() - datetime.timedelta(hours=1))
+        out = StringIO()
+        call_command("sweep_guest_sandboxes", "--grace", "60", stdout=out)
+        self.assertIn("Swept 1 expired guest sandboxes", out.getvalue())
+
+
+class SandboxEventScopeTest(TestCase):
+    def test_events_are_filtered_by_sandbox(self):
+        events = [
+            {"type": "task", "action": "changed", "id": "1"},
+            {"type": "task", "action": "changed", "id": "2", "sandbox": "abc"},
+            {"type": "resync"},
+            {"type": "resync", "sandbox": "def"},
+        ]
+        self.assertEqual(events_for_sandbox(events, None), [events[0], events[2]])
+        self.assertEqual(events_for_sandbox(events, "abc"), [events[1], events[2]])
+        self.assertEqual(events_for_sandbox(events, "def"), [events[2], events[3]])
@@ -1,8 +1,17 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.test import APIClient, APITestCase
 from rest_framework.authtoken.models import Token
 from django.contrib.auth.models import User
+from django.db import connection
+from django.db.backends.utils import CursorWrapper
+from django.test import TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from contacts_app.models import Contact
+from user_auth_app.guest import forget_guest_identity
 
 
 class UserAuthViewTest(APITestCase):
@@ -36,6 +45,72 @@ class UserAuthViewTest(APITestCase):
         self.assertEqual(response.data["username"], "newuser@example.com")
         self.assertEqual(response.data["email"], "newuser@example.com")
 
+    def test_user_registration_writes_user_contact_and_token_without_lookups(self):
+        data = {
+            "email": "fast@example.com",
+            "name": "Fast User",
+            "password": "Test@1234",
+            "repeated_password": "Test@1234",
+        }
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.register_url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        statements = [query["sql"].split()[0] for query in queries]
+        self.assertEqual(statements.count("INSERT"), 3)
+        self.assertNotIn("SELECT", statements)
+        self.assertEqual(len(statements), 7)
+        self.assertEqual(response.data["id"], Contact.objects.get(user__email="fast@example.com").id)
+
+    def test_user_registration_links_existing_contact(self):
+        contact = Contact.objects.create(name="Known Contact", email="known@example.com")
+        data = {
+            "email": "known@example.com",
+            "name": "Known User",
+            "password": "Test@1234",
+            "repeated_password": "Test@1234",
+        }
+        response = self.client.post(self.register_url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["id"], contact.id)
+        contact.refresh_from_db()
+        self.assertEqual(contact.user.username, "known@example.com")
+
+    def test_user_registration_links_existing_contact_without_email_constraint(self):
+        contact = Contact.objects.create(name="Known Contact", email="known@example.com")
+        editor = connection.schema_editor()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                editor.sql_delete_index
+                % {
+                    "name": editor.quote_name("contact_scope_email_uniq"),
+                    "table": editor.quote_name("contacts_app_contact"),
+                }
+            )
+        data = {
+            "email": "known@example.com",
+            "name": "Known User",
+            "password": "Test@1234",
+            "repeated_password": "Test@1234",
+        }
+        with mock.patch.object(connection.features, "supports_expression_indexes", False):
+            response = self.client.post(self.register_url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["id"], contact.id)
+        self.assertEqual(Contact.objects.filter(email="known@example.com").count(), 1)
+
+    def test_user_registration_rejects_email_of_user_with_other_username(self):
+        data = {
+            "email": "testuser@example.com",
+            "name": "Other",
+            "password": "Test@1234",
+            "repeated_password": "Test@1234",
+        }
+        response = self.client.post(self.register_url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("Email already exists.", str(response.data))
+        self.assertFalse(User.objects.filter(username="testuser@example.com").exists())
+        self.assertEqual(Contact.objects.get(email="testuser@example.com").user, self.user)
+
     def test_user_registration_password_mismatch(self):
         data = {
             "email": "newuser@example.com",
@@ -60,8 +135,11 @@ class UserAuthViewTest(APITestCase):
         self.assertIn("Email already exists.", str(response.data))
 
 
+@override_settings(GUEST_SANDBOX_TTL=0)
 class GuestUserViewTest(APITestCase):
     def setUp(self):
+        forget_guest_identity()
+        self.addCleanup(forget_guest_identity)
         self.guest_url = "/auth/guest/"
 
     def test_guest_user_creation(self):
@@ -83,6 +161,70 @@ class GuestUserViewTest(APITestCase):
         self.assertEqual(User.objects.filter(username="guest").count(), 1)
         self.assertEqual(Contact.objects.filter(user__username="guest").count(), 1)
 
+    def test_cached_guest_login_runs_no_queries(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            first = self.client.post(self.guest_url, format="json")
+        with self.assertNumQueries(0):
+            second = self.client.post(self.guest_url, format="json")
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.data["token"], first.data["token"])
+        self.assertEqual(second.data["id"], Contact.objects.get(user__username="guest").id)
+
+    def test_deleted_guest_token_is_not_served_from_cache(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            first = self.client.post(self.guest_url, format="json")
+        Token.objects.filter(key=first.data["token"]).delete()
+        second = self.client.post(self.guest_url, format="json")
+        self.assertNotEqual(second.data["token"], first.data["token"])
+        self.assertTrue(Token.objects.filter(key=second.data["token"]).exists())
+
+    @override_settings(GUEST_IDENTITY_CACHE_TTL=60)
+    def test_cached_guest_identity_expires(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            first = self.client.post(self.guest_url, format="json")
+        tokens = Token.objects.filter(key=first.data["token"])
+        tokens._raw_delete(tokens.db)  # as another process would, without this process's signals
+        self.assertEqual(self.client.post(self.guest_url, format="json").data["token"], first.data["token"])
+
+        later = time.monotonic() + 61
+        with mock.patch("user_auth_app.guest.time.monotonic", return_value=later):
+            with self.captureOnCommitCallbacks(execute=True):
+                second = self.client.post(self.guest_url, format="json")
+            self.assertNotEqual(second.data["token"], first.data["token"])
+            self.assertTrue(Token.objects.filter(key=second.data["token"]).exists())
+            with self.assertNumQueries(0):
+                self.assertEqual(self.client.post(self.guest_url, format="json").data["token"], second.data["token"])
+
+
+@override_settings(GUEST_SANDBOX_TTL=0)
+class GuestLoginConcurrencyTest(TransactionTestCase):
+    def setUp(self):
+        forget_guest_identity()
+        self.addCleanup(forget_guest_identity)
+
+    def test_parallel_guest_logins_do_not_block_each_other(self):
+        token = APIClient().post("/auth/guest/", format="json").data["token"]
+        logins = 200
+        barrier = threading.Barrier(logins, timeout=30)
+        queries = []
+        execute = CursorWrapper.execute
+
+        def counting_execute(cursor, sql, params=None):
+            queries.append(sql)
+            return execute(cursor, sql, params)
+
+        def login(_):
+            barrier.wait()
+            return APIClient().post("/auth/guest/", format="json")
+
+        with mock.patch.object(CursorWrapper, "execute", counting_execute):
+            with ThreadPoolExecutor(max_workers=logins) as pool:
+                responses = list(pool.map(login, range(logins)))
+
+        self.assertEqual({response.status_code for response in responses}, {status.HTTP_200_OK})
+        self.assertEqual({response.data["token"] for response in responses}, {token})
+        self.assertEqual(queries, [])
+
 
 class CheckAuthStatusViewTest(APITestCase):
     def setUp(self):